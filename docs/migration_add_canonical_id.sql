@@ -0,0 +1,16 @@
+-- Migration: Link duplicate listings of the same event
+-- Run this in Supabase SQL Editor
+
+-- Set by `python -m devcompass dedup` on every duplicate listing; points at
+-- the row the feed shows for the event (NULL on that row itself)
+ALTER TABLE hackathons
+ADD COLUMN IF NOT EXISTS canonical_id UUID REFERENCES hackathons(id) ON DELETE SET NULL;
+
+-- Serves "other listings of this event" lookups
+CREATE INDEX IF NOT EXISTS idx_hackathons_canonical
+ON hackathons(canonical_id) WHERE canonical_id IS NOT NULL;
+
+-- Verify the column was added
+SELECT column_name, data_type
+FROM information_schema.columns
+WHERE table_name = 'hackathons' AND column_name = 'canonical_id';
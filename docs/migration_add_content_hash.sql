@@ -0,0 +1,15 @@
+-- Migration: Add content fingerprints for diff-based scraper sync
+-- Run this in Supabase SQL Editor
+
+-- Fingerprint of the scraped content; scrapers compare it to skip unchanged rows
+ALTER TABLE hackathons
+ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+-- Serves the per-platform (original_url, content_hash) read, ordered by original_url
+CREATE INDEX IF NOT EXISTS idx_hackathons_platform_url
+ON hackathons(platform_source, original_url);
+
+-- Verify the column was added
+SELECT column_name, data_type
+FROM information_schema.columns
+WHERE table_name = 'hackathons' AND column_name = 'content_hash';
@@ -0,0 +1,17 @@
+-- Migration: Add numeric prize columns for sortable prize queries
+-- Run this in Supabase SQL Editor
+
+-- Prize amount converted to USD with the scrapers' local rate table, and the
+-- ISO code of the currency it was listed in
+ALTER TABLE hackathons
+ADD COLUMN IF NOT EXISTS prize_amount_usd NUMERIC,
+ADD COLUMN IF NOT EXISTS prize_currency TEXT;
+
+-- Serves prize sorting and min/max prize filters as a range scan
+CREATE INDEX IF NOT EXISTS idx_hackathons_prize
+ON hackathons(prize_amount_usd) WHERE prize_amount_usd IS NOT NULL;
+
+-- Verify the columns were added
+SELECT column_name, data_type
+FROM information_schema.columns
+WHERE table_name = 'hackathons' AND column_name IN ('prize_amount_usd', 'prize_currency');
@@ -0,0 +1,16 @@
+-- Migration: Add canonical theme IDs for theme filters
+-- Run this in Supabase SQL Editor
+
+-- IDs from the scrapers' theme taxonomy (scrapers/devcompass/themes.py),
+-- matched from each hackathon's raw themes, title and description
+ALTER TABLE hackathons
+ADD COLUMN IF NOT EXISTS theme_ids TEXT[];
+
+-- Serves theme filters (theme_ids && ARRAY[...]) from one canonical key per theme
+CREATE INDEX IF NOT EXISTS idx_hackathons_theme_ids
+ON hackathons USING GIN(theme_ids);
+
+-- Verify the column was added
+SELECT column_name, data_type
+FROM information_schema.columns
+WHERE table_name = 'hackathons' AND column_name = 'theme_ids';
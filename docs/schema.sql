@@ -9,14 +9,19 @@ CREATE TABLE hackathons (
   short_summary TEXT,
   banner_url TEXT,
   prize_money TEXT,
+  prize_amount_usd NUMERIC, -- Parsed prize converted to USD, for sorting and range filters
+  prize_currency TEXT, -- ISO code of the currency the prize was listed in
   start_date TIMESTAMPTZ,
   end_date TIMESTAMPTZ,
   registration_deadline TIMESTAMPTZ,
   themes TEXT[], -- Array of tags like ['AI/ML', 'Web3']
-  platform_source TEXT NOT NULL CHECK (platform_source IN ('unstop', 'devpost', 'devfolio', 'hackclub')),
+  theme_ids TEXT[], -- Canonical theme IDs like ['ai', 'blockchain'], used by theme filters
+  platform_source TEXT NOT NULL CHECK (platform_source IN ('unstop', 'devpost', 'devfolio', 'hackclub', 'hackerearth')),
   original_url TEXT NOT NULL UNIQUE,
   eligibility TEXT,
   location_mode TEXT CHECK (location_mode IN ('online', 'offline', 'hybrid')),
+  content_hash TEXT, -- Fingerprint of the scraped content, used to skip unchanged rows
+  canonical_id UUID REFERENCES hackathons(id) ON DELETE SET NULL, -- Set on duplicate listings; points at the row shown for the event
   created_at TIMESTAMPTZ DEFAULT NOW(),
   updated_at TIMESTAMPTZ DEFAULT NOW()
 );
@@ -44,8 +49,12 @@ CREATE TABLE saved_hackathons (
 -- Performance indexes
 CREATE INDEX idx_hackathons_deadline ON hackathons(registration_deadline);
 CREATE INDEX idx_hackathons_platform ON hackathons(platform_source);
+CREATE INDEX idx_hackathons_platform_url ON hackathons(platform_source, original_url);
 CREATE INDEX idx_hackathons_themes ON hackathons USING GIN(themes);
+CREATE INDEX idx_hackathons_theme_ids ON hackathons USING GIN(theme_ids);
+CREATE INDEX idx_hackathons_prize ON hackathons(prize_amount_usd) WHERE prize_amount_usd IS NOT NULL;
 CREATE INDEX idx_hackathons_created ON hackathons(created_at DESC);
+CREATE INDEX idx_hackathons_canonical ON hackathons(canonical_id) WHERE canonical_id IS NOT NULL;
 CREATE INDEX idx_saved_hackathons_user ON saved_hackathons(user_id);
 
 -- Row Level Security Policies
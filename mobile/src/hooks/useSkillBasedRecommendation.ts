@@ -7,10 +7,28 @@ interface RecommendationScore {
   matchedSkills: string[];
 }
 
+/**
+ * Stack keys for the canonical theme IDs the scrapers store in theme_ids
+ */
+const THEME_ID_STACKS: { [themeId: string]: string[] } = {
+  ai: ['ai', 'ml'],
+  blockchain: ['blockchain'],
+  web: ['web', 'frontend'],
+  mobile: ['mobile', 'ios', 'android'],
+  gaming: ['game'],
+  healthtech: ['health'],
+  'data-science': ['data'],
+  cybersecurity: ['cyber'],
+  iot: ['iot'],
+  cloud: ['cloud'],
+  fintech: ['fintech'],
+  sustainability: ['sustainability'],
+};
+
 /**
  * Maps hackathon types/themes to their typical tech stacks
  */
-const getHackathonTechStack = (hackathonTitle: string, themes: string[] = []): string[] => {
+const getHackathonTechStack = (hackathonTitle: string, themes: string[] = [], themeIds?: string[] | null): string[] => {
   const title = hackathonTitle.toLowerCase();
   const themesLower = themes.map(t => t.toLowerCase());
 
@@ -35,6 +53,16 @@ const getHackathonTechStack = (hackathonTitle: string, themes: string[] = []): s
 
   let techStack: Set<string> = new Set();
 
+  // Rows with canonical theme IDs were already matched against title, tags and description
+  if (themeIds && themeIds.length > 0) {
+    themeIds.forEach(themeId => {
+      (THEME_ID_STACKS[themeId] || []).forEach(key => stacks[key].forEach(t => techStack.add(t)));
+    });
+    if (techStack.size > 0) {
+      return Array.from(techStack);
+    }
+  }
+
   // Check title
   for (const [key, techs] of Object.entries(stacks)) {
     if (title.includes(key)) {
@@ -71,7 +99,7 @@ export const calculateSkillMatch = (userSkills: string[] = [], hackathon: Hackat
     };
   }
 
-  const hackathonTechs = getHackathonTechStack(hackathon.title, hackathon.themes);
+  const hackathonTechs = getHackathonTechStack(hackathon.title, hackathon.themes, hackathon.theme_ids);
   const userSkillsLower = userSkills.map(s => s.toLowerCase());
 
   const matchedSkills = hackathonTechs.filter(tech =>
@@ -56,9 +56,20 @@ export const FeedScreen: React.FC = () => {
   // Get skill-based recommendations
   const { recommendations } = useSkillBasedRecommendation(profile?.skills || [], hackathons);
 
-  const THEMES = ["AI", "Blockchain", "Web", "Mobile", "Data Science", "Cybersecurity", "IoT", "Cloud", "Fintech", "Healthtech"];
+  const THEMES = [
+    { id: 'ai', label: 'AI' },
+    { id: 'blockchain', label: 'Blockchain' },
+    { id: 'web', label: 'Web' },
+    { id: 'mobile', label: 'Mobile' },
+    { id: 'data-science', label: 'Data Science' },
+    { id: 'cybersecurity', label: 'Cybersecurity' },
+    { id: 'iot', label: 'IoT' },
+    { id: 'cloud', label: 'Cloud' },
+    { id: 'fintech', label: 'Fintech' },
+    { id: 'healthtech', label: 'Healthtech' },
+  ];
   const LOCATIONS = ["online", "offline", "hybrid"];
-  const PLATFORMS = ["unstop", "devpost", "devfolio", "hackclub"];
+  const PLATFORMS = ["unstop", "devpost", "devfolio", "hackclub", "hackerearth"];
 
   const toggleFilter = useCallback((type: 'themes' | 'locationMode' | 'platforms', value: string) => {
     const currentFilters = filters[type] || [];
@@ -374,17 +385,17 @@ export const FeedScreen: React.FC = () => {
             <View style={styles.filterOptions}>
               {THEMES.map(themeItem => (
                 <TouchableOpacity
-                  key={themeItem}
+                  key={themeItem.id}
                   style={[
                     styles.filterChip,
-                    filters.themes?.includes(themeItem) && styles.activeFilterChip
+                    filters.themes?.includes(themeItem.id) && styles.activeFilterChip
                   ]}
-                  onPress={() => toggleFilter('themes', themeItem)}
+                  onPress={() => toggleFilter('themes', themeItem.id)}
                 >
                   <Text style={[
                     styles.filterChipText,
-                    filters.themes?.includes(themeItem) && styles.activeFilterChipText
-                  ]}>{themeItem}</Text>
+                    filters.themes?.includes(themeItem.id) && styles.activeFilterChipText
+                  ]}>{themeItem.label}</Text>
                 </TouchableOpacity>
               ))}
             </View>
@@ -11,10 +11,13 @@ export const hackathonService = {
     let query = supabase
       .from('hackathons')
       .select('*', { count: 'exact' })
+      // Duplicate listings point at the row shown for their event
+      .is('canonical_id', null)
       .range(page * limit, (page + 1) * limit - 1);
 
     if (filters?.themes?.length) {
-      query = query.overlaps('themes', filters.themes);
+      // Canonical IDs from the scrapers' theme taxonomy, served by the theme_ids GIN index
+      query = query.overlaps('theme_ids', filters.themes);
     }
     
     if (filters?.platforms?.length) {
@@ -25,6 +28,14 @@ export const hackathonService = {
       query = query.in('location_mode', filters.locationMode);
     }
 
+    if (filters?.prizeRange?.min != null) {
+      query = query.gte('prize_amount_usd', filters.prizeRange.min);
+    }
+
+    if (filters?.prizeRange?.max != null) {
+      query = query.lte('prize_amount_usd', filters.prizeRange.max);
+    }
+
     const { data, error, count } = await query;
     
     if (error) throw error;
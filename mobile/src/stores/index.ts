@@ -133,6 +133,28 @@ const defaultFilters: FeedFilters = {
   platforms: [],
 };
 
+/**
+ * Theme chip labels saved before filters switched to canonical theme IDs
+ */
+const LEGACY_THEME_IDS: { [label: string]: string } = {
+  'AI': 'ai',
+  'Blockchain': 'blockchain',
+  'Web': 'web',
+  'Mobile': 'mobile',
+  'Data Science': 'data-science',
+  'Cybersecurity': 'cybersecurity',
+  'IoT': 'iot',
+  'Cloud': 'cloud',
+  'Fintech': 'fintech',
+  'Healthtech': 'healthtech',
+};
+
+const normalizeFilters = (filters: FeedFilters): FeedFilters => {
+  if (!filters.themes?.length) return filters;
+  const themes = Array.from(new Set(filters.themes.map(theme => LEGACY_THEME_IDS[theme] || theme)));
+  return { ...filters, themes };
+};
+
 export const useFeedStore = create<FeedStore>((set, get) => ({
   hackathons: [],
   loading: false,
@@ -144,7 +166,8 @@ export const useFeedStore = create<FeedStore>((set, get) => ({
 
   loadHackathons: async (refresh = false) => {
     try {
-      const { hackathons: currentHackathons, filters, page } = get();
+      const { hackathons: currentHackathons, page } = get();
+      const filters = normalizeFilters(get().filters);
       
       if (refresh) {
         set({ loading: true, error: null, page: 0 });
@@ -164,6 +187,7 @@ export const useFeedStore = create<FeedStore>((set, get) => ({
 
       set({
         hackathons: refresh ? shuffledHackathons : [...currentHackathons, ...shuffledHackathons],
+        filters,
         hasMore: response.hasMore,
         page: refresh ? 1 : page + 1,
         loading: false,
@@ -182,7 +206,7 @@ export const useFeedStore = create<FeedStore>((set, get) => ({
 
   setFilters: (newFilters: Partial<FeedFilters>) => {
     const { filters } = get();
-    const updatedFilters = { ...filters, ...newFilters };
+    const updatedFilters = normalizeFilters({ ...filters, ...newFilters });
     set({ filters: updatedFilters, hackathons: [], page: 0, hasMore: true });
     get().loadHackathons(true);
   },
@@ -7,14 +7,18 @@ export interface Hackathon {
   short_summary: string;
   banner_url?: string;
   prize_money?: string;
+  prize_amount_usd?: number | null;
+  prize_currency?: string | null;
   start_date?: string;
   end_date?: string;
   registration_deadline?: string;
   themes: string[];
-  platform_source: 'unstop' | 'devpost' | 'devfolio' | 'hackclub';
+  theme_ids?: string[] | null;
+  platform_source: 'unstop' | 'devpost' | 'devfolio' | 'hackclub' | 'hackerearth';
   original_url: string;
   eligibility?: string;
   location_mode?: 'online' | 'offline' | 'hybrid';
+  canonical_id?: string | null;
   created_at: string;
   updated_at: string;
 }
@@ -173,7 +177,7 @@ export interface PaginatedResponse<T> {
 // Filter types
 export interface FeedFilters {
   themes?: string[];
-  platforms?: ('unstop' | 'devpost' | 'devfolio' | 'hackclub')[];
+  platforms?: ('unstop' | 'devpost' | 'devfolio' | 'hackclub' | 'hackerearth')[];
   locationMode?: ('online' | 'offline' | 'hybrid')[];
   prizeRange?: {
     min?: number;
@@ -8,6 +8,7 @@ import requests
 import json
 import os
 from dotenv import load_dotenv
+from devcompass.validate import drop_invalid
 
 load_dotenv()
 
@@ -127,7 +128,7 @@ def save_to_supabase(hackathons):
     
     saved_count = 0
     
-    for hackathon in hackathons:
+    for hackathon in drop_invalid(hackathons):
         try:
             # Insert hackathon (will skip if URL already exists due to unique constraint)
             response = requests.post(
@@ -3,28 +3,14 @@
 Cleanup Expired Data - Remove expired hackathons from database
 """
 
-import os
 from datetime import datetime
-from supabase import create_client, Client
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# Supabase configuration
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_KEY')
-
-if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
-    raise ValueError("Missing Supabase configuration in .env file")
-
-# Initialize Supabase client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+from devcompass.clients import get_supabase
 
 def cleanup_expired_hackathons():
     """Remove expired hackathons from database"""
     try:
         print("Cleaning up expired hackathons...")
+        supabase = get_supabase()
         
         # Get current date
         current_date = datetime.now().isoformat()
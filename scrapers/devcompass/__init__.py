@@ -0,0 +1,10 @@
+"""
+DevCompass scraper toolkit
+
+Shared building blocks for the hackathon scrapers (HTTP pool, pagination,
+Supabase writer, diff sync), the source adapters and the ``devcompass`` CLI.
+Nothing here touches the network or creates clients at import time.
+
+Usage (from the scrapers directory):
+    python -m devcompass --help
+"""
@@ -0,0 +1,3 @@
+from devcompass.cli import main
+
+main()
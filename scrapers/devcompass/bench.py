@@ -0,0 +1,385 @@
+"""
+Offline Benchmarks - parse and end-to-end throughput against replayed payloads
+
+Parsing is timed directly on the raw items stored in a FixtureStore
+(records/second per parser). The end-to-end run replays the same payloads
+through the real source adapters and orchestrator, writing into FakeSupabase
+(rows/second), once against an empty table and once against the rows it just
+wrote, which exercises the diff sync's unchanged path. The write benchmark
+pushes the same rows through SupabaseWriter at several chunk sizes and reports
+rows/second alongside FakeSupabase's per-request latencies. The memory
+benchmark compares the bytes a backfill retains per row as dicts and as
+HackathonRecords.
+
+Without recordings the harness builds a synthetic fixture set shaped like the
+live APIs, so the numbers are always comparable run to run.
+"""
+
+import json
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from devcompass.fake_supabase import FAKE_SUPABASE_URL, FakeSupabase
+from devcompass.fixtures import FixtureStore, replay_from
+
+# Sources whose payloads are plain HTTP and can be replayed end to end
+BENCH_SOURCES = ('unstop', 'devpost', 'hackclub')
+
+UNSTOP_HOST = 'unstop.com'
+DEVPOST_HOST = 'devpost.com'
+HACKCLUB_HOST = 'hackathons.hackclub.com'
+
+THEMES = ['AI/ML', 'Web3', 'Healthcare', 'Fintech', 'Open Innovation', 'Sustainability', 'EdTech']
+CITIES = [('Bengaluru', 'KA', 'IN'), ('Boston', 'MA', 'US'), ('Berlin', '', 'DE'), ('', '', '')]
+
+
+# The prize and image shapes Unstop items have been seen with
+UNSTOP_PRIZE_SHAPES = [
+    lambda i: {'prizes': [{'rank': '1st', 'cash': 50000 + i, 'currency': 'fa-rupee'}]},
+    lambda i: {'prizes': [{'rank': 'Winner', 'cash': 0, 'currency': 'fa-dollar'}]},
+    lambda i: {'prizes': json.dumps([{'cash': 1000 + i, 'currency': 'usd'}])},
+    lambda i: {'prizes': "{'title': 'Goodies + internships'}"},
+    lambda i: {'prize_money': f'INR {i}00'},
+    lambda i: {},
+]
+UNSTOP_IMAGE_SHAPES = [
+    lambda i: {'public_url': f'/hackathons/synthetic-hackathon-{i}-{900000 + i}'},
+    lambda i: {'banner_image': {'src': f'//d8it4huxumps7.cloudfront.net/uploads/images/{i}.png'}},
+    lambda i: {'logo': f'https://d8it4huxumps7.cloudfront.net/uploads/images/{i}-logo.png'},
+    lambda i: {'banner_mobile': None},
+]
+
+
+def synthetic_unstop_item(i: int) -> Dict:
+    item = {
+        'id': 900000 + i,
+        'title': f'Synthetic Hackathon {i} – Build for Bharat',
+        'details': '<p>Build <b>real</b> products &amp; ship them — fast.</p>' * (1 + i % 12),
+        'start_date': '2026-03-01T09:00:00+05:30',
+        'end_date': '2026-03-05T18:00:00+05:30',
+        'regnRequiredTill': '2026-02-25T23:59:00+05:30',
+        'tags': [{'name': THEMES[(i + k) % len(THEMES)]} for k in range(3)],
+        'mode': ('online', 'offline', 'Hybrid mode')[i % 3],
+        'eligibility': 'Students and professionals',
+        'url': f'/hackathons/synthetic-hackathon-{i}-{900000 + i}',
+    }
+    item.update(UNSTOP_PRIZE_SHAPES[i % len(UNSTOP_PRIZE_SHAPES)](i))
+    item.update(UNSTOP_IMAGE_SHAPES[i % len(UNSTOP_IMAGE_SHAPES)](i))
+    return item
+
+
+def synthetic_devpost_item(i: int) -> Dict:
+    return {
+        'id': 200000 + i,
+        'title': f'Synthetic Devpost Hackathon {i}',
+        'url': f'https://synthetic-{i}.devpost.com/',
+        'thumbnail_url': f'//d112y698adiu2z.cloudfront.net/photos/{i}/thumb.png',
+        'submission_period_dates': 'Mar 01 - 05, 2026',
+        'prize_amount': f'$<span data-currency-value>{10000 + i:,}</span>',
+        'displayed_location': {'icon': 'globe', 'location': 'Online' if i % 2 else 'Boston, MA'},
+        'themes': [{'id': k, 'name': THEMES[(i + k) % len(THEMES)]} for k in range(3)],
+        'open_state': 'open',
+        'registrations_count': i * 7,
+    }
+
+
+def synthetic_hackclub_item(i: int) -> Dict:
+    city, state, country = CITIES[i % len(CITIES)]
+    return {
+        'id': f'rec{i:014d}',
+        'name': f'Synthetic Hack Club Event {i}',
+        'website': f'https://synthetic-{i}.hackclub.com',
+        'start': '2026-03-28T08:00:00.000Z',
+        'end': '2026-03-29T18:00:00.000Z',
+        'city': city,
+        'state': state,
+        'country_code': country,
+        'virtual': not city,
+        'hybrid': False,
+        'logo': f'https://cdn.hackclub.com/{i}/logo.png',
+        'banner': f'https://cdn.hackclub.com/{i}/banner.png',
+    }
+
+
+def write_synthetic_fixtures(store: FixtureStore, items: int = 500):
+    """Record ``items`` synthetic items per source as the live APIs would serve them"""
+    from devpost_live import DEVPOST_API_URL
+    from devcompass.sources.hackclub import HACKCLUB_UPCOMING_URL
+    from unstop_api import UNSTOP_PER_PAGE, UNSTOP_SEARCH_URL
+
+    unstop = [synthetic_unstop_item(i) for i in range(items)]
+    last_page = max(1, -(-items // UNSTOP_PER_PAGE))
+    for page in range(1, last_page + 1):
+        data = unstop[(page - 1) * UNSTOP_PER_PAGE:page * UNSTOP_PER_PAGE]
+        store.save_json('GET', UNSTOP_SEARCH_URL,
+                        {'data': {'data': data, 'current_page': page, 'last_page': last_page,
+                                  'per_page': UNSTOP_PER_PAGE, 'total': items}},
+                        params={'opportunity': 'hackathons', 'per_page': UNSTOP_PER_PAGE, 'page': page})
+
+    devpost = [synthetic_devpost_item(i) for i in range(items)]
+    per_page = 20
+    for page in range(1, max(1, -(-items // per_page)) + 1):
+        store.save_json('GET', DEVPOST_API_URL,
+                        {'hackathons': devpost[(page - 1) * per_page:page * per_page],
+                         'meta': {'total_count': items, 'per_page': per_page}},
+                        params={'order_by': 'recently-added', 'per_page': per_page, 'page': page})
+
+    store.save_json('GET', HACKCLUB_UPCOMING_URL, [synthetic_hackclub_item(i) for i in range(items)])
+
+
+def recorded_items(store: FixtureStore) -> Dict[str, List[Dict]]:
+    """Raw items per source from every JSON payload in the store"""
+    from devpost_live import devpost_items
+
+    extractors = {
+        'unstop': (UNSTOP_HOST, lambda data: data.get('data', {}).get('data', [])),
+        'devpost': (DEVPOST_HOST, devpost_items),
+        'hackclub': (HACKCLUB_HOST, lambda data: data if isinstance(data, list) else data.get('events', [])),
+    }
+
+    items = {}
+    for source, (host, extract) in extractors.items():
+        items[source] = []
+        for meta, body in store.iter_payloads(host):
+            if 'json' in meta['content_type']:
+                items[source].extend(extract(json.loads(body)))
+    return items
+
+
+def parsers() -> Dict[str, Callable[[Dict], Dict]]:
+    """The parse hot paths being measured"""
+    from devpost_live import parse_devpost_hackathon
+    from hackclub_scraper import parse_hackclub_hackathon
+    from unstop_api import parse_unstop_hackathon
+
+    measured = {
+        'unstop': parse_unstop_hackathon,
+        'devpost': parse_devpost_hackathon,
+        'hackclub': parse_hackclub_hackathon,
+    }
+
+    try:
+        from devpost_scraper import DevpostScraper
+    except ImportError as e:
+        print(f"Skipping DevpostScraper.process_hackathon_data: {e}")
+    else:
+        # process_hackathon_data only needs the instance's helper methods,
+        # not the clients __init__ would open
+        measured['devpost (scraper)'] = DevpostScraper.__new__(DevpostScraper).process_hackathon_data
+
+    return measured
+
+
+def bench_parse(items: Dict[str, List[Dict]], repeat: int = 5) -> List[Dict]:
+    """Records/second for every parser over its source's raw items"""
+    results = []
+    for name, parse in parsers().items():
+        raw = items.get(name.split(' ')[0], [])
+        if not raw:
+            continue
+
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for item in raw:
+                parse(item)
+            best = min(best, time.perf_counter() - started)
+
+        results.append({'name': name, 'records': len(raw), 'seconds': best,
+                        'per_second': len(raw) / best if best else float('inf')})
+    return results
+
+
+def bench_normalize(items: List[Dict], repeat: int = 5) -> List[Dict]:
+    """Per-item parse_unstop_hackathon (plus save_to_supabase's cleanup) vs the batch normalizer"""
+    from devcompass.normalize import ascii_row, normalize_unstop
+    from unstop_api import parse_unstop_hackathon
+
+    def per_item():
+        rows = [parse_unstop_hackathon(item) for item in items]
+        return [ascii_row(row) if row else None for row in rows]
+
+    def batch():
+        return normalize_unstop(items, ascii_only=True)
+
+    # The numbers only mean something if both produce the same rows
+    mismatches = sum(1 for old, new in zip(per_item(), batch()) if old != new)
+
+    results = []
+    for name, run in (('parse_unstop_hackathon', per_item), ('normalize_unstop', batch)):
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - started)
+        results.append({'name': name, 'records': len(items), 'seconds': best,
+                        'per_second': len(items) / best if best else float('inf'),
+                        'mismatches': mismatches})
+    return results
+
+
+def bench_parallel(items: List[Dict], source: str = 'unstop', copies: int = 20,
+                   workers: Optional[List[int]] = None) -> List[Dict]:
+    """Backfill-sized parse (``copies`` x the items) on 1, 2, 4... processes, up to the core count"""
+    from devcompass.parallel import default_workers, parse_parallel
+
+    if workers is None:
+        workers = [count for count in (1, 2, 4, 8, 16) if count <= default_workers()]
+
+    backfill = items * copies
+    results = []
+    for count in workers:
+        started = time.perf_counter()
+        parse_parallel(source, backfill, workers=count, min_items=0)
+        seconds = time.perf_counter() - started
+        results.append({'name': f'{count} worker{"s" if count > 1 else ""}', 'records': len(backfill),
+                        'seconds': seconds, 'per_second': len(backfill) / seconds if seconds else float('inf')})
+    return results
+
+
+def bench_memory(items: List[Dict], copies: int = 20) -> List[Dict]:
+    """Bytes retained per parsed Unstop row, as dicts and as HackathonRecords"""
+    from devcompass.normalize import normalize_unstop
+
+    # Decode fresh copies so repeated strings are separate objects, as they
+    # are when pages arrive off the wire
+    backfill = json.loads(json.dumps(items * copies))
+
+    results = []
+    for name, records in (('dict rows', False), ('HackathonRecord', True)):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        rows = [row for row in normalize_unstop(backfill, ascii_only=True, records=records) if row]
+        retained = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        results.append({'name': name, 'records': len(rows), 'bytes': retained,
+                        'per_record': retained / len(rows) if rows else 0})
+        del rows
+    return results
+
+
+def bench_end_to_end(store: FixtureStore, sources=BENCH_SOURCES) -> List[Dict]:
+    """Rows/second through fetch, parse and sync, cold and then warm"""
+    from devcompass.http_pool import HttpPool
+    from devcompass.orchestrator import run_source
+    from devcompass.rate_limit import AdaptiveRateLimiter
+    from devcompass.supabase_writer import SupabaseWriter
+
+    # Replayed hosts need no politeness limits; the numbers should measure code
+    unlimited = AdaptiveRateLimiter(rate=1e9, min_rate=1e9, max_rate=1e9, burst=1e9)
+    pool = HttpPool(per_host=64, rate_limiter=unlimited)
+    replay_from(pool, store)
+    database = FakeSupabase()
+    database.mount(pool)
+    writer = SupabaseWriter(FAKE_SUPABASE_URL, 'bench', pool=pool)
+
+    results = []
+    try:
+        for run in ('cold', 'warm'):
+            for name in sources:
+                started = time.perf_counter()
+                result = run_source(name, pool, writer)
+                seconds = time.perf_counter() - started
+                rows = result.get('parsed', 0)
+                results.append({'name': f'{name} ({run})', 'status': result['status'], 'records': rows,
+                                'seconds': seconds, 'per_second': rows / seconds if seconds else float('inf'),
+                                'error': result.get('error')})
+    finally:
+        pool.close()
+    return results
+
+
+def bench_writes(rows: List[Dict], chunk_sizes=(50, 100, 500), over_http: bool = False) -> List[Dict]:
+    """Rows/second for bulk upserts (insert, then update) at each chunk size"""
+    from devcompass.fake_supabase import serve
+    from devcompass.http_pool import HttpPool
+    from devcompass.rate_limit import AdaptiveRateLimiter
+    from devcompass.supabase_writer import SupabaseWriter
+
+    results = []
+    for chunk_size in chunk_sizes:
+        pool = HttpPool(rate_limiter=AdaptiveRateLimiter(rate=1e9, min_rate=1e9, max_rate=1e9, burst=1e9))
+        database, server, url = FakeSupabase(), None, FAKE_SUPABASE_URL
+        if over_http:
+            server, _ = serve(port=0, fake=database)
+            url = f'http://127.0.0.1:{server.server_address[1]}'
+        else:
+            database.mount(pool)
+        writer = SupabaseWriter(url, 'bench', pool=pool, chunk_size=chunk_size)
+
+        try:
+            for phase in ('insert', 'update'):
+                database.reset_stats()
+                started = time.perf_counter()
+                report = writer.upsert(rows)
+                seconds = time.perf_counter() - started
+
+                latency = database.stats().get('POST', {})
+                results.append({'name': f'chunk {chunk_size} ({phase})', 'records': len(rows),
+                                'seconds': seconds, 'per_second': len(rows) / seconds if seconds else float('inf'),
+                                'requests': latency.get('requests', 0), 'p50_ms': latency.get('p50_ms'),
+                                'p95_ms': latency.get('p95_ms'), 'failed': report['failed']})
+        finally:
+            pool.close()
+            if server is not None:
+                server.shutdown()
+    return results
+
+
+def run_benchmarks(fixture_dir: Optional[str] = None, items: int = 500, repeat: int = 5,
+                   synthetic: bool = False, over_http: bool = False) -> Dict[str, List[Dict]]:
+    """Run every benchmark on recorded fixtures, or on a synthetic set when there are none"""
+    from unstop_api import parse_unstop_hackathon
+
+    with tempfile.TemporaryDirectory() as scratch:
+        store = FixtureStore(fixture_dir) if fixture_dir else FixtureStore()
+        if synthetic or not store.hosts():
+            print(f"Using {items} synthetic items per source")
+            store = FixtureStore(scratch)
+            write_synthetic_fixtures(store, items)
+
+        raw = recorded_items(store)
+        rows = [row for row in map(parse_unstop_hackathon, raw['unstop']) if row]
+        return {
+            'parse': bench_parse(raw, repeat),
+            'normalize': bench_normalize(raw['unstop'], repeat),
+            'parallel': bench_parallel(raw['unstop']),
+            'memory': bench_memory(raw['unstop']),
+            'end_to_end': bench_end_to_end(store),
+            'writes': bench_writes(rows, over_http=over_http),
+        }
+
+
+def print_report(report: Dict[str, List[Dict]]):
+    print("\n=== Parse (best of runs) ===")
+    for result in report['parse']:
+        print(f"{result['name']:<20} {result['records']:>6} records  {result['per_second']:>12,.0f} records/s")
+
+    print("\n=== Unstop normalization (per item vs batch, ASCII-clean rows) ===")
+    for result in report['normalize']:
+        print(f"{result['name']:<24} {result['records']:>6} records  {result['per_second']:>12,.0f} records/s")
+    if report['normalize'] and report['normalize'][0]['mismatches']:
+        print(f"WARNING: {report['normalize'][0]['mismatches']} rows differ between the two")
+
+    print("\n=== Unstop backfill parse (process pool) ===")
+    for result in report['parallel']:
+        print(f"{result['name']:<24} {result['records']:>6} records  {result['per_second']:>12,.0f} records/s")
+
+    print("\n=== Backfill memory (Unstop rows held at once) ===")
+    for result in report['memory']:
+        print(f"{result['name']:<24} {result['records']:>6} records  {result['per_record']:>12,.0f} bytes/record")
+
+    print("\n=== End to end (replay -> parse -> fake Supabase) ===")
+    for result in report['end_to_end']:
+        if result['status'] != 'ok':
+            print(f"{result['name']:<20} FAILED: {result['error']}")
+            continue
+        print(f"{result['name']:<20} {result['records']:>6} rows     {result['per_second']:>12,.0f} rows/s")
+
+    print("\n=== Writes (SupabaseWriter -> fake Supabase) ===")
+    for result in report['writes']:
+        print(f"{result['name']:<20} {result['records']:>6} rows     {result['per_second']:>12,.0f} rows/s  "
+              f"{result['requests']} requests, p50 {result['p50_ms']} ms, p95 {result['p95_ms']} ms"
+              f"{', ' + str(result['failed']) + ' failed' if result['failed'] else ''}")
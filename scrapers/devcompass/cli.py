@@ -0,0 +1,276 @@
+"""
+DevCompass command line interface
+
+Commands:
+    scrape   Fetch, parse and sync sources (all by default)
+    reparse  Run raw items (a JSON file, or the raw payload lake) through the current parser
+    resume   Send rows an interrupted run staged but never got written
+    cleanup  Remove expired hackathons
+    dedup    Link duplicate listings of the same event (canonical_id)
+    maintain Run a set-based maintenance job (banner backfill, column fixes)
+    intel    Build a historical intelligence report for a hackathon
+    record   Save raw source payloads as replayable fixtures
+    bench    Offline parse, end-to-end and write throughput benchmarks
+    fake-supabase  Serve a local SQLite-backed PostgREST stand-in
+
+Heavy modules (requests, Supabase, Playwright, adapters) are imported inside
+the command that needs them. Pass --timings to print how long the command
+took and how many modules it loaded; ``python -X importtime -m devcompass
+...`` gives the per-module breakdown.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from devcompass.registry import available_sources
+
+
+def cmd_scrape(args) -> int:
+    from devcompass.orchestrator import print_summary, run_all
+
+    results = run_all(args.sources)
+    print_summary(results)
+    if args.dedup:
+        from devcompass.clients import get_writer
+        from devcompass.dedup import dedup_table
+        dedup_table(get_writer())
+    return 0 if all(result['status'] == 'ok' for result in results) else 1
+
+
+def cmd_reparse(args) -> int:
+    from devcompass.parallel import parse_parallel
+    from devcompass.records import json_default
+    from devcompass.registry import load_source
+
+    source = load_source(args.source)
+
+    if not args.input:
+        from devcompass.clients import get_lake
+        from devcompass.lake import parse_since, reparse_into
+
+        lake = get_lake()
+        if lake is None:
+            raise ValueError("No --input file and no raw payload lake (set SCRAPE_LAKE_DIR)")
+        since = parse_since(args.since)
+        if not args.write:
+            print(f"{lake.count(source.name, since)} stored {source.name} items; pass --write to sync them",
+                  file=sys.stderr)
+            return 0
+        from devcompass.clients import get_writer
+        from devcompass.parallel import default_workers
+        report = reparse_into(lake, source.name, get_writer(), since=since,
+                              workers=args.workers or default_workers())
+        return 0 if not report['failed'] else 1
+
+    with open(args.input, encoding='utf-8') as f:
+        data = json.load(f)
+    items = data if isinstance(data, list) else data.get('items', [])
+
+    hackathons = [hackathon for hackathon in parse_parallel(args.source, items, workers=args.workers or 1, records=True)
+                  if hackathon]
+    print(f"Parsed {len(hackathons)}/{len(items)} {args.source} items", file=sys.stderr)
+
+    if args.write:
+        from devcompass.clients import get_writer
+        from devcompass.sync import sync_source
+        sync_source(get_writer(), source.name, hackathons, complete=False)
+    else:
+        output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+        json.dump(hackathons, output, indent=2, ensure_ascii=False, default=json_default)
+        output.write('\n')
+        if args.output:
+            output.close()
+    return 0
+
+
+def cmd_resume(args) -> int:
+    from devcompass.clients import get_writer
+
+    writer = get_writer()
+    if writer.outbox is None:
+        raise ValueError("No outbox configured (set SCRAPE_OUTBOX)")
+    pending = writer.outbox.pending_count(args.source)
+    if args.status or not pending:
+        print(f"Outbox {writer.outbox.path}: {pending} pending rows"
+              f"{' for ' + args.source if args.source else ''} ({json.dumps(writer.outbox.stats())})")
+        return 0
+
+    print(f"Resuming {pending} pending rows from {writer.outbox.path}")
+    report = writer.resume(args.source)
+    print(f"Resume: {report['inserted']} new, {report['updated']} updated, "
+          f"{report['quarantined']} quarantined, {report['pending']} still pending")
+    return 0 if not report['pending'] else 1
+
+
+def cmd_cleanup(args) -> int:
+    from cleanup_test_data import cleanup_expired_hackathons
+
+    cleanup_expired_hackathons()
+    return 0
+
+
+def cmd_dedup(args) -> int:
+    from devcompass.clients import get_writer
+    from devcompass.dedup import dedup_table
+
+    dedup_table(get_writer(), threshold=args.threshold, date_window_days=args.window, dry_run=args.dry_run)
+    return 0
+
+
+def cmd_maintain(args) -> int:
+    from devcompass.maintenance import JOBS, load_job, run_job
+
+    if args.list or not args.jobs:
+        for name, factory in JOBS.items():
+            print(f"{name:<16} {factory().description}")
+        return 0
+
+    from devcompass.clients import get_writer
+    writer = get_writer()
+    for name in args.jobs:
+        run_job(writer, load_job(name), dry_run=args.dry_run, concurrency=args.concurrency)
+    return 0
+
+
+def cmd_intel(args) -> int:
+    from historical_pipeline import IntelligenceEngine
+
+    result = IntelligenceEngine(args.output_dir).run_pipeline(args.url, max_past_editions=args.editions)
+    if result['status'] != 'success':
+        print(f"Analysis failed: {result.get('message', 'Unknown error')}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_record(args) -> int:
+    from devcompass.fixtures import FixtureStore, record_into
+    from devcompass.http_pool import HttpPool
+    from devcompass.registry import load_source
+    from devcompass.resilience import Resilience, ResilientPool
+
+    store = FixtureStore(args.fixtures) if args.fixtures else FixtureStore()
+    for name in args.sources or available_sources():
+        source = load_source(name)
+        source.fixtures = store
+
+        # No response cache: a 304 would leave nothing to record
+        pool = HttpPool()
+        record_into(pool, store)
+        try:
+            count = sum(1 for _ in source.fetch(ResilientPool(pool, Resilience(name)), set()))
+        finally:
+            pool.close()
+        print(f"Recorded {count} {name} items into {store.root}")
+    return 0
+
+
+def cmd_bench(args) -> int:
+    from devcompass.bench import print_report, run_benchmarks
+
+    print_report(run_benchmarks(args.fixtures, items=args.items, repeat=args.repeat,
+                                synthetic=args.synthetic, over_http=args.http))
+    return 0
+
+
+def cmd_fake_supabase(args) -> int:
+    from devcompass.fake_supabase import serve
+
+    server, fake = serve(args.db, port=args.port)
+    print(f"Fake Supabase on http://127.0.0.1:{server.server_address[1]} "
+          f"(set SUPABASE_URL to it; any SUPABASE_SERVICE_KEY works). Ctrl+C prints request stats.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(json.dumps(fake.stats(), indent=2))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='devcompass', description='DevCompass hackathon scrapers')
+    parser.add_argument('--timings', action='store_true', help='print command time and number of loaded modules')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scrape = commands.add_parser('scrape', help='fetch, parse and sync sources')
+    scrape.add_argument('sources', nargs='*', metavar='source',
+                        help=f"sources to run (default: all of {', '.join(available_sources())})")
+    scrape.add_argument('--dedup', action='store_true', help='link duplicate listings after syncing')
+    scrape.set_defaults(func=cmd_scrape)
+
+    reparse = commands.add_parser('reparse', help='run stored raw items through the current parser')
+    reparse.add_argument('--source', required=True, choices=available_sources())
+    reparse.add_argument('--input', help='JSON file with a list of raw items (default: the raw payload lake)')
+    reparse.add_argument('--since', help='lake items fetched since this date or age, e.g. 2026-01-01 or 30d')
+    reparse.add_argument('--output', help='write parsed rows here instead of stdout')
+    reparse.add_argument('--write', action='store_true', help='sync parsed rows to Supabase')
+    reparse.add_argument('--workers', type=int,
+                         help='parse on this many processes (default: 1 for --input, every core for the lake; '
+                              'small inputs stay in-process)')
+    reparse.set_defaults(func=cmd_reparse)
+
+    resume = commands.add_parser('resume', help='send rows an interrupted run staged but never got written')
+    resume.add_argument('--source', choices=available_sources(), help='only rows from this platform')
+    resume.add_argument('--status', action='store_true', help='show what is pending without sending it')
+    resume.set_defaults(func=cmd_resume)
+
+    cleanup = commands.add_parser('cleanup', help='remove expired hackathons')
+    cleanup.set_defaults(func=cmd_cleanup)
+
+    dedup = commands.add_parser('dedup', help='link duplicate listings of the same event')
+    dedup.add_argument('--threshold', type=float, default=0.6, help='minimum title similarity (0-1)')
+    dedup.add_argument('--window', type=int, default=3, help='maximum days between start dates')
+    dedup.add_argument('--dry-run', action='store_true', help='report links without writing them')
+    dedup.set_defaults(func=cmd_dedup)
+
+    maintain = commands.add_parser('maintain', help='run set-based maintenance jobs')
+    maintain.add_argument('jobs', nargs='*', metavar='job', help='jobs to run in order (see --list)')
+    maintain.add_argument('--list', action='store_true', help='list available jobs')
+    maintain.add_argument('--dry-run', action='store_true', help='count the rows each job would change')
+    maintain.add_argument('--concurrency', type=int, default=4, help='parallel write requests')
+    maintain.set_defaults(func=cmd_maintain)
+
+    intel = commands.add_parser('intel', help='historical intelligence report for a hackathon')
+    intel.add_argument('url', help='hackathon URL, e.g. https://bevhacks-2026.devpost.com')
+    intel.add_argument('--editions', type=int, default=3, help='past editions to analyze')
+    intel.add_argument('--output-dir', default='intelligence_reports')
+    intel.set_defaults(func=cmd_intel)
+
+    record = commands.add_parser('record', help='save raw source payloads as replayable fixtures')
+    record.add_argument('sources', nargs='*', metavar='source',
+                        help=f"sources to record (default: all of {', '.join(available_sources())})")
+    record.add_argument('--fixtures', help='fixture directory (default: $SCRAPE_FIXTURE_DIR or fixtures)')
+    record.set_defaults(func=cmd_record)
+
+    bench = commands.add_parser('bench', help='offline parse, end-to-end and write throughput benchmarks')
+    bench.add_argument('--fixtures', help='recorded fixture directory (default: $SCRAPE_FIXTURE_DIR or fixtures)')
+    bench.add_argument('--synthetic', action='store_true', help='ignore recordings and use synthetic payloads')
+    bench.add_argument('--items', type=int, default=500, help='synthetic items per source')
+    bench.add_argument('--repeat', type=int, default=5, help='parse runs per parser (best is reported)')
+    bench.add_argument('--http', action='store_true', help='write through a local HTTP fake instead of in-process')
+    bench.set_defaults(func=cmd_bench)
+
+    fake = commands.add_parser('fake-supabase', help='serve a local SQLite-backed PostgREST stand-in')
+    fake.add_argument('--port', type=int, default=54321)
+    fake.add_argument('--db', default=':memory:', help='SQLite file to keep the data in')
+    fake.set_defaults(func=cmd_fake_supabase)
+
+    return parser
+
+
+def main(argv=None):
+    started = time.perf_counter()
+    args = build_parser().parse_args(argv)
+
+    try:
+        status = args.func(args)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        status = 2
+
+    if args.timings:
+        print(f"[timings] {args.command}: {(time.perf_counter() - started) * 1000:.1f} ms "
+              f"(modules loaded: {len(sys.modules)})", file=sys.stderr)
+    sys.exit(status)
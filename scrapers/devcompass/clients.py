@@ -0,0 +1,61 @@
+"""
+Lazily created shared clients
+
+Clients are built on first use and then reused, so importing a scraper or
+running a parse-only command never needs Supabase credentials.
+"""
+
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+@lru_cache(maxsize=None)
+def get_supabase():
+    """Return the shared supabase-py client"""
+    from supabase import create_client
+
+    supabase_url = os.getenv('SUPABASE_URL')
+    supabase_key = os.getenv('SUPABASE_SERVICE_KEY')
+    if not supabase_url or not supabase_key:
+        raise ValueError("Missing Supabase configuration in .env file")
+
+    return create_client(supabase_url, supabase_key)
+
+
+@lru_cache(maxsize=None)
+def get_cache():
+    """Return the shared on-disk response cache, or None when SCRAPE_CACHE_DIR is empty"""
+    from devcompass.http_cache import DEFAULT_CACHE_DIR, ResponseCache
+    return ResponseCache() if DEFAULT_CACHE_DIR else None
+
+
+@lru_cache(maxsize=None)
+def get_lake():
+    """Return the shared raw payload lake, or None when SCRAPE_LAKE_DIR is empty"""
+    from devcompass.lake import DEFAULT_LAKE_DIR, RawLake
+    return RawLake() if DEFAULT_LAKE_DIR else None
+
+
+@lru_cache(maxsize=None)
+def get_pool():
+    """Return the shared HTTP pool"""
+    from devcompass.http_pool import HttpPool
+    return HttpPool(cache=get_cache())
+
+
+@lru_cache(maxsize=None)
+def get_outbox():
+    """Return the shared write outbox, or None when SCRAPE_OUTBOX is empty"""
+    from devcompass.outbox import DEFAULT_OUTBOX_PATH, Outbox
+    return Outbox() if DEFAULT_OUTBOX_PATH else None
+
+
+@lru_cache(maxsize=None)
+def get_writer():
+    """Return the shared Supabase writer, using the shared HTTP pool and outbox"""
+    from devcompass.supabase_writer import SupabaseWriter
+    return SupabaseWriter(pool=get_pool(), outbox=get_outbox())
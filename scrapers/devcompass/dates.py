@@ -0,0 +1,205 @@
+"""
+Date Normalization - turns every source's date formats into UTC ISO timestamps
+
+Handles ISO 8601 (with or without offset, 'Z' suffix, date only), Unix
+epochs, human dates like "Mar 01, 2026" or "1 March 2026", and ranges like
+"Mar 01 - 05, 2026", "Mar 28 - Apr 02, 2026" or "Dec 28, 2025 - Jan 02,
+2026". Placeholders such as "See Website" become None, so the timestamp
+columns only ever hold real values.
+
+Parsed strings are memoized: listings repeat the same few dates over and
+over, and ISO input takes a fast path that skips the human-format rules.
+"""
+
+import re
+from datetime import datetime, time as day_time, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Tuple
+
+UTC = timezone.utc
+
+# Unstop publishes naive times in Indian Standard Time
+IST = timezone(timedelta(hours=5, minutes=30))
+
+PLACEHOLDERS = {'', 'see website', 'tba', 'tbd', 'coming soon', 'n/a', 'na', 'none', 'null'}
+
+MONTHS = {name: number for number, names in enumerate(
+    [('jan', 'january'), ('feb', 'february'), ('mar', 'march'), ('apr', 'april'), ('may',),
+     ('jun', 'june'), ('jul', 'july'), ('aug', 'august'), ('sep', 'sept', 'september'),
+     ('oct', 'october'), ('nov', 'november'), ('dec', 'december')], start=1) for name in names}
+
+ISO_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+ISO_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+MONTH = r'(?P<{0}>[A-Za-z]{{3,9}})\.?'
+DAY = r'(?P<{0}>\d{{1,2}})(?:st|nd|rd|th)?'
+YEAR = r'(?P<{0}>\d{{4}})'
+
+# "Mar 01, 2026" / "March 1 2026"
+MONTH_DAY_YEAR_RE = re.compile(rf"^{MONTH.format('month')}\s+{DAY.format('day')},?\s+{YEAR.format('year')}$")
+# "01 Mar 2026" / "1 March, 2026"
+DAY_MONTH_YEAR_RE = re.compile(rf"^{DAY.format('day')}\s+{MONTH.format('month')},?\s+{YEAR.format('year')}$")
+
+# "Mar 01 - 05, 2026"
+RANGE_SAME_MONTH_RE = re.compile(
+    rf"^{MONTH.format('month')}\s+{DAY.format('start_day')}\s*[-–—]\s*{DAY.format('end_day')},?\s+{YEAR.format('year')}$")
+# "Mar 28 - Apr 02, 2026"
+RANGE_SAME_YEAR_RE = re.compile(
+    rf"^{MONTH.format('start_month')}\s+{DAY.format('start_day')}\s*[-–—]\s*"
+    rf"{MONTH.format('end_month')}\s+{DAY.format('end_day')},?\s+{YEAR.format('year')}$")
+# "Dec 28, 2025 - Jan 02, 2026" and anything else split on a dash between two full dates
+RANGE_SPLIT_RE = re.compile(r'\s+(?:[-–—]|to)\s+')
+
+
+def _iso(moment: datetime, default_tz: timezone) -> str:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=default_tz)
+    return moment.astimezone(UTC).isoformat()
+
+
+def _month(name: str) -> Optional[int]:
+    return MONTHS.get(name.lower().rstrip('.'))
+
+
+def _date(year: str, month: str, day: str) -> Optional[datetime]:
+    number = _month(month)
+    if number is None:
+        return None
+    try:
+        return datetime(int(year), number, int(day))
+    except ValueError:
+        return None
+
+
+def _end_of_day(moment: datetime) -> datetime:
+    return datetime.combine(moment.date(), day_time(23, 59, 59))
+
+
+def _parse_human(text: str) -> Optional[datetime]:
+    for pattern in (MONTH_DAY_YEAR_RE, DAY_MONTH_YEAR_RE):
+        match = pattern.match(text)
+        if match:
+            return _date(match['year'], match['month'], match['day'])
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _normalize_text(text: str, default_tz: timezone) -> Optional[str]:
+    text = text.strip()
+    if text.lower() in PLACEHOLDERS:
+        return None
+
+    # Fast path: ISO 8601 (Python 3.11 accepts 'Z' and date-only forms)
+    if ISO_RE.match(text):
+        try:
+            return _iso(datetime.fromisoformat(text), default_tz)
+        except ValueError:
+            try:
+                return _iso(datetime.fromisoformat(text.replace(' ', 'T', 1)), default_tz)
+            except ValueError:
+                return None
+
+    if text.isdigit():
+        return to_utc_iso(int(text), default_tz)
+
+    moment = _parse_human(text)
+    return _iso(moment, default_tz) if moment else None
+
+
+@lru_cache(maxsize=4096)
+def _normalize_end(text: str, default_tz: timezone) -> Optional[str]:
+    """Like _normalize_text, but a date without a time means the end of that day"""
+    text = text.strip()
+    match = ISO_DATE_RE.match(text)
+    if match:
+        try:
+            moment = datetime(int(match[1]), int(match[2]), int(match[3]))
+        except ValueError:
+            return None
+    else:
+        moment = _parse_human(text)
+        if moment is None:
+            return _normalize_text(text, default_tz)
+    return _iso(_end_of_day(moment), default_tz)
+
+
+def to_utc_iso(value, default_tz: timezone = UTC) -> Optional[str]:
+    """
+    UTC ISO timestamp for a date/time value, or None if it is not a date
+
+    Args:
+        value: ISO string, human date string, Unix epoch (seconds or
+            milliseconds) or datetime
+        default_tz: Zone for values without an offset
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, datetime):
+        return _iso(value, default_tz)
+    if isinstance(value, (int, float)):
+        seconds = value / 1000 if value > 1e11 else value
+        try:
+            return datetime.fromtimestamp(seconds, UTC).isoformat()
+        except (OverflowError, OSError, ValueError):
+            return None
+    if isinstance(value, str):
+        return _normalize_text(value, default_tz)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _range_text(text: str, default_tz: timezone) -> Tuple[Optional[str], Optional[str]]:
+    text = ' '.join(text.split())
+    if text.lower() in PLACEHOLDERS:
+        return None, None
+
+    start = end = None
+    match = RANGE_SAME_MONTH_RE.match(text)
+    if match:
+        start = _date(match['year'], match['month'], match['start_day'])
+        end = _date(match['year'], match['month'], match['end_day'])
+    else:
+        match = RANGE_SAME_YEAR_RE.match(text)
+        if match:
+            start = _date(match['year'], match['start_month'], match['start_day'])
+            end = _date(match['year'], match['end_month'], match['end_day'])
+            # "Dec 28 - Jan 02, 2026": the year belongs to the end date
+            if start and end and start > end:
+                start = start.replace(year=start.year - 1)
+        else:
+            parts = RANGE_SPLIT_RE.split(text, maxsplit=1)
+            if len(parts) == 2:
+                start, end = _parse_human(parts[0]), _parse_human(parts[1])
+                if start is None or end is None:
+                    start_iso, end_iso = _normalize_text(parts[0], default_tz), _normalize_end(parts[1], default_tz)
+                    if start_iso or end_iso:
+                        return start_iso, end_iso
+            else:
+                single = _normalize_text(text, default_tz)
+                if single:
+                    return single, _normalize_end(text, default_tz)
+
+    if start is None or end is None:
+        return None, None
+    # The last day counts in full, for every format without a time of day
+    return _iso(start, default_tz), _iso(_end_of_day(end), default_tz)
+
+
+def parse_date_range(value, default_tz: timezone = UTC) -> Tuple[Optional[str], Optional[str]]:
+    """
+    (start, end) UTC ISO timestamps for a date range string such as
+    "Mar 01 - 05, 2026"; a single date covers that whole day and anything
+    unparseable gives (None, None). An end given without a time of day is
+    the last second of that day, whatever the format.
+    """
+    if isinstance(value, dict):
+        end = value.get('end')
+        end = _normalize_end(end, default_tz) if isinstance(end, str) else to_utc_iso(end, default_tz)
+        return to_utc_iso(value.get('start'), default_tz), end
+    if not isinstance(value, str):
+        return None, None
+    return _range_text(value, default_tz)
+
+
+def unstop_date(value) -> Optional[str]:
+    """Unstop timestamps are IST when they carry no offset"""
+    return to_utc_iso(value, IST)
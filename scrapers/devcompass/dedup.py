@@ -0,0 +1,270 @@
+"""
+Duplicate Detection - links listings of the same event across (and within)
+platforms through a canonical_id column
+
+Two rows are the same event when their URLs canonicalize to the same key
+(e.g. Unstop's ``/hackathons/{id}`` and ``/{public_url}`` shapes), or when
+they come from different platforms, have near-identical titles and start
+within a few days of each other; a title match never joins two clusters
+that each hold a row from the same platform. Title candidates come from
+MinHash signatures banded into LSH buckets, so the whole table is clustered
+without comparing every pair of rows.
+
+Each cluster keeps its most complete row as the representative; every other
+member gets ``canonical_id`` set to the representative's id, so the feed
+shows one row per event with ``canonical_id=is.null``.
+"""
+
+import random
+import re
+import zlib
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Signature length and its split into LSH bands; 16 bands of 4 rows make
+# titles with Jaccard similarity around 0.5 and above likely to share a bucket
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+
+# Minimum shingle Jaccard similarity for a title match, and the stricter one
+# used when either row has no dates to compare
+DEFAULT_THRESHOLD = 0.6
+UNDATED_THRESHOLD = 0.85
+
+# Start (or end) dates further apart than this are different events
+DEFAULT_DATE_WINDOW_DAYS = 3
+
+# A bucket with more members than this (a generic title shared by many
+# events) compares each member only with this many neighbours by start date
+MAX_BUCKET_SIZE = 50
+
+# Ids per PATCH request when writing links
+WRITE_BATCH_SIZE = 100
+
+COLUMNS = 'id,title,original_url,platform_source,start_date,end_date,prize_amount_usd,canonical_id,created_at'
+
+_MERSENNE = (1 << 61) - 1
+_rng = random.Random(1)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE), _rng.randrange(0, _MERSENNE)) for _ in range(NUM_PERM)]
+
+TRACKING_PARAMS = re.compile(r'^(utm_\w+|ref|ref_src|source|fbclid|gclid|lb|trk)$')
+UNSTOP_ID_RE = re.compile(r'(?:^|-)(\d{4,})$')
+TITLE_NOISE_RE = re.compile(r'\b(?:20\d\d|hackathon|hack|the|edition|season|online|virtual)\b')
+NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+
+def canonical_url(url: Optional[str]) -> Optional[str]:
+    """
+    Scheme-less, lower-cased URL without www., tracking params, fragment or
+    trailing slash; Unstop listings reduce to their numeric opportunity id
+    """
+    if not url:
+        return None
+    parts = urlsplit(url.strip() if '//' in url else f"https://{url.strip()}")
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    path = parts.path.rstrip('/')
+
+    if host == 'unstop.com':
+        match = UNSTOP_ID_RE.search(path.rsplit('/', 1)[-1])
+        if match:
+            return f"unstop.com/{match.group(1)}"
+
+    query = urlencode(sorted((key, value) for key, value in parse_qsl(parts.query)
+                             if not TRACKING_PARAMS.match(key.lower())))
+    return f"{host}{path}{'?' + query if query else ''}"
+
+
+def title_shingles(title: Optional[str], size: int = 3) -> Set[str]:
+    """Character shingles of a title with years and generic words removed"""
+    text = NON_ALNUM_RE.sub(' ', (title or '').lower())
+    text = ' '.join(TITLE_NOISE_RE.sub(' ', text).split()) or ' '.join(text.split())
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[index:index + size] for index in range(len(text) - size + 1)}
+
+
+def minhash(shingles: Set[str]) -> Tuple[int, ...]:
+    """NUM_PERM-value MinHash signature of a shingle set"""
+    hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles]
+    return tuple(min((a * value + b) % _MERSENNE for value in hashes) for a, b in _PERMUTATIONS)
+
+
+def jaccard(left: Set[str], right: Set[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+def _timestamp(value) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+class _DisjointSet:
+    def __init__(self, platforms: List[Optional[str]]):
+        self.parent = list(range(len(platforms)))
+        # Platforms present in each root's cluster
+        self.platforms = [{platform} for platform in platforms]
+
+    def find(self, index: int) -> int:
+        while self.parent[index] != index:
+            self.parent[index] = self.parent[self.parent[index]]
+            index = self.parent[index]
+        return index
+
+    def union(self, left: int, right: int, distinct_platforms: bool = False) -> bool:
+        """
+        Merge two clusters; with ``distinct_platforms``, refuse when both
+        already hold a row from the same platform
+        """
+        left, right = self.find(left), self.find(right)
+        if left == right:
+            return False
+        if distinct_platforms and not self.platforms[left].isdisjoint(self.platforms[right]):
+            return False
+        self.parent[right] = left
+        self.platforms[left] |= self.platforms[right]
+        self.platforms[right] = set()
+        return True
+
+
+def _completeness(row: Dict) -> Tuple:
+    """Sort key: rows with dates and a prize first, then the oldest"""
+    return (
+        row.get('start_date') is None,
+        row.get('prize_amount_usd') is None,
+        str(row.get('created_at') or ''),
+        str(row.get('id')),
+    )
+
+
+def find_duplicates(rows: List[Dict], threshold: float = DEFAULT_THRESHOLD,
+                    date_window_days: int = DEFAULT_DATE_WINDOW_DAYS) -> Dict[str, Optional[str]]:
+    """
+    Cluster rows into events
+
+    Returns:
+        {id: canonical id} for every row: the representative's id for
+        duplicates, None for representatives and rows with no duplicate
+    """
+    groups = _DisjointSet([row.get('platform_source') for row in rows])
+
+    # Same canonical URL: always the same listing
+    by_url: Dict[str, int] = {}
+    for index, row in enumerate(rows):
+        key = canonical_url(row.get('original_url'))
+        if key is None:
+            continue
+        if key in by_url:
+            groups.union(by_url[key], index)
+        else:
+            by_url[key] = index
+
+    # Near-identical titles: candidates from LSH buckets, then verified
+    shingles = [title_shingles(row.get('title')) for row in rows]
+    starts = [_timestamp(row.get('start_date')) or _timestamp(row.get('end_date')) for row in rows]
+    buckets: Dict[Tuple, List[int]] = {}
+    for index, row_shingles in enumerate(shingles):
+        if not row_shingles:
+            continue
+        signature = minhash(row_shingles)
+        for band in range(BANDS):
+            key = (band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])
+            buckets.setdefault(key, []).append(index)
+
+    def start_order(index: int) -> Tuple:
+        return (starts[index] is None, starts[index].timestamp() if starts[index] else 0.0, index)
+
+    checked: Set[Tuple[int, int]] = set()
+    window = date_window_days * 86400
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        neighbours = len(members)
+        if len(members) > MAX_BUCKET_SIZE:
+            # Only rows starting close together can match, so neighbours by
+            # start date are the candidates worth the quadratic loop's time
+            members = sorted(members, key=start_order)
+            neighbours = MAX_BUCKET_SIZE
+        for position, left in enumerate(members):
+            for right in members[position + 1:position + 1 + neighbours]:
+                pair = (left, right) if left < right else (right, left)
+                if pair in checked:
+                    continue
+                checked.add(pair)
+                # Within one platform, distinct URLs are distinct listings
+                if rows[left].get('platform_source') == rows[right].get('platform_source'):
+                    continue
+                if starts[left] and starts[right]:
+                    try:
+                        apart = abs((starts[left] - starts[right]).total_seconds())
+                    except TypeError:
+                        continue
+                    if apart > window or jaccard(shingles[left], shingles[right]) < threshold:
+                        continue
+                elif jaccard(shingles[left], shingles[right]) < UNDATED_THRESHOLD:
+                    continue
+                # Nor may a cross-platform neighbour chain two of them together
+                groups.union(left, right, distinct_platforms=True)
+
+    clusters: Dict[int, List[int]] = {}
+    for index in range(len(rows)):
+        clusters.setdefault(groups.find(index), []).append(index)
+
+    links: Dict[str, Optional[str]] = {}
+    for members in clusters.values():
+        representative = min(members, key=lambda index: _completeness(rows[index]))
+        canonical = rows[representative]['id']
+        for index in members:
+            links[rows[index]['id']] = None if index == representative else canonical
+    return links
+
+
+def plan_links(rows: Iterable[Dict], links: Dict[str, Optional[str]]) -> Dict[Optional[str], List[str]]:
+    """Ids whose stored canonical_id differs from ``links``, grouped by the new value"""
+    changes: Dict[Optional[str], List[str]] = {}
+    for row in rows:
+        target = links.get(row['id'])
+        if row.get('canonical_id') != target:
+            changes.setdefault(target, []).append(row['id'])
+    return changes
+
+
+def dedup_table(writer, threshold: float = DEFAULT_THRESHOLD,
+                date_window_days: int = DEFAULT_DATE_WINDOW_DAYS, dry_run: bool = False) -> Dict:
+    """
+    Read every hackathon, cluster duplicates and write changed canonical_id links
+
+    Links are written with one PATCH per canonical id (``id=in.(...)``), so
+    the request count follows the number of changed clusters, not rows.
+    """
+    rows = list(writer.select_all(COLUMNS))
+    links = find_duplicates(rows, threshold, date_window_days)
+    changes = plan_links(rows, links)
+
+    report = {
+        'rows': len(rows),
+        'duplicates': sum(1 for target in links.values() if target),
+        'clusters': len({target for target in links.values() if target}),
+        'changed': sum(len(ids) for ids in changes.values()),
+        'requests': 0,
+    }
+
+    if not dry_run:
+        for target, ids in changes.items():
+            for start in range(0, len(ids), WRITE_BATCH_SIZE):
+                batch = ids[start:start + WRITE_BATCH_SIZE]
+                writer.update({'id': f"in.({','.join(batch)})"}, {'canonical_id': target})
+                report['requests'] += 1
+
+    print(f"Dedup: {report['rows']} rows, {report['duplicates']} duplicates in {report['clusters']} events, "
+          f"{report['changed']} links {'to change' if dry_run else 'changed'}")
+    return report
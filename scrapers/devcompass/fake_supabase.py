@@ -0,0 +1,452 @@
+"""
+Fake Supabase - SQLite-backed stand-in for the PostgREST subset the scrapers use
+
+Tables, unique keys, NOT NULL and CHECK constraints are read from
+docs/schema.sql, so writes fail here the way they fail against the real
+project: a duplicate original_url is a 409 (23505), a bad location_mode a
+400 (23514), an unknown column a 400 (PGRST204), a bulk payload with mixed
+keys a 400 (PGRST102).
+
+Supported on ``/rest/v1/<table>``:
+    GET     select, order, limit, offset and eq/neq/gt/gte/lt/lte/is/in/like/ilike filters
+    POST    plain insert, or upsert with on_conflict / Prefer: resolution=...
+    PATCH   filtered update (updated_at moves forward like the trigger does)
+    DELETE  filtered delete
+    Prefer  return=minimal|representation, count=exact
+
+Two ways in:
+    FakeSupabase().mount(pool)       in-process transport adapter for an HttpPool
+    serve(port=54321)                local HTTP server, for scripts that use
+                                     plain requests or the supabase client:
+                                     SUPABASE_URL=http://127.0.0.1:54321
+
+Every request's count and latency is recorded; see ``FakeSupabase.stats()``.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+FAKE_SUPABASE_URL = 'http://fake-supabase.local'
+
+DEFAULT_SCHEMA = Path(__file__).resolve().parents[2] / 'docs' / 'schema.sql'
+
+TABLE_RE = re.compile(r'CREATE TABLE (\w+) \((.*?)\n\);', re.S)
+COLUMN_RE = re.compile(r'^(\w+)\s+([A-Z]+(?:\[\])?)(.*)$')
+CHECK_RE = re.compile(r'CHECK \((.*)\)\s*$')
+DEFAULT_RE = re.compile(r"DEFAULT ('(?:[^']|'')*'|\S+)")
+
+# Query parameters that are not column filters
+RESERVED_PARAMS = {'select', 'order', 'limit', 'offset', 'on_conflict', 'columns'}
+
+FILTER_OPERATORS = {'eq': '=', 'neq': '!=', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+
+
+class PostgrestError(Exception):
+    """An error response in PostgREST's JSON shape"""
+
+    def __init__(self, status: int, code: str, message: str, details: Optional[str] = None):
+        super().__init__(message)
+        self.status = status
+        self.body = {'code': code, 'message': message, 'details': details, 'hint': None}
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def parse_schema(sql: str) -> Dict[str, Dict]:
+    """Columns, types, defaults and constraints for every CREATE TABLE in ``sql``"""
+    tables = {}
+    for name, body in TABLE_RE.findall(sql):
+        columns, unique, checks = {}, [], []
+        for line in body.splitlines():
+            line = line.split('--')[0].strip().rstrip(',')
+            if not line:
+                continue
+            if line.startswith('UNIQUE'):
+                unique.append(tuple(part.strip() for part in line[line.index('(') + 1:line.rindex(')')].split(',')))
+                continue
+
+            match = COLUMN_RE.match(line)
+            if not match:
+                continue
+            column, column_type, rest = match.groups()
+            default = DEFAULT_RE.search(rest)
+            columns[column] = {
+                'type': column_type,
+                'not_null': 'NOT NULL' in rest or 'PRIMARY KEY' in rest,
+                'default': default.group(1) if default else None,
+            }
+            if 'PRIMARY KEY' in rest:
+                unique.insert(0, (column,))
+            elif 'UNIQUE' in rest:
+                unique.append((column,))
+            check = CHECK_RE.search(rest)
+            if check:
+                checks.append(check.group(1))
+
+        tables[name] = {'columns': columns, 'unique': unique, 'checks': checks}
+    return tables
+
+
+class FakeSupabase(BaseAdapter):
+    """PostgREST emulation over one SQLite database"""
+
+    def __init__(self, database: str = ':memory:', schema: Path = DEFAULT_SCHEMA):
+        super().__init__()
+        self.tables = parse_schema(Path(schema).read_text(encoding='utf-8'))
+        self._db = sqlite3.connect(database, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = {}
+
+        for name, table in self.tables.items():
+            definitions = []
+            for column, spec in table['columns'].items():
+                affinity = 'NUMERIC' if spec['type'] in ('INTEGER', 'BIGINT', 'NUMERIC', 'BOOLEAN') else 'TEXT'
+                definitions.append(f"{column} {affinity}{' NOT NULL' if spec['not_null'] else ''}")
+            definitions += [f"UNIQUE ({', '.join(columns)})" for columns in table['unique']]
+            definitions += [f"CHECK ({check})" for check in table['checks']]
+            self._db.execute(f"CREATE TABLE IF NOT EXISTS {name} ({', '.join(definitions)})")
+        self._db.commit()
+
+    # -- transport --------------------------------------------------------
+
+    def mount(self, pool, url: str = FAKE_SUPABASE_URL):
+        """Answer every request an HttpPool sends to ``url``"""
+        pool.session.mount(url, self)
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        status, headers, body = self.handle(request.method, parts.path, parts.query,
+                                            request.headers, request.body)
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.encoding = 'utf-8'
+        return response
+
+    def close(self):
+        pass
+
+    def handle(self, method: str, path: str, query: str, headers, body) -> Tuple[int, Dict[str, str], bytes]:
+        """Serve one request; returns (status, headers, body)"""
+        started = time.perf_counter()
+        try:
+            table = self._table(path)
+            params = parse_qsl(query, keep_blank_values=True)
+            prefer = {token.strip() for token in (headers.get('Prefer') or '').split(',') if token.strip()}
+            payload = json.loads(body) if body else None
+            selected = self._selected(table, dict(params).get('select', '*'))
+
+            total = None
+            with self._lock:
+                if method == 'GET':
+                    status, rows = 200, self._select(table, params)
+                    if 'count=exact' in prefer:
+                        # Like PostgREST: the total ignores limit and offset
+                        where, values = self._where(table, params)
+                        total = self._db.execute(f"SELECT COUNT(*) FROM {table}{where}", values).fetchone()[0]
+                elif method == 'POST':
+                    status, rows = 201, self._insert(table, params, prefer, payload)
+                elif method == 'PATCH':
+                    status, rows = 200, self._update(table, params, payload)
+                elif method == 'DELETE':
+                    status, rows = 200, self._delete(table, params)
+                else:
+                    raise PostgrestError(405, 'PGRST117', f'Unsupported HTTP method: {method}')
+                self._db.commit()
+
+            response_headers = {'Content-Type': 'application/json'}
+            if 'count=exact' in prefer:
+                first = int(dict(params).get('offset') or 0)
+                span = f"{first}-{first + len(rows) - 1}" if rows else '*'
+                response_headers['Content-Range'] = f"{span}/{len(rows) if total is None else total}"
+            if method != 'GET' and 'return=representation' not in prefer:
+                status, content = (201 if method == 'POST' else 204), b''
+            else:
+                content = json.dumps([self._project(table, row, selected) for row in rows]).encode('utf-8')
+
+        except PostgrestError as e:
+            status, response_headers, content = e.status, {'Content-Type': 'application/json'}, \
+                json.dumps(e.body).encode('utf-8')
+        except json.JSONDecodeError as e:
+            status, response_headers, content = 400, {'Content-Type': 'application/json'}, \
+                json.dumps({'code': 'PGRST102', 'message': f'Empty or invalid json: {e}',
+                            'details': None, 'hint': None}).encode('utf-8')
+
+        with self._lock:
+            self.latencies.setdefault(method, []).append(time.perf_counter() - started)
+        return status, response_headers, content
+
+    # -- statements -------------------------------------------------------
+
+    def _table(self, path: str) -> str:
+        name = path.rstrip('/').rsplit('/', 1)[-1]
+        if not path.startswith('/rest/v1/') or name not in self.tables:
+            raise PostgrestError(404, '42P01', f'relation "public.{name}" does not exist')
+        return name
+
+    def _column(self, table: str, column: str) -> Dict:
+        spec = self.tables[table]['columns'].get(column)
+        if spec is None:
+            raise PostgrestError(400, 'PGRST204', f"Could not find the '{column}' column of '{table}' in the schema cache")
+        return spec
+
+    def _encode(self, table: str, column: str, value):
+        """Python value -> SQLite value, validating like Postgres would"""
+        spec = self._column(table, column)
+        if value is None:
+            return None
+        if spec['type'].endswith('[]') or spec['type'] == 'JSONB':
+            return json.dumps(value)
+        if spec['type'] == 'TIMESTAMPTZ':
+            try:
+                parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+            except ValueError:
+                raise PostgrestError(400, '22007', f'invalid input syntax for type timestamp with time zone: "{value}"')
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.astimezone(timezone.utc).isoformat()
+        if spec['type'] == 'BOOLEAN':
+            return int(value in (True, 'true'))
+        return value
+
+    def _decode(self, table: str, column: str, value):
+        spec = self.tables[table]['columns'][column]
+        if value is None:
+            return None
+        if spec['type'].endswith('[]') or spec['type'] == 'JSONB':
+            return json.loads(value)
+        if spec['type'] == 'BOOLEAN':
+            return bool(value)
+        return value
+
+    def _selected(self, table: str, select: str) -> Optional[List[str]]:
+        if select in ('', '*'):
+            return None
+        columns = [column.strip() for column in select.split(',')]
+        for column in columns:
+            self._column(table, column)
+        return columns
+
+    def _project(self, table: str, row: Dict, columns: Optional[List[str]]) -> Dict:
+        return {column: self._decode(table, column, row.get(column)) for column in columns or row}
+
+    def _where(self, table: str, params) -> Tuple[str, List]:
+        clauses, values = [], []
+        for column, condition in params:
+            if column in RESERVED_PARAMS:
+                continue
+            self._column(table, column)
+            negate = condition.startswith('not.')
+            operator, _, value = condition[4 if negate else 0:].partition('.')
+
+            if operator == 'is':
+                clause = f"{column} IS {'NULL' if value == 'null' else int(value == 'true')}"
+            elif operator == 'in':
+                items = [unquote(item).strip('"') for item in value.strip('()').split(',') if item]
+                clause = f"{column} IN ({', '.join('?' * len(items))})"
+                values += [self._encode(table, column, item) for item in items]
+            elif operator == 'like':
+                # GLOB is case-sensitive like Postgres LIKE; PostgREST uses * as the wildcard
+                clause = f"{column} GLOB ?"
+                values.append(value.replace('%', '*'))
+            elif operator == 'ilike':
+                clause = f"{column} LIKE ?"
+                values.append(value.replace('*', '%'))
+            elif operator in FILTER_OPERATORS:
+                clause = f"{column} {FILTER_OPERATORS[operator]} ?"
+                values.append(self._encode(table, column, value))
+            else:
+                raise PostgrestError(400, 'PGRST100', f'unknown operator "{operator}" in filter on {column}')
+            clauses.append(f"NOT ({clause})" if negate else clause)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', values
+
+    def _rows(self, table: str, sql: str, values: List) -> List[Dict]:
+        cursor = self._db.execute(sql, values)
+        names = [description[0] for description in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def _select(self, table: str, params) -> List[Dict]:
+        options = dict(params)
+        where, values = self._where(table, params)
+
+        order = ''
+        if options.get('order'):
+            terms = []
+            for term in options['order'].split(','):
+                column, *modifiers = term.split('.')
+                self._column(table, column)
+                terms.append(f"{column} {'DESC' if 'desc' in modifiers else 'ASC'}"
+                             f"{' NULLS FIRST' if 'nullsfirst' in modifiers else ''}")
+            order = ' ORDER BY ' + ', '.join(terms)
+
+        limit = f" LIMIT {int(options['limit'])}" if options.get('limit') else ' LIMIT -1'
+        offset = f" OFFSET {int(options['offset'])}" if options.get('offset') else ''
+        return self._rows(table, f"SELECT * FROM {table}{where}{order}{limit}{offset}", values)
+
+    def _fill_defaults(self, table: str, row: Dict) -> Dict:
+        filled = dict(row)
+        stamp = now_iso()
+        for column, spec in self.tables[table]['columns'].items():
+            if column in filled or spec['default'] is None:
+                continue
+            if spec['default'] == 'gen_random_uuid()':
+                filled[column] = str(uuid.uuid4())
+            elif spec['default'] == 'NOW()':
+                filled[column] = stamp
+            elif spec['default'].startswith("'"):
+                filled[column] = json.loads(spec['default'][1:-1].replace("''", "'"))
+        return filled
+
+    def _integrity_error(self, table: str, error: sqlite3.IntegrityError, row: Dict) -> PostgrestError:
+        message = str(error)
+        if 'UNIQUE' in message:
+            columns = tuple(part.split('.')[-1].strip() for part in message.split(':', 1)[1].split(','))
+            key = ', '.join(str(row.get(column)) for column in columns)
+            return PostgrestError(409, '23505',
+                                  f'duplicate key value violates unique constraint "{table}_{"_".join(columns)}_key"',
+                                  f"Key ({', '.join(columns)})=({key}) already exists.")
+        if 'NOT NULL' in message:
+            column = message.rsplit('.', 1)[-1]
+            return PostgrestError(400, '23502', f'null value in column "{column}" of relation "{table}" '
+                                                f'violates not-null constraint')
+        return PostgrestError(400, '23514', f'new row for relation "{table}" violates check constraint',
+                              message)
+
+    def _insert(self, table: str, params, prefer, payload) -> List[Dict]:
+        rows = payload if isinstance(payload, list) else [payload]
+        if not rows:
+            return []
+        keys = set(rows[0])
+        if any(set(row) != keys for row in rows):
+            raise PostgrestError(400, 'PGRST102', 'All object keys must match')
+        for key in keys:
+            self._column(table, key)
+
+        options = dict(params)
+        conflict = tuple(options['on_conflict'].split(',')) if options.get('on_conflict') else None
+        merge = 'resolution=merge-duplicates' in prefer
+        ignore = 'resolution=ignore-duplicates' in prefer
+        if (merge or ignore) and conflict is None:
+            conflict = self.tables[table]['unique'][0]
+
+        saved = []
+        row = None
+        # One statement per request in PostgREST: a failing row rolls back the batch
+        try:
+            for row in rows:
+                filled = self._fill_defaults(table, row)
+                columns = list(filled)
+                sql = (f"INSERT INTO {table} ({', '.join(columns)}) "
+                       f"VALUES ({', '.join('?' * len(columns))})")
+                if conflict and (merge or ignore):
+                    if ignore:
+                        sql += f" ON CONFLICT ({', '.join(conflict)}) DO NOTHING"
+                    else:
+                        updates = [f"{column} = excluded.{column}" for column in row if column not in conflict]
+                        if 'updated_at' in self.tables[table]['columns'] and 'updated_at' not in row:
+                            updates.append(f"updated_at = '{now_iso()}'")
+                        sql += f" ON CONFLICT ({', '.join(conflict)}) DO UPDATE SET {', '.join(updates)}"
+                sql += " RETURNING *"
+                saved += self._rows(table, sql, [self._encode(table, column, filled[column]) for column in columns])
+        except sqlite3.IntegrityError as e:
+            self._db.rollback()
+            raise self._integrity_error(table, e, row)
+        except PostgrestError:
+            self._db.rollback()
+            raise
+        return saved
+
+    def _update(self, table: str, params, payload) -> List[Dict]:
+        if not isinstance(payload, dict):
+            raise PostgrestError(400, 'PGRST102', 'PATCH body must be a single object')
+        changes = dict(payload)
+        if 'updated_at' in self.tables[table]['columns'] and 'updated_at' not in changes:
+            changes['updated_at'] = now_iso()
+
+        where, values = self._where(table, params)
+        assignments = ', '.join(f"{column} = ?" for column in changes)
+        try:
+            return self._rows(table, f"UPDATE {table} SET {assignments}{where} RETURNING *",
+                              [self._encode(table, column, value) for column, value in changes.items()] + values)
+        except sqlite3.IntegrityError as e:
+            self._db.rollback()
+            raise self._integrity_error(table, e, payload)
+
+    def _delete(self, table: str, params) -> List[Dict]:
+        where, values = self._where(table, params)
+        return self._rows(table, f"DELETE FROM {table}{where} RETURNING *", values)
+
+    # -- metrics ----------------------------------------------------------
+
+    def count(self, table: str = 'hackathons') -> int:
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    @property
+    def requests(self) -> int:
+        with self._lock:
+            return sum(len(latencies) for latencies in self.latencies.values())
+
+    def stats(self) -> Dict[str, Dict]:
+        """Request count and p50/p95/max latency (ms) per HTTP method"""
+        with self._lock:
+            snapshot = {method: sorted(latencies) for method, latencies in self.latencies.items()}
+        return {
+            method: {
+                'requests': len(latencies),
+                'p50_ms': round(latencies[len(latencies) // 2] * 1000, 2),
+                'p95_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 2),
+                'max_ms': round(latencies[-1] * 1000, 2),
+            }
+            for method, latencies in snapshot.items() if latencies
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.latencies.clear()
+
+
+def serve(database: str = ':memory:', host: str = '127.0.0.1', port: int = 54321,
+          fake: Optional[FakeSupabase] = None) -> Tuple[ThreadingHTTPServer, FakeSupabase]:
+    """Start a local HTTP server for ``fake`` on a daemon thread; port 0 picks a free one"""
+    fake = fake or FakeSupabase(database)
+
+    class Handler(BaseHTTPRequestHandler):
+        def _serve(self):
+            parts = urlsplit(self.path)
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length) if length else None
+            status, headers, content = fake.handle(self.command, parts.path, parts.query, self.headers, body)
+
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = do_PATCH = do_DELETE = _serve
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, fake
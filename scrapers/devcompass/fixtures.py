@@ -0,0 +1,155 @@
+"""
+Fixture Store - records raw source payloads and replays them offline
+
+HTTP responses are captured by a requests transport adapter and stored under
+``<root>/v<FIXTURE_VERSION>/<host>/<key>.json`` (metadata) plus
+``<key>.body`` (raw bytes). The key ignores query-parameter order, so a
+replayed request matches its recording however the params were built.
+Rendered Playwright pages are stored the same way as ``.html`` files.
+
+ReplayAdapter serves the stored responses back through a normal
+requests.Session, so every fetcher and adapter runs unchanged without
+network access.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+# Bump when the on-disk layout changes; old recordings stay readable side by side
+FIXTURE_VERSION = 1
+
+DEFAULT_FIXTURE_DIR = os.getenv('SCRAPE_FIXTURE_DIR', 'fixtures')
+
+
+class FixtureMissing(requests.ConnectionError):
+    """Raised by ReplayAdapter for a request that was never recorded"""
+
+
+def fixture_key(method: str, url: str, body=None) -> str:
+    """Key for a request: method, URL without query, sorted query params and body"""
+    parts = urlsplit(url)
+    query = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', errors='replace')
+    material = json.dumps([method.upper(), f'{parts.scheme}://{parts.netloc}{parts.path}', query, body or None])
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class FixtureStore:
+    """Versioned directory of recorded responses and pages"""
+
+    def __init__(self, root: str = DEFAULT_FIXTURE_DIR, version: int = FIXTURE_VERSION):
+        self.root = Path(root) / f'v{version}'
+
+    def _paths(self, url: str, key: str) -> Tuple[Path, Path]:
+        directory = self.root / (urlsplit(url).netloc or 'local')
+        return directory / f'{key}.json', directory / f'{key}.body'
+
+    def save_response(self, method: str, url: str, body, status: int,
+                      headers: Dict[str, str], content: bytes):
+        key = fixture_key(method, url, body)
+        meta_path, body_path = self._paths(url, key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+
+        body_path.write_bytes(content)
+        meta_path.write_text(json.dumps({
+            'method': method.upper(),
+            'url': url,
+            'status': status,
+            'content_type': headers.get('Content-Type', 'application/json'),
+        }, indent=2))
+
+    def save_json(self, method: str, url: str, payload, params: Optional[Dict] = None, body=None):
+        """Store a JSON payload as if it had been recorded (used for synthetic fixtures)"""
+        if params:
+            url = f'{url}?{urlencode(params)}'
+        self.save_response(method, url, body, 200, {'Content-Type': 'application/json'},
+                           json.dumps(payload).encode('utf-8'))
+
+    def load_response(self, method: str, url: str, body=None) -> Optional[Tuple[Dict, bytes]]:
+        meta_path, body_path = self._paths(url, fixture_key(method, url, body))
+        if not meta_path.exists():
+            return None
+        return json.loads(meta_path.read_text()), body_path.read_bytes()
+
+    def save_html(self, url: str, html: str):
+        key = fixture_key('GET', url)
+        meta_path, _ = self._paths(url, key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        meta_path.with_suffix('.html').write_text(html, encoding='utf-8')
+
+    def load_html(self, url: str) -> Optional[str]:
+        meta_path, _ = self._paths(url, fixture_key('GET', url))
+        html_path = meta_path.with_suffix('.html')
+        return html_path.read_text(encoding='utf-8') if html_path.exists() else None
+
+    def iter_payloads(self, host: str) -> Iterator[Tuple[Dict, bytes]]:
+        """Every recorded response for one host"""
+        directory = self.root / host
+        for meta_path in sorted(directory.glob('*.json')):
+            yield json.loads(meta_path.read_text()), meta_path.with_suffix('.body').read_bytes()
+
+    def hosts(self) -> List[str]:
+        return sorted(path.name for path in self.root.iterdir()) if self.root.exists() else []
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter that stores every successful response it sends"""
+
+    def __init__(self, store: FixtureStore, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if response.status_code == 200:
+            self.store.save_response(request.method, request.url, request.body,
+                                     response.status_code, response.headers, response.content)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter that answers requests from a FixtureStore"""
+
+    def __init__(self, store: FixtureStore):
+        super().__init__()
+        self.store = store
+
+    def send(self, request, **kwargs):
+        recorded = self.store.load_response(request.method, request.url, request.body)
+        if recorded is None:
+            raise FixtureMissing(f"No fixture for {request.method} {request.url}", request=request)
+
+        meta, content = recorded
+        response = requests.Response()
+        response.status_code = meta['status']
+        response.headers['Content-Type'] = meta['content_type']
+        response._content = content
+        response.url = request.url
+        response.request = request
+        response.encoding = 'utf-8'
+        return response
+
+    def close(self):
+        pass
+
+
+def record_into(pool, store: FixtureStore):
+    """Make an HttpPool store every successful response in ``store``"""
+    adapter = RecordingAdapter(store)
+    pool.session.mount('https://', adapter)
+    pool.session.mount('http://', adapter)
+
+
+def replay_from(pool, store: FixtureStore, prefixes=('https://', 'http://')):
+    """Make an HttpPool answer requests for ``prefixes`` from ``store``"""
+    adapter = ReplayAdapter(store)
+    for prefix in prefixes:
+        pool.session.mount(prefix, adapter)
@@ -0,0 +1,169 @@
+"""
+HTTP Response Cache - on-disk cache with ETag/Last-Modified revalidation
+
+Responses that carry a validator are stored on disk, keyed by method, URL,
+params and body. The next request for the same key is sent as a conditional
+request; a 304 is answered from disk and flagged ``not_modified``, saving
+the download. Validators are stored as soon as a response arrives, before
+anything downstream has used it, so a 304 only says the page is the one
+last fetched, not that its rows were written: sources still parse it and
+leave skipping stored rows to the diff writer. The cache is bounded in size
+and evicts the least recently used entries first.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_CACHE_DIR = os.getenv('SCRAPE_CACHE_DIR', '.http_cache')
+DEFAULT_MAX_BYTES = int(float(os.getenv('SCRAPE_CACHE_MAX_MB', '200')) * 1024 * 1024)
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response built from a cache entry"""
+
+    def __init__(self, url: str, content: bytes, headers: Dict[str, str], not_modified: bool):
+        self.url = url
+        self.content = content
+        self.headers = headers
+        self.status_code = 200
+        self.not_modified = not_modified
+        self._json = None
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        if self._json is None:
+            self._json = json.loads(self.content)
+        return self._json
+
+    def raise_for_status(self):
+        pass
+
+
+class ResponseCache:
+    """Size-bounded LRU response cache stored under one directory"""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self._db = sqlite3.connect(str(self.directory / 'index.sqlite'), check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                content_type TEXT,
+                size INTEGER NOT NULL,
+                accessed REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed)")
+        self._db.commit()
+
+    @staticmethod
+    def key(method: str, url: str, params=None, body=None) -> str:
+        """Cache key for a request"""
+        material = json.dumps([method.upper(), url, params, body], sort_keys=True, default=str)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f'{key}.body'
+
+    def _lookup(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, etag, last_modified, content_type FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or not self._body_path(key).exists():
+            return None
+        return {'url': row[0], 'etag': row[1], 'last_modified': row[2], 'content_type': row[3]}
+
+    def _store(self, key: str, response):
+        path = self._body_path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        # Write-then-rename so a crash never leaves a truncated body behind
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(response.content)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, response.url, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 response.headers.get('Content-Type'), len(response.content), time.time())
+            )
+            self._db.commit()
+        self.evict()
+
+    def _touch(self, key: str):
+        with self._lock:
+            self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        with self._lock:
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+
+            victims = []
+            for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY accessed"):
+                if total <= self.max_bytes:
+                    break
+                victims.append(key)
+                total -= size
+
+            self._db.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in victims])
+            self._db.commit()
+
+        for key in victims:
+            self._body_path(key).unlink(missing_ok=True)
+
+    def fetch(self, send, method: str, url: str, **kwargs):
+        """
+        Send a request through ``send`` (a requests-style callable), revalidating
+        against the cached copy when there is one
+
+        Returns:
+            A CachedResponse with not_modified=True on a 304, otherwise the
+            live response (stored first when it carries a validator)
+        """
+        key = self.key(method, url, kwargs.get('params'), kwargs.get('json', kwargs.get('data')))
+        entry = self._lookup(key)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        response = send(method, url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self._touch(key)
+            cached_headers = {'Content-Type': entry['content_type'] or 'application/json'}
+            return CachedResponse(entry['url'], self._body_path(key).read_bytes(), cached_headers,
+                                  not_modified=True)
+
+        if response.status_code == 200 and (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+            self._store(key, response)
+
+        return response
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,99 @@
+"""
+Shared HTTP Pool - one connection pool for every scraper with a per-host
+concurrency cap and an adaptive per-host request rate
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from devcompass.rate_limit import AdaptiveRateLimiter
+
+# Maximum number of in-flight requests against a single host
+DEFAULT_PER_HOST = int(os.getenv('SCRAPE_PER_HOST', '4'))
+
+# Default timeout (seconds) for every request made through the pool
+DEFAULT_TIMEOUT = 30
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+
+class HostLimiter:
+    """Caps the number of concurrent requests per host with one semaphore per host"""
+
+    def __init__(self, per_host: int = DEFAULT_PER_HOST):
+        self.per_host = max(1, per_host)
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    @contextmanager
+    def slot(self, url: str):
+        """Hold one of the host's request slots for the duration of the block"""
+        semaphore = self._semaphore(urlparse(url).netloc)
+        with semaphore:
+            yield
+
+
+class HttpPool:
+    """Thread-safe wrapper around a pooled requests.Session"""
+
+    def __init__(self, per_host: int = DEFAULT_PER_HOST, pool_size: int = 32,
+                 headers: Optional[Dict[str, str]] = None, cache=None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None):
+        self.limiter = HostLimiter(per_host)
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self.cache = cache
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+
+        # Keep enough pooled connections around for every worker thread
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method: str, url: str, use_cache: bool = False, **kwargs) -> requests.Response:
+        """
+        Send a request once a slot for the target host is free
+
+        With ``use_cache=True`` and a ResponseCache attached, the request is
+        revalidated against the cached copy; check ``response.not_modified``.
+        """
+        if use_cache and self.cache is not None:
+            return self.cache.fetch(self._send, method, url, **kwargs)
+        return self._send(method, url, **kwargs)
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        self.rate_limiter.acquire(url)
+        with self.limiter.slot(url):
+            response = self.session.request(method, url, **kwargs)
+        self.rate_limiter.record(url, response.status_code, response.headers.get('Retry-After'))
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
@@ -0,0 +1,94 @@
+"""
+JSON Array Streaming - yields the objects of a top-level JSON array as raw
+bytes while the body is still arriving
+
+Only the bytes of the current element are held in memory, so a large dump
+can be filtered item by item (e.g. with ``ends_before`` on the raw bytes)
+before anything is decoded with json.loads.
+"""
+
+import re
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, Optional
+
+# Characters that change the scanner's state; everything else is skipped in bulk
+_SPECIAL = re.compile(rb'[\[\]{}"\\]')
+_OPEN = frozenset(b'[{')
+_CLOSE = frozenset(b']}')
+_QUOTE = ord('"')
+_BACKSLASH = ord('\\')
+
+_END_RE = re.compile(rb'"end"\s*:\s*"([^"]+)"')
+
+
+def iter_array_objects(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Yield each object in a top-level JSON array, as raw bytes, from a stream
+    of chunks (e.g. ``response.iter_content(65536)``)
+
+    Scalars directly inside the array are skipped. Raises ValueError if the
+    document is not an array.
+    """
+    buffer = b''
+    position = 0       # where scanning resumes in buffer
+    skip_to = 0        # first index after an escaped character
+    depth = 0
+    in_string = False
+    start: Optional[int] = None
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+
+        for match in _SPECIAL.finditer(buffer, position):
+            index = match.start()
+            if index < skip_to:
+                continue
+            char = buffer[index]
+
+            if in_string:
+                if char == _BACKSLASH:
+                    skip_to = index + 2
+                elif char == _QUOTE:
+                    in_string = False
+                continue
+
+            if char == _QUOTE:
+                in_string = True
+            elif char in _OPEN:
+                if depth == 0 and char != ord('['):
+                    raise ValueError("expected a JSON array at the top level")
+                depth += 1
+                if depth == 2 and char == ord('{'):
+                    start = index
+            elif char in _CLOSE:
+                depth -= 1
+                if depth == 1 and start is not None:
+                    yield buffer[start:index + 1]
+                    start = None
+
+        # Keep only the unfinished element (if any) so memory stays bounded
+        keep_from = start if start is not None else len(buffer)
+        buffer = buffer[keep_from:]
+        skip_to = max(0, skip_to - keep_from)
+        if start is not None:
+            start = 0
+        position = len(buffer)
+
+    if depth != 0:
+        raise ValueError("JSON array ended before it was closed")
+
+
+def ends_before(raw: bytes, cutoff: datetime) -> bool:
+    """Whether a raw event object's "end" timestamp is before ``cutoff``, without decoding it"""
+    match = _END_RE.search(raw)
+    if not match:
+        return False
+    try:
+        end = datetime.fromisoformat(match.group(1).decode('ascii').replace('Z', '+00:00'))
+    except ValueError:
+        return False
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    return end < cutoff
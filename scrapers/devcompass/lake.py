@@ -0,0 +1,264 @@
+"""
+Raw Payload Lake - every raw item and rendered page a scrape has seen
+
+Items are stored content-addressed: the key is the SHA-256 of the item's
+canonical JSON (or of the page's HTML), so an item that comes back
+unchanged run after run is stored once and only its last-seen time moves.
+Each new blob is zlib-compressed and appended to a per-source segment file
+under ``<root>/segments/<source>/``; ``<root>/index.sqlite`` maps every key
+to its segment, offset and length plus first and last fetch times.
+
+``python -m devcompass reparse --source unstop --since 2026-01-01`` streams
+the stored items back through the current parser and the diff writer, so a
+parser fix reaches old events without touching the network.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_LAKE_DIR = os.getenv('SCRAPE_LAKE_DIR', '.raw_lake')
+
+# A segment is closed and a new one started beyond this size
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+# Items buffered by tap() before they are written in one transaction
+TAP_BATCH_SIZE = 500
+
+
+def item_key(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def encode_item(item: Dict) -> bytes:
+    """Canonical JSON: the same item always encodes (and hashes) the same"""
+    return json.dumps(item, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8')
+
+
+class RawLake:
+    """Content-addressed, compressed store of raw source payloads"""
+
+    def __init__(self, root: str = DEFAULT_LAKE_DIR, segment_max_bytes: int = SEGMENT_MAX_BYTES):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self._lock = threading.Lock()
+
+        self._db = sqlite3.connect(str(self.root / 'index.sqlite'), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS blobs (
+                key TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                url TEXT,
+                segment TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_blobs_source_seen ON blobs(source, kind, last_seen)")
+        self._db.commit()
+
+    # -- writing ------------------------------------------------------------
+
+    def _segment(self, source: str) -> Path:
+        """The segment new blobs for ``source`` are appended to"""
+        directory = self.root / 'segments' / source
+        directory.mkdir(parents=True, exist_ok=True)
+        segments = sorted(directory.glob('*.seg'))
+        if segments and segments[-1].stat().st_size < self.segment_max_bytes:
+            return segments[-1]
+        return directory / f'{len(segments):06d}.seg'
+
+    def _put(self, source: str, kind: str, blobs: List[Tuple[bytes, Optional[str]]],
+             fetched_at: Optional[float] = None) -> int:
+        """Store (data, url) blobs; returns how many were new"""
+        fetched_at = fetched_at or time.time()
+        keyed = {}
+        for data, url in blobs:
+            keyed.setdefault(item_key(data), (data, url))
+
+        with self._lock, self._db:
+            known = set()
+            keys = list(keyed)
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                known.update(key for (key,) in self._db.execute(
+                    f"SELECT key FROM blobs WHERE key IN ({','.join('?' * len(batch))})", batch))
+            if known:
+                self._db.executemany("UPDATE blobs SET last_seen = ? WHERE key = ?",
+                                     [(fetched_at, key) for key in known])
+
+            new = [(key, data, url) for key, (data, url) in keyed.items() if key not in known]
+            if not new:
+                return 0
+
+            segment = self._segment(source)
+            entries = []
+            with open(segment, 'ab') as f:
+                offset = f.tell()
+                for key, data, url in new:
+                    compressed = zlib.compress(data, 6)
+                    f.write(compressed)
+                    entries.append((key, source, kind, url, str(segment.relative_to(self.root)), offset,
+                                    len(compressed), len(data), fetched_at, fetched_at))
+                    offset += len(compressed)
+            self._db.executemany("INSERT INTO blobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", entries)
+            return len(new)
+
+    def put_items(self, source: str, items: Iterable[Dict], fetched_at: Optional[float] = None) -> int:
+        """Store raw items; returns how many were not stored before"""
+        return self._put(source, 'item', [(encode_item(item), None) for item in items], fetched_at)
+
+    def put_page(self, source: str, url: str, html: str, fetched_at: Optional[float] = None) -> int:
+        """Store one rendered HTML page"""
+        return self._put(source, 'html', [(html.encode('utf-8'), url)], fetched_at)
+
+    def tap(self, source: str, items: Iterable[Dict], batch_size: int = TAP_BATCH_SIZE) -> Iterator[Dict]:
+        """Pass ``items`` through unchanged, storing them in batches on the way"""
+        batch = []
+        try:
+            for item in items:
+                # Encoded before it is handed on, in case a parser mutates it
+                batch.append((encode_item(item), None))
+                if len(batch) >= batch_size:
+                    self._put(source, 'item', batch)
+                    batch = []
+                yield item
+        finally:
+            # Whatever was fetched before a failure is still worth keeping
+            if batch:
+                self._put(source, 'item', batch)
+
+    # -- reading ------------------------------------------------------------
+
+    def _entries(self, source: str, kind: str, since: Optional[float]) -> List[Tuple]:
+        sql = "SELECT segment, offset, length, url FROM blobs WHERE source = ? AND kind = ?"
+        params: List = [source, kind]
+        if since is not None:
+            sql += " AND last_seen >= ?"
+            params.append(since)
+        # Oldest sighting first, so the latest version of an item is handled last
+        sql += " ORDER BY last_seen, segment, offset"
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def _read(self, entries: List[Tuple]) -> Iterator[Tuple[bytes, Optional[str]]]:
+        handles = {}
+        try:
+            for segment, offset, length, url in entries:
+                if segment not in handles:
+                    handles[segment] = open(self.root / segment, 'rb')
+                f = handles[segment]
+                f.seek(offset)
+                yield zlib.decompress(f.read(length)), url
+        finally:
+            for f in handles.values():
+                f.close()
+
+    def iter_items(self, source: str, since: Optional[float] = None) -> Iterator[Dict]:
+        """Stored items for ``source`` last fetched at or after ``since`` (epoch seconds)"""
+        for data, _ in self._read(self._entries(source, 'item', since)):
+            yield json.loads(data)
+
+    def iter_pages(self, source: str, since: Optional[float] = None) -> Iterator[Tuple[str, str]]:
+        """Stored (url, html) pages for ``source``"""
+        for data, url in self._read(self._entries(source, 'html', since)):
+            yield url, data.decode('utf-8')
+
+    def count(self, source: str, since: Optional[float] = None) -> int:
+        sql = "SELECT COUNT(*) FROM blobs WHERE source = ? AND kind = 'item'"
+        params: List = [source]
+        if since is not None:
+            sql += " AND last_seen >= ?"
+            params.append(since)
+        with self._lock:
+            return self._db.execute(sql, params).fetchone()[0]
+
+    def stats(self) -> Dict[str, Dict]:
+        """Blob count, raw and stored bytes per source and kind"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT source, kind, COUNT(*), SUM(size), SUM(length) FROM blobs GROUP BY source, kind").fetchall()
+        return {f'{source}/{kind}': {'blobs': count, 'raw_bytes': size, 'stored_bytes': length}
+                for source, kind, count, size, length in rows}
+
+    def close(self):
+        self._db.close()
+
+
+def parse_since(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds for --since: an ISO date/datetime (UTC unless given) or an age like 30d / 12h"""
+    from datetime import datetime, timezone
+
+    if not value:
+        return None
+    units = {'d': 86400, 'h': 3600, 'm': 60}
+    if value[-1:] in units and value[:-1].isdigit():
+        return time.time() - int(value[:-1]) * units[value[-1]]
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError(f"Invalid --since value: {value} (use e.g. 2026-01-01 or 30d)")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def reparse_into(lake: RawLake, source_name: str, writer, since: Optional[float] = None, workers: int = 1,
+                 batch_size: int = 20000) -> Dict:
+    """
+    Stream stored items through the current parser and the diff writer
+
+    Items are parsed ``batch_size`` at a time on up to ``workers``
+    processes; only rows whose content differs from what is stored are
+    written. A URL seen in several versions ends up with the one fetched
+    last, since items come back oldest sighting first.
+    """
+    from devcompass.parallel import parse_parallel
+    from devcompass.sync import load_fingerprints, plan_sync
+
+    fingerprints = load_fingerprints(writer, source_name)
+    report = {'items': 0, 'parsed': 0, 'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0,
+              'quarantined': 0}
+
+    def flush(items: List[Dict]):
+        rows = [row for row in parse_parallel(source_name, items, workers=workers, records=True) if row]
+        # The last version of a URL within the batch wins
+        latest = {row['original_url']: row for row in rows if row.get('original_url')}
+        plan = plan_sync(list(latest.values()), fingerprints)
+        report['items'] += len(items)
+        report['parsed'] += len(rows)
+        report['unchanged'] += len(plan['unchanged'])
+        changed = plan['insert'] + plan['update']
+        if changed:
+            result = writer.upsert(changed)
+            for key in ('inserted', 'updated', 'failed', 'quarantined'):
+                report[key] += result[key]
+            # Later batches compare against what this one wrote; a row that
+            # failed keeps its old fingerprint so a later version is retried
+            hashes = {row['original_url']: row['content_hash'] for row in changed}
+            fingerprints.update((url, hashes[url]) for url in result['saved'] if url in hashes)
+
+    batch = []
+    for item in lake.iter_items(source_name, since):
+        batch.append(item)
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+    print(f"Reparse {source_name}: {report['items']} stored items, {report['parsed']} parsed, "
+          f"{report['inserted']} new, {report['updated']} changed, {report['unchanged']} unchanged")
+    return report
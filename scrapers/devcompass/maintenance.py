@@ -0,0 +1,188 @@
+"""
+Maintenance Jobs - set-based bulk fixes to the hackathons table
+
+A job describes which rows it touches and how to change them; the runner
+picks the cheapest way to send it:
+
+    SetJob   every matching row gets the same values: one filtered PATCH
+    RowJob   values computed per row: a keyset read of only the needed
+             columns, then one PATCH per distinct change (id=in.(...)) or,
+             when most changes differ, bulk upserts keyed on original_url
+    RpcJob   the whole fix runs in the database as a Postgres function
+
+Writes go out on up to ``concurrency`` threads. With dry_run=True nothing is
+written; the report says how many rows would change and in how many
+requests.
+
+    python -m devcompass maintain --list
+    python -m devcompass maintain unstop-banners --dry-run
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_CONCURRENCY = 4
+
+# Ids per PATCH request; keeps the query string well under URL limits
+PATCH_BATCH_SIZE = 100
+
+# Rows per bulk upsert request
+UPSERT_BATCH_SIZE = 500
+
+# Columns a bulk upsert must carry so the (never used) insert side is valid
+UPSERT_KEY_COLUMNS = ('original_url', 'title', 'platform_source')
+
+DEFAULT_BANNER = "https://images.unsplash.com/photo-1517694712202-14dd9538aa97?w=800"
+
+
+class SetJob:
+    """Give every row matching ``filters`` the same ``values``"""
+
+    def __init__(self, name: str, description: str, filters: Dict[str, str], values: Dict):
+        self.name = name
+        self.description = description
+        self.filters = filters
+        self.values = values
+
+
+class RowJob:
+    """
+    Compute new values per row
+
+    ``transform(row)`` gets a row with ``columns`` and returns the columns
+    to change, or None to leave it alone.
+    """
+
+    def __init__(self, name: str, description: str, columns: List[str], filters: Dict[str, str],
+                 transform: Callable[[Dict], Optional[Dict]]):
+        self.name = name
+        self.description = description
+        self.columns = columns
+        self.filters = filters
+        self.transform = transform
+
+
+class RpcJob:
+    """Run a Postgres function that does the fix server-side"""
+
+    def __init__(self, name: str, description: str, function: str, params: Optional[Dict] = None):
+        self.name = name
+        self.description = description
+        self.function = function
+        self.params = params or {}
+
+
+def _patch_batches(changes: Dict[str, List[str]]) -> List[tuple]:
+    """(values, ids) per PATCH request, grouping rows that get identical values"""
+    batches = []
+    for encoded, ids in changes.items():
+        values = json.loads(encoded)
+        for start in range(0, len(ids), PATCH_BATCH_SIZE):
+            batches.append((values, ids[start:start + PATCH_BATCH_SIZE]))
+    return batches
+
+
+def _run_set(writer, job: SetJob, dry_run: bool, concurrency: int) -> Dict:
+    matched = writer.count(job.filters)
+    if not dry_run and matched:
+        writer.update(job.filters, job.values)
+    return {'matched': matched, 'changed': matched, 'requests': 1 if matched else 0, 'strategy': 'patch'}
+
+
+def _run_rows(writer, job: RowJob, dry_run: bool, concurrency: int) -> Dict:
+    columns = list(dict.fromkeys(['id', *UPSERT_KEY_COLUMNS, *job.columns]))
+    matched = 0
+    changes: Dict[str, List[str]] = {}
+    upserts: List[Dict] = []
+    for row in writer.select_all(','.join(columns), filters=job.filters):
+        matched += 1
+        values = job.transform(row)
+        if not values:
+            continue
+        changes.setdefault(json.dumps(values, sort_keys=True, default=str), []).append(row['id'])
+        upserts.append({**{column: row[column] for column in UPSERT_KEY_COLUMNS}, **values})
+
+    changed = len(upserts)
+    patches = _patch_batches(changes)
+    upsert_requests = (changed + UPSERT_BATCH_SIZE - 1) // UPSERT_BATCH_SIZE
+    # Few distinct changes: one PATCH each; otherwise per-row values in bulk upserts
+    strategy = 'patch' if len(patches) <= upsert_requests else 'upsert'
+    report = {'matched': matched, 'changed': changed, 'strategy': strategy,
+              'requests': len(patches) if strategy == 'patch' else upsert_requests}
+    if dry_run or not changed:
+        return report
+
+    if strategy == 'patch':
+        send = [lambda values=values, ids=ids: writer.update({'id': f"in.({','.join(ids)})"}, values)
+                for values, ids in patches]
+    else:
+        chunks = [upserts[start:start + UPSERT_BATCH_SIZE] for start in range(0, changed, UPSERT_BATCH_SIZE)]
+        send = [lambda chunk=chunk: writer.upsert_chunk(chunk) for chunk in chunks]
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        results = list(executor.map(lambda call: call(), send))
+    report['failed'] = sum(result['failed'] for result in results if isinstance(result, dict))
+    return report
+
+
+def _run_rpc(writer, job: RpcJob, dry_run: bool, concurrency: int) -> Dict:
+    if dry_run:
+        return {'matched': None, 'changed': None, 'requests': 1, 'strategy': 'rpc'}
+    result = writer.rpc(job.function, job.params)
+    changed = result if isinstance(result, int) else None
+    return {'matched': changed, 'changed': changed, 'requests': 1, 'strategy': 'rpc', 'result': result}
+
+
+RUNNERS = {SetJob: _run_set, RowJob: _run_rows, RpcJob: _run_rpc}
+
+
+def run_job(writer, job, dry_run: bool = False, concurrency: int = DEFAULT_CONCURRENCY) -> Dict:
+    """Run one maintenance job and print what it did (or would do)"""
+    started = time.perf_counter()
+    report = RUNNERS[type(job)](writer, job, dry_run, concurrency)
+    report.update(job=job.name, dry_run=dry_run, seconds=round(time.perf_counter() - started, 2))
+
+    verb = 'would change' if dry_run else 'changed'
+    changed = '?' if report['changed'] is None else report['changed']
+    print(f"{job.name}: {verb} {changed} rows in {report['requests']} {report['strategy']} "
+          f"request{'s' if report['requests'] != 1 else ''} ({report['seconds']}s)"
+          f"{', ' + str(report['failed']) + ' failed' if report.get('failed') else ''}")
+    return report
+
+
+# -- built-in jobs ----------------------------------------------------------
+
+def _prize_fix(row: Dict) -> Optional[Dict]:
+    from devcompass.prizes import parse_prize_text, prize_columns
+
+    default = 'INR' if row.get('platform_source') == 'unstop' else 'USD'
+    columns = prize_columns(parse_prize_text(row['prize_money'], default)) if row.get('prize_money') else None
+    return columns if columns and columns['prize_amount_usd'] is not None else None
+
+
+def _theme_fix(row: Dict) -> Optional[Dict]:
+    from devcompass.themes import theme_ids
+
+    ids = theme_ids(row.get('themes'), row.get('title'), row.get('description'))
+    return {'theme_ids': ids} if ids else None
+
+
+JOBS = {
+    'unstop-banners': lambda: SetJob(
+        'unstop-banners', 'give Unstop hackathons without a banner the default image',
+        {'platform_source': 'eq.unstop', 'banner_url': 'is.null'}, {'banner_url': DEFAULT_BANNER}),
+    'prize-amounts': lambda: RowJob(
+        'prize-amounts', 'fill prize_amount_usd/prize_currency from prize_money text',
+        ['prize_money'], {'prize_amount_usd': 'is.null', 'prize_money': 'not.is.null'}, _prize_fix),
+    'theme-ids': lambda: RowJob(
+        'theme-ids', 'fill theme_ids from raw themes, title and description',
+        ['themes', 'description'], {'theme_ids': 'is.null'}, _theme_fix),
+}
+
+
+def load_job(name: str):
+    if name not in JOBS:
+        raise ValueError(f"Unknown job: {name} (available: {', '.join(JOBS)})")
+    return JOBS[name]()
@@ -0,0 +1,102 @@
+"""
+Scrape Orchestrator - runs every hackathon source concurrently
+
+Each source adapter fetches raw items and parses them into hackathons rows;
+the orchestrator streams them through a fetch -> parse -> write pipeline,
+shares one HTTP pool and one Supabase writer between sources and isolates
+failures so one broken source never stops the others.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from devcompass.clients import get_lake, get_pool, get_writer
+from devcompass.pipeline import run_pipeline
+from devcompass.registry import available_sources, load_source
+from devcompass.resilience import Deadline, Resilience, ResilientPool
+from devcompass.sync import load_fingerprints
+
+
+def run_source(name: str, pool, writer, deadline: Optional[Deadline] = None) -> Dict:
+    """Load, fetch, parse and sync one source; never raises"""
+    started = time.monotonic()
+    result = {'source': name, 'status': 'ok', 'fetched': 0, 'parsed': 0}
+
+    # Every network call the adapter makes goes through retries, the
+    # source's own circuit breaker and the shared run deadline
+    resilience = Resilience(name, deadline=deadline)
+
+    try:
+        source = load_source(name)
+        source.lake = get_lake()
+        fingerprints = load_fingerprints(writer, source.name)
+
+        # Raw items are kept in the lake on their way to the parser, so a
+        # later parser fix can be backfilled without refetching
+        items = source.fetch(ResilientPool(pool, resilience), set(fingerprints))
+        if source.lake is not None:
+            items = source.lake.tap(source.name, items)
+
+        # The adapter may find out mid-fetch that its listing is partial
+        report = run_pipeline(
+            items, source.parse, writer, source.name, fingerprints,
+            complete=lambda: source.complete, parse_many=source.parse_many,
+            item_url=source.item_url,
+        )
+        result['fetched'] = report['stages']['fetch']['items_out']
+        result['parsed'] = report['stages']['parse']['items_out']
+        for key in ('inserted', 'updated', 'unchanged', 'failed', 'quarantined', 'missing', 'stages'):
+            result[key] = report[key]
+
+        # Rows parsed before a fetch failure are still written, but the
+        # source is reported as failed
+        if 'error' in report:
+            raise RuntimeError(report['error'])
+
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = str(e)
+        print(f"[{name}] Source failed: {e}")
+
+    result['resilience'] = resilience.metrics()
+    result['seconds'] = round(time.monotonic() - started, 2)
+    return result
+
+
+def run_all(names: Optional[List[str]] = None) -> List[Dict]:
+    """Run the selected sources (all by default) concurrently"""
+    names = names or available_sources()
+    unknown = [name for name in names if name not in available_sources()]
+    if unknown:
+        raise ValueError(f"Unknown sources: {', '.join(unknown)} (available: {', '.join(available_sources())})")
+
+    pool = get_pool()
+    writer = get_writer()
+    deadline = Deadline()
+
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        futures = [executor.submit(run_source, name, pool, writer, deadline) for name in names]
+        return [future.result() for future in futures]
+
+
+def print_summary(results: List[Dict]):
+    print("\n=== Summary ===")
+    for result in results:
+        if result['status'] == 'ok':
+            print(f"{result['source']:<12} {result['parsed']:>5} parsed, {result['inserted']} new, "
+                  f"{result['updated']} updated, {result['unchanged']} unchanged"
+                  f"{', ' + str(result['quarantined']) + ' quarantined' if result.get('quarantined') else ''} "
+                  f"({result['seconds']}s)")
+        else:
+            print(f"{result['source']:<12} FAILED after {result['seconds']}s: {result['error']}")
+
+        network = result['resilience']
+        print(f"{'':<12} {network['attempts']} requests, {network['retries']} retries, "
+              f"breaker {network['breaker']}")
+
+        if 'stages' in result:
+            print(f"{'':<12} " + ', '.join(
+                f"{stage} {stats['per_second'] or 0:,.0f}/s (blocked {stats['blocked_seconds']}s)"
+                for stage, stats in result['stages'].items()
+            ))
@@ -0,0 +1,116 @@
+"""
+Write Outbox - local write-ahead log of rows on their way to Supabase
+
+Before a chunk is sent, its rows are staged in a SQLite file with
+increasing sequence numbers; once the server has taken (or rejected) a row
+it is acknowledged. A run that dies halfway leaves only the rows it never
+got an answer for unacknowledged, and ``python -m devcompass resume`` sends
+just those, so recovery costs what was left instead of a full refetch and
+re-parse.
+
+Acknowledging a URL also acknowledges any older staged copy of it, so a
+resume never replays stale content over a newer write.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_OUTBOX_PATH = os.getenv('SCRAPE_OUTBOX', '.outbox.sqlite')
+
+# Acknowledged entries are kept this long as a record of what was written
+KEEP_ACKED_DAYS = float(os.getenv('SCRAPE_OUTBOX_KEEP_DAYS', '7'))
+
+
+class Outbox:
+    """Durable, sequence-numbered staging area for upserted rows"""
+
+    def __init__(self, path: str = DEFAULT_OUTBOX_PATH, keep_acked_days: float = KEEP_ACKED_DAYS):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # A commit survives the process dying; only an OS crash can lose the last one
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                original_url TEXT NOT NULL,
+                platform_source TEXT,
+                row TEXT NOT NULL,
+                staged_at REAL NOT NULL,
+                acked_at REAL,
+                outcome TEXT
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_entries_pending ON entries(seq) WHERE acked_at IS NULL")
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_entries_url ON entries(original_url)")
+        self._db.commit()
+        self.prune(keep_acked_days)
+
+    def stage(self, rows: List[Dict]) -> List[int]:
+        """Append rows in one transaction and return their sequence numbers"""
+        now = time.time()
+        seqs = []
+        with self._lock, self._db:
+            for row in rows:
+                cursor = self._db.execute(
+                    "INSERT INTO entries (original_url, platform_source, row, staged_at) VALUES (?, ?, ?, ?)",
+                    (row['original_url'], row.get('platform_source'), json.dumps(row, default=str), now),
+                )
+                seqs.append(cursor.lastrowid)
+        return seqs
+
+    def ack(self, entries: Iterable[Tuple[str, int]], outcome: str = 'written'):
+        """
+        Acknowledge (original_url, seq) pairs, along with every older
+        unacknowledged entry for the same URL
+        """
+        now = time.time()
+        with self._lock, self._db:
+            self._db.executemany(
+                "UPDATE entries SET acked_at = ?, outcome = ? "
+                "WHERE original_url = ? AND seq <= ? AND acked_at IS NULL",
+                [(now, outcome, url, seq) for url, seq in entries],
+            )
+
+    def pending(self, platform_source: Optional[str] = None, after: int = 0,
+                limit: int = 500) -> List[Tuple[int, Dict]]:
+        """Up to ``limit`` unacknowledged (seq, row) pairs after ``after``, oldest first"""
+        sql = "SELECT seq, row FROM entries WHERE acked_at IS NULL AND seq > ?"
+        params: List = [after]
+        if platform_source:
+            sql += " AND platform_source = ?"
+            params.append(platform_source)
+        sql += " ORDER BY seq LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            return [(seq, json.loads(row)) for seq, row in self._db.execute(sql, params)]
+
+    def pending_count(self, platform_source: Optional[str] = None) -> int:
+        sql = "SELECT COUNT(*) FROM entries WHERE acked_at IS NULL"
+        params = []
+        if platform_source:
+            sql += " AND platform_source = ?"
+            params.append(platform_source)
+        with self._lock:
+            return self._db.execute(sql, params).fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """Entry counts by outcome ('pending' for unacknowledged)"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT COALESCE(outcome, 'pending'), COUNT(*) FROM entries GROUP BY 1").fetchall()
+        return dict(rows)
+
+    def prune(self, keep_acked_days: float = KEEP_ACKED_DAYS):
+        """Drop acknowledged entries older than ``keep_acked_days``"""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries WHERE acked_at IS NOT NULL AND acked_at < ?",
+                             (time.time() - keep_acked_days * 86400,))
+
+    def close(self):
+        self._db.close()
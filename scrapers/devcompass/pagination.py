@@ -0,0 +1,147 @@
+"""
+Pagination Engine - fetches the first page, then the remaining pages concurrently
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+# Number of pages fetched in parallel by default
+DEFAULT_MAX_WORKERS = int(os.getenv('SCRAPE_MAX_WORKERS', '4'))
+
+
+class IncompleteFetch(Exception):
+    """Some pages of a listing could not be fetched; the rows on them are unknown"""
+
+    def __init__(self, pages: List[int], errors: List[Exception]):
+        super().__init__(f"{len(pages)} page(s) failed ({', '.join(map(str, sorted(pages)))}): {errors[0]}")
+        self.pages = sorted(pages)
+        self.errors = errors
+
+
+def fetch_all_pages(
+    fetch_page: Callable[[int], Any],
+    last_page_of: Callable[[Any], int],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_pages: Optional[int] = None,
+) -> Iterator[Tuple[int, Any]]:
+    """
+    Yield (page_number, page) pairs for every page of a paginated endpoint
+
+    Page 1 is fetched first to learn the total page count; pages 2..N are then
+    fetched on a bounded thread pool and yielded as soon as each one arrives,
+    so callers can start parsing while the rest are still in flight.
+
+    A page that fails does not stop the others, but once they are all done
+    IncompleteFetch is raised with the failed page numbers: the listing is
+    partial, and its missing rows must not be taken as gone.
+
+    Args:
+        fetch_page: Fetches and decodes a single page (1-based)
+        last_page_of: Reads the total page count from the first page
+        max_workers: Upper bound on pages fetched at the same time
+        max_pages: Optional safety cap on the number of pages walked
+    """
+    first = fetch_page(1)
+    yield 1, first
+
+    last_page = last_page_of(first) or 1
+    if max_pages:
+        last_page = min(last_page, max_pages)
+    if last_page <= 1:
+        return
+
+    failed, errors = [], []
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        futures = {executor.submit(fetch_page, page): page for page in range(2, last_page + 1)}
+        for future in as_completed(futures):
+            page = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # One bad page should not throw away the rest of the run
+                print(f"Error fetching page {page}: {e}")
+                failed.append(page)
+                errors.append(e)
+                continue
+            yield page, result
+    finally:
+        # Stop queued pages if the caller stops consuming early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    if failed:
+        raise IncompleteFetch(failed, errors)
+
+
+def crawl_until_known(
+    fetch_page: Callable[[int], Any],
+    items_of: Callable[[Any], List[Any]],
+    is_known: Callable[[Any], bool],
+    last_page_of: Optional[Callable[[Any], Optional[int]]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_pages: Optional[int] = None,
+) -> Iterator[Tuple[int, List[Any]]]:
+    """
+    Walk a newest-first listing in page order and stop at the first known page
+
+    Pages are fetched through a sliding window of ``max_workers`` requests but
+    yielded strictly in order, as (page_number, items). The crawl ends after
+    the first page that is empty or whose items are all already known, which
+    for a "recently added" ordering means everything after it is known too.
+    Steady-state runs therefore cost one or two requests, while an empty
+    ``is_known`` set walks the whole catalogue.
+
+    A page that fails ends the crawl with its error: the pages after a hole
+    cannot be trusted to decide where the listing becomes known. Callers
+    should not write anything from a failed crawl either, or the next run
+    would stop at those rows and never reach the ones on the failed page.
+
+    Args:
+        fetch_page: Fetches and decodes a single page (1-based)
+        items_of: Extracts the list of items from a decoded page
+        is_known: Returns True for items we already hold
+        last_page_of: Optional total page count read from the first page
+        max_workers: Upper bound on pages fetched at the same time
+        max_pages: Optional safety cap on the number of pages walked
+    """
+    def exhausted(items: List[Any]) -> bool:
+        return not items or all(is_known(item) for item in items)
+
+    first = fetch_page(1)
+    items = items_of(first)
+    yield 1, items
+    if exhausted(items):
+        return
+
+    last_page = last_page_of(first) if last_page_of else None
+    if max_pages:
+        last_page = min(last_page, max_pages) if last_page else max_pages
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    pending = deque()
+    next_page = 2
+
+    def fill_window():
+        nonlocal next_page
+        while len(pending) < max_workers and (last_page is None or next_page <= last_page):
+            pending.append((next_page, executor.submit(fetch_page, next_page)))
+            next_page += 1
+
+    try:
+        fill_window()
+        while pending:
+            page, future = pending.popleft()
+            try:
+                items = items_of(future.result())
+            except Exception as e:
+                print(f"Error fetching page {page}: {e}")
+                raise
+
+            yield page, items
+            if exhausted(items):
+                return
+            fill_window()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
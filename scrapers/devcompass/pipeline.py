@@ -0,0 +1,360 @@
+"""
+Streaming Pipeline - fetch, parse and write stages connected by bounded queues
+
+Raw items flow from a source's fetch generator into a parse stage and from
+there into a batched diff writer, each stage on its own thread. The queues
+are bounded, so a slow stage pushes back on the one before it and memory
+stays flat however many pages a source has; meanwhile the first batches
+are written while later pages are still being fetched.
+
+When the writer has an outbox, the parse stage stages every new or changed
+row in it as soon as it is parsed, so a run that dies with rows still
+queued leaves them for ``python -m devcompass resume`` instead of losing
+everything past the batch in flight.
+
+Every stage reports items in/out, busy seconds (time spent doing its own
+work) and blocked seconds (time spent waiting on a full queue downstream).
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from devcompass.supabase_writer import SERVER_MANAGED_COLUMNS, SupabaseWriter
+from devcompass.sync import content_hash, plan_sync
+
+# Items each queue may hold before the stage feeding it has to wait
+DEFAULT_QUEUE_SIZE = int(os.getenv('SCRAPE_QUEUE_SIZE', '1000'))
+
+# Longest a partial batch waits for more rows before it is written anyway
+DEFAULT_FLUSH_INTERVAL = 2.0
+
+# Most raw items handed to a source's parse_many at once
+DEFAULT_PARSE_BATCH_SIZE = 500
+
+_DONE = object()
+
+
+class StageStats:
+    """Throughput counters for one pipeline stage"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy = 0.0
+        self.blocked = 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            'items_in': self.items_in,
+            'items_out': self.items_out,
+            'errors': self.errors,
+            'busy_seconds': round(self.busy, 3),
+            'blocked_seconds': round(self.blocked, 3),
+            'per_second': round(self.items_out / self.busy, 1) if self.busy else None,
+        }
+
+
+class Pipeline:
+    """One source's fetch -> parse -> write run"""
+
+    def __init__(self, writer: SupabaseWriter, platform_source: str, parse: Callable[[Dict], Optional[Dict]],
+                 fingerprints: Dict[str, Optional[str]], complete: Callable[[], bool] = lambda: True,
+                 batch_size: Optional[int] = None, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 parse_many: Optional[Callable[[List[Dict]], List[Optional[Dict]]]] = None,
+                 parse_batch_size: int = DEFAULT_PARSE_BATCH_SIZE,
+                 item_url: Optional[Callable[[Dict], Optional[str]]] = None):
+        self.writer = writer
+        self.platform_source = platform_source
+        self.parse = parse
+        self.parse_many = parse_many
+        self.parse_batch_size = max(1, parse_batch_size)
+        self.item_url = item_url
+        self.fingerprints = fingerprints
+        self.complete = complete
+        self.batch_size = batch_size or writer.chunk_size
+        self.flush_interval = flush_interval
+
+        self.raw = queue.Queue(maxsize=queue_size)
+        self.rows = queue.Queue(maxsize=queue_size)
+        self.stats = {name: StageStats(name) for name in ('fetch', 'parse', 'write')}
+        self.report = {'inserted': 0, 'updated': 0, 'failed': 0, 'quarantined': 0, 'unchanged': 0, 'missing': 0,
+                       'missing_urls': [], 'chunks': []}
+        self.seen = set()
+        # URLs the parse stage has staged in the writer's outbox this run
+        self.staged = set()
+        # Items that gave no row: their URLs when the source can tell them
+        # without parsing, else just how many there were
+        self.unparsed = set()
+        self.unparsed_unknown = 0
+        self.error: Optional[BaseException] = None
+        self._stop = threading.Event()
+
+    def _put(self, target: queue.Queue, item, stats: StageStats) -> bool:
+        """Block until ``target`` has room; False once the pipeline is stopping"""
+        started = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                try:
+                    target.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            stats.blocked += time.perf_counter() - started
+
+    def _get(self, source: queue.Queue):
+        """Next item from ``source``, or _DONE once the pipeline is stopping"""
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=0.5)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _fetch(self, items: Iterable[Dict]):
+        stats = self.stats['fetch']
+        iterator = iter(items)
+        try:
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    stats.busy += time.perf_counter() - started
+
+                stats.items_out += 1
+                if not self._put(self.raw, item, stats):
+                    break
+        except Exception as e:
+            stats.errors += 1
+            self.error = e
+        finally:
+            # Stops the source's own page workers if we left early
+            if hasattr(iterator, 'close'):
+                iterator.close()
+            self._put(self.raw, _DONE, stats)
+
+    def _parse_items(self, items: List[Dict]) -> List[Optional[Dict]]:
+        """Rows for ``items``, through parse_many when there is one"""
+        stats = self.stats['parse']
+        if self.parse_many is not None:
+            try:
+                return self.parse_many(items)
+            except Exception as e:
+                # Parse the batch item by item so one bad item only costs itself
+                print(f"[{self.platform_source}] Error parsing batch of {len(items)}, retrying one by one: {e}")
+
+        rows = []
+        for item in items:
+            try:
+                rows.append(self.parse(item))
+            except Exception as e:
+                stats.errors += 1
+                print(f"[{self.platform_source}] Error parsing item: {e}")
+                rows.append(None)
+        return rows
+
+    def _unparsed(self, item: Dict):
+        """Note an item that gave no row, so its stored row is not taken as gone"""
+        url = None
+        if self.item_url is not None:
+            try:
+                url = self.item_url(item)
+            except Exception:
+                url = None
+        if url:
+            self.unparsed.add(url)
+        else:
+            self.unparsed_unknown += 1
+
+    def _stage(self, rows: List[Dict]) -> List[Optional[int]]:
+        """
+        Stage the rows the write stage will send in the writer's outbox;
+        returns each row's outbox seq, None for rows that are not staged
+        """
+        outbox = self.writer.outbox
+        if outbox is None:
+            return [None] * len(rows)
+
+        positions, staged = [], []
+        for position, row in enumerate(rows):
+            url = row.get('original_url')
+            # Only the first copy of a URL is written in a run
+            if not url or url in self.staged:
+                continue
+            fingerprint = content_hash(row)
+            if url in self.fingerprints and self.fingerprints[url] == fingerprint:
+                continue
+            self.staged.add(url)
+            positions.append(position)
+            staged.append({**{key: value for key, value in row.items() if key not in SERVER_MANAGED_COLUMNS},
+                           'content_hash': fingerprint})
+
+        seqs: List[Optional[int]] = [None] * len(rows)
+        if staged:
+            for position, seq in zip(positions, outbox.stage(staged)):
+                seqs[position] = seq
+        return seqs
+
+    def _parse(self):
+        stats = self.stats['parse']
+        try:
+            done = False
+            while not done:
+                item = self._get(self.raw)
+                if item is _DONE:
+                    break
+                items = [item]
+                # Batch whatever is already waiting; never wait for more, so a
+                # slow fetch does not hold parsed rows back
+                while self.parse_many is not None and len(items) < self.parse_batch_size:
+                    try:
+                        item = self.raw.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _DONE:
+                        done = True
+                        break
+                    items.append(item)
+                stats.items_in += len(items)
+
+                started = time.perf_counter()
+                parsed = self._parse_items(items)
+                for item, row in zip(items, parsed):
+                    if not row:
+                        self._unparsed(item)
+                rows = [row for row in parsed if row]
+                seqs = self._stage(rows)
+                stats.busy += time.perf_counter() - started
+
+                for row, seq in zip(rows, seqs):
+                    stats.items_out += 1
+                    if not self._put(self.rows, (row, seq), stats):
+                        return
+        except Exception as e:
+            # A parser bug or an outbox failure ends the run like a fetch error
+            stats.errors += 1
+            if self.error is None:
+                self.error = e
+        finally:
+            self._put(self.rows, _DONE, stats)
+
+    def _write_batch(self, batch):
+        stats = self.stats['write']
+        started = time.perf_counter()
+
+        # plan_sync only dedupes within its input, so drop rows already
+        # written earlier in this run before planning
+        fresh, staged = [], {}
+        for row, seq in batch:
+            if row['original_url'] not in self.seen:
+                self.seen.add(row['original_url'])
+                fresh.append(row)
+                if seq is not None:
+                    staged[row['original_url']] = seq
+
+        plan = plan_sync(fresh, self.fingerprints)
+        self.report['unchanged'] += len(plan['unchanged'])
+        if plan['insert'] or plan['update']:
+            result = self.writer.upsert(plan['insert'] + plan['update'], staged=staged)
+            for key in ('inserted', 'updated', 'failed', 'quarantined'):
+                self.report[key] += result[key]
+            self.report['chunks'] += result['chunks']
+
+        stats.items_out += len(fresh)
+        stats.busy += time.perf_counter() - started
+
+    def _write(self):
+        stats = self.stats['write']
+        batch = []
+        batch_started = None
+
+        while True:
+            timeout = None
+            if batch:
+                timeout = max(0.0, self.flush_interval - (time.monotonic() - batch_started))
+            try:
+                entry = self.rows.get(timeout=timeout)
+            except queue.Empty:
+                entry = None
+
+            if entry is _DONE:
+                break
+            if entry is not None:
+                if not entry[0].get('original_url'):
+                    continue
+                stats.items_in += 1
+                if not batch:
+                    batch_started = time.monotonic()
+                batch.append(entry)
+
+            if batch and (len(batch) >= self.batch_size or entry is None):
+                self._write_batch(batch)
+                batch = []
+
+        if batch:
+            self._write_batch(batch)
+
+    def run(self, items: Iterable[Dict]) -> Dict:
+        """
+        Stream ``items`` through parse and write
+
+        Returns:
+            Writer report (inserted/updated/failed/quarantined/unchanged/missing) with
+            per-stage counters under 'stages' and any fetch or parse error under 'error'
+        """
+        threads = [
+            threading.Thread(target=self._fetch, args=(items,), name=f'{self.platform_source}-fetch', daemon=True),
+            threading.Thread(target=self._parse, name=f'{self.platform_source}-parse', daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            self._write()
+        finally:
+            # A failed write must not leave the other stages blocked on full queues
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+
+        # Rows that were not seen are only gone if the whole listing arrived
+        # and was parsed; an item that gave no row may still be listed
+        if self.error is None and self.complete() and not self.unparsed_unknown:
+            self.report['missing_urls'] = [url for url in self.fingerprints
+                                           if url not in self.seen and url not in self.unparsed]
+            self.report['missing'] = len(self.report['missing_urls'])
+        elif self.unparsed_unknown:
+            print(f"[{self.platform_source}] {self.unparsed_unknown} items gave no row; not reporting gone rows")
+
+        print(f"Sync {self.platform_source}: {self.report['inserted']} new, {self.report['updated']} changed, "
+              f"{self.report['unchanged']} unchanged, {self.report['missing']} gone from source"
+              f"{', ' + str(self.report['quarantined']) + ' quarantined' if self.report['quarantined'] else ''}")
+
+        self.report['stages'] = {name: stats.as_dict() for name, stats in self.stats.items()}
+        if self.error is not None:
+            self.report['error'] = str(self.error)
+        return self.report
+
+
+def run_pipeline(items: Iterable[Dict], parse: Callable[[Dict], Optional[Dict]], writer: SupabaseWriter,
+                 platform_source: str, fingerprints: Dict[str, Optional[str]],
+                 complete: Callable[[], bool] = lambda: True, **options) -> Dict:
+    """
+    Stream one source's raw items through parsing into the diff writer
+
+    Pass ``parse_many`` to have the parse stage hand over every raw item
+    already waiting (up to ``parse_batch_size``) in one call, and
+    ``item_url`` to read an item's original_url without parsing it, so an
+    item that fails to parse does not make its stored row look gone.
+    """
+    return Pipeline(writer, platform_source, parse, fingerprints, complete=complete, **options).run(items)
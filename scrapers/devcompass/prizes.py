@@ -0,0 +1,183 @@
+"""
+Prize Normalization - pulls a numeric amount and ISO currency out of every
+source's prize shape and converts it to USD for sorting and range filters
+
+Handles Unstop ``prizes`` lists (or their JSON-string form), Devpost
+``prize_amount`` HTML and ``total_prize_amount`` values, and free text like
+"Prize Pool: ₹50,000", "$25K in prizes" or "INR 1.5 Lakh". Conversion uses
+the local ``USD_RATES`` table, so parsing never calls out to a rate API.
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Approximate USD value of one unit of each currency. Only used to rank and
+# filter prizes, so it is refreshed by hand rather than fetched.
+USD_RATES = {
+    'USD': 1.0,
+    'INR': 0.012,
+    'EUR': 1.08,
+    'GBP': 1.27,
+    'CAD': 0.73,
+    'AUD': 0.66,
+    'SGD': 0.74,
+    'AED': 0.27,
+    'JPY': 0.0067,
+    'CNY': 0.14,
+    'CHF': 1.13,
+    'NGN': 0.00065,
+    'BRL': 0.18,
+}
+
+# Longest first: "US$" contains "S$" and "CA$" contains "A$", and every
+# prefixed dollar must be tried before the bare '$'
+CURRENCY_SYMBOLS = (
+    ('CA$', 'CAD'), ('AU$', 'AUD'), ('US$', 'USD'), ('C$', 'CAD'), ('A$', 'AUD'), ('S$', 'SGD'), ('R$', 'BRL'),
+    ('₹', 'INR'), ('€', 'EUR'), ('£', 'GBP'), ('¥', 'JPY'), ('₦', 'NGN'), ('$', 'USD'),
+)
+
+CURRENCY_WORDS = {
+    'rs': 'INR', 'inr': 'INR', 'rupee': 'INR', 'rupees': 'INR', 'fa-rupee': 'INR',
+    'usd': 'USD', 'dollar': 'USD', 'dollars': 'USD', 'fa-dollar': 'USD',
+    'eur': 'EUR', 'euro': 'EUR', 'euros': 'EUR', 'gbp': 'GBP', 'pound': 'GBP', 'pounds': 'GBP',
+    'cad': 'CAD', 'aud': 'AUD', 'sgd': 'SGD', 'aed': 'AED', 'jpy': 'JPY', 'cny': 'CNY',
+    'chf': 'CHF', 'ngn': 'NGN', 'brl': 'BRL',
+}
+
+MULTIPLIERS = {
+    'k': 1_000, 'thousand': 1_000,
+    'l': 100_000, 'lac': 100_000, 'lacs': 100_000, 'lakh': 100_000, 'lakhs': 100_000,
+    'cr': 10_000_000, 'crore': 10_000_000, 'crores': 10_000_000,
+    'm': 1_000_000, 'mn': 1_000_000, 'million': 1_000_000,
+}
+
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+# A number (with Western or Indian digit grouping) and an optional size word after it
+AMOUNT_RE = re.compile(
+    r'(?P<number>\d{1,3}(?:,\d{2,3})+(?:\.\d+)?|\d+(?:\.\d+)?)\s*'
+    r'(?P<multiplier>thousand|lakhs?|lacs?|crores?|million|mn|cr|k|l|m)?\b',
+    re.IGNORECASE)
+WORD_RE = re.compile(r'[a-z][a-z-]*', re.IGNORECASE)
+# Anything besides separators and the Indian "/-" suffix around a lone number
+NON_SPACE_RE = re.compile(r'[^\s/\-.,:]')
+
+Prize = Tuple[Optional[float], Optional[str]]
+
+
+def currency_code(value) -> Optional[str]:
+    """ISO code for a currency symbol, code, word or Unstop icon name"""
+    if not value:
+        return None
+    text = str(value).strip()
+    if text.upper() in USD_RATES:
+        return text.upper()
+    for symbol, code in CURRENCY_SYMBOLS:
+        if symbol in text:
+            return code
+    for word in WORD_RE.findall(text.lower()):
+        if word in CURRENCY_WORDS:
+            return CURRENCY_WORDS[word]
+    return None
+
+
+def _is_bare_count(value: float) -> bool:
+    """A lone number that reads as a year or a count rather than money"""
+    return value < 10 or (value.is_integer() and 1900 <= value <= 2100)
+
+
+@lru_cache(maxsize=4096)
+def parse_prize_text(text: str, default_currency: Optional[str] = None) -> Prize:
+    """
+    (amount, currency) for the largest amount in a prize string
+
+    "Prize Pool: ₹50,000" -> (50000.0, 'INR'); text without any amount gives
+    (None, None). A number only counts as an amount when a currency marker
+    sits right next to it, it carries a size word ("25K", "1.5 Lakh"), or
+    it is all the text there is ("50000", "50,000/-"); a lone year or a
+    count under ten does not. Amounts with no currency marker anywhere use
+    ``default_currency``.
+    """
+    if '<' in text:
+        text = HTML_TAG_RE.sub(' ', text)
+    amount, currency = None, None
+    for match in AMOUNT_RE.finditer(text):
+        value = float(match['number'].replace(',', ''))
+        # The symbol or code in front of or behind this number, if any
+        marker = (currency_code(text[:match.start()].rstrip()[-4:])
+                  or currency_code(text[match.end():].lstrip()[:8]))
+        if match['multiplier']:
+            value *= MULTIPLIERS[match['multiplier'].lower()]
+        elif not marker:
+            alone = not NON_SPACE_RE.search(text[:match.start()] + text[match.end():])
+            if not alone or _is_bare_count(value):
+                continue
+        if amount is None or value > amount:
+            amount, currency = value, marker
+    if not amount:
+        return None, None
+    return amount, currency or currency_code(text) or default_currency
+
+
+def unstop_prize_amount(item: Dict) -> Prize:
+    """Total cash across an Unstop item's prizes, in their currency (INR unless marked)"""
+    prizes = item.get('prizes')
+    if isinstance(prizes, str) and prizes.strip()[:1] in ('[', '{'):
+        try:
+            prizes = json.loads(prizes)
+        except ValueError:
+            pass
+
+    if isinstance(prizes, dict):
+        prizes = [prizes]
+    if isinstance(prizes, list):
+        total, currency = 0.0, None
+        for prize in prizes:
+            if not isinstance(prize, dict):
+                continue
+            cash = prize.get('cash') or prize.get('amount')
+            if isinstance(cash, str):
+                cash, marked = parse_prize_text(cash)
+                currency = currency or marked
+            if isinstance(cash, (int, float)) and cash > 0:
+                total += cash
+                currency = currency or currency_code(prize.get('currency'))
+        if total:
+            return total, currency or 'INR'
+        return None, None
+
+    for value in (prizes, item.get('prize_money'), item.get('total_prize')):
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+            return float(value), 'INR'
+        if isinstance(value, str) and value:
+            return parse_prize_text(value, 'INR')
+    return None, None
+
+
+def devpost_prize_amount(item: Dict) -> Prize:
+    """Amount from Devpost's ``prize_amount`` HTML or ``prizes.total_prize_amount``"""
+    prizes = item.get('prizes')
+    total = prizes.get('total_prize_amount') if isinstance(prizes, dict) else None
+    if isinstance(total, (int, float)) and total > 0:
+        return float(total), currency_code(prizes.get('currency')) or 'USD'
+    for value in (total, item.get('prize_amount')):
+        if isinstance(value, str) and value:
+            return parse_prize_text(value, 'USD')
+    return None, None
+
+
+def to_usd(amount: Optional[float], currency: Optional[str]) -> Optional[float]:
+    """``amount`` in USD, or None when the currency has no rate"""
+    if amount is None or currency not in USD_RATES:
+        return None
+    return round(amount * USD_RATES[currency], 2)
+
+
+def prize_columns(prize: Prize) -> Dict:
+    """The prize_amount_usd and prize_currency column values for a parsed prize"""
+    amount, currency = prize
+    return {
+        'prize_amount_usd': to_usd(amount, currency),
+        'prize_currency': currency if amount is not None else None,
+    }
@@ -0,0 +1,143 @@
+"""
+Adaptive Rate Limiter - one token bucket per host that speeds up while a site
+is healthy and backs off when it pushes back
+
+Callers take a token before each request (``acquire`` for threads,
+``acquire_async`` for asyncio) and report the outcome with ``record``.
+A 429/503 halves the host's rate and honours Retry-After; every healthy
+response adds a little rate back, up to ``max_rate``.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+# Requests per second each host starts at, and the bounds it moves between
+DEFAULT_RATE = float(os.getenv('SCRAPE_RATE', '5'))
+DEFAULT_MIN_RATE = 0.2
+DEFAULT_MAX_RATE = float(os.getenv('SCRAPE_MAX_RATE', '20'))
+
+BACKOFF_STATUSES = (429, 503)
+
+# Second-level labels under a country code that are not a site of their own
+# (example.co.uk, example.com.au)
+COUNTRY_SECOND_LEVELS = {'ac', 'co', 'com', 'edu', 'gov', 'net', 'org'}
+
+
+def host_key(url: str) -> str:
+    """Bucket key for one host: the URL's netloc"""
+    return urlparse(url).netloc or url
+
+
+def site_key(url: str) -> str:
+    """
+    Bucket key for a whole site: the registrable domain, so that
+    foo.devpost.com and bar.devpost.com share devpost.com's bucket
+    """
+    host = (urlparse(url).hostname or url).lower()
+    labels = host.split('.')
+    if len(labels) <= 2 or host.replace('.', '').isdigit():
+        return host
+    if len(labels[-1]) == 2 and labels[-2] in COUNTRY_SECOND_LEVELS:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token bucket whose refill rate can be changed on the fly"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            # Tokens may go negative: each waiter reserves its own future slot
+            self.tokens -= 1
+            wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+            return max(wait, self.blocked_until - now)
+
+
+class AdaptiveRateLimiter:
+    """
+    Per-host token buckets with multiplicative backoff and additive ramp-up
+
+    ``key`` maps a URL to its bucket: one per host by default, or one per
+    site with ``site_key`` for sites that spread pages over subdomains.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, min_rate: float = DEFAULT_MIN_RATE,
+                 max_rate: float = DEFAULT_MAX_RATE, burst: float = 2,
+                 increase: float = 0.25, decrease: float = 0.5, key: Callable[[str], str] = host_key):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.key = key
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = self.key(url)
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def acquire(self, url: str):
+        """Block the calling thread until the host allows another request"""
+        wait = self.bucket(url).reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, url: str):
+        """Wait (without blocking the event loop) until the host allows another request"""
+        wait = self.bucket(url).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record(self, url: str, status_code: int, retry_after: Optional[str] = None):
+        """Adjust the host's rate from the outcome of a request"""
+        bucket = self.bucket(url)
+        with bucket.lock:
+            if status_code in BACKOFF_STATUSES:
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+                delay = parse_retry_after(retry_after)
+                if delay is None:
+                    delay = 1 / bucket.rate
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+            elif status_code < 400:
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+    def rates(self) -> Dict[str, float]:
+        """Current requests-per-second for every host seen so far"""
+        with self._lock:
+            return {host: round(bucket.rate, 2) for host, bucket in self._buckets.items()}
@@ -0,0 +1,151 @@
+"""
+Hackathon Records - a compact, slotted row type for large batches
+
+A HackathonRecord holds one hackathons row in fixed slots instead of a
+per-row dict, and interns the strings that repeat across rows (platform,
+location mode, currency, themes), so a backfill holding tens of thousands of
+rows keeps one copy of each. It behaves as a mutable mapping, so the sync,
+writer and pipeline code that reads and stamps rows by key works unchanged.
+
+Only the columns a parser actually set are part of the mapping: a record
+built from a row without ``prize_currency`` serializes without that key,
+exactly like the dict it replaces.
+"""
+
+import sys
+from collections.abc import MutableMapping
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+class _Unset:
+    """Marks a column the parser did not set"""
+
+    def __repr__(self):
+        return '<unset>'
+
+    def __reduce__(self):
+        return '_UNSET'
+
+
+_UNSET: Any = _Unset()
+
+# Columns whose values come from a small fixed vocabulary
+INTERNED_COLUMNS = ('platform_source', 'location_mode', 'prize_currency')
+# List columns whose items repeat across many rows
+INTERNED_LIST_COLUMNS = ('themes', 'theme_ids')
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class HackathonRecord(MutableMapping):
+    title: Any = _UNSET
+    original_url: Any = _UNSET
+    platform_source: Any = _UNSET
+    id: Any = _UNSET
+    description: Any = _UNSET
+    short_summary: Any = _UNSET
+    banner_url: Any = _UNSET
+    prize_money: Any = _UNSET
+    prize_amount_usd: Any = _UNSET
+    prize_currency: Any = _UNSET
+    start_date: Any = _UNSET
+    end_date: Any = _UNSET
+    registration_deadline: Any = _UNSET
+    themes: Any = _UNSET
+    theme_ids: Any = _UNSET
+    eligibility: Any = _UNSET
+    location_mode: Any = _UNSET
+    content_hash: Any = _UNSET
+    canonical_id: Any = _UNSET
+    created_at: Any = _UNSET
+    updated_at: Any = _UNSET
+    # Columns outside the ones above, kept so conversion is lossless
+    extra: Optional[Dict] = None
+
+    def __post_init__(self):
+        for column in INTERNED_COLUMNS:
+            value = getattr(self, column)
+            if type(value) is str:
+                setattr(self, column, sys.intern(value))
+        for column in INTERNED_LIST_COLUMNS:
+            value = getattr(self, column)
+            if type(value) is list:
+                setattr(self, column, [sys.intern(item) if type(item) is str else item for item in value])
+
+    @classmethod
+    def from_row(cls, row: Dict) -> 'HackathonRecord':
+        if isinstance(row, cls):
+            return row
+        known = {key: value for key, value in row.items() if key in COLUMNS}
+        extra = {key: value for key, value in row.items() if key not in COLUMNS}
+        return cls(**known, extra=extra or None)
+
+    def to_row(self, exclude: Iterable[str] = ()) -> Dict:
+        """
+        The row as a plain dict for json.dumps; values are shared with the
+        record, not copied
+        """
+        row = {column: value for column in COLUMNS_ORDER
+               if (value := getattr(self, column)) is not _UNSET and column not in exclude}
+        if self.extra:
+            row.update((key, value) for key, value in self.extra.items() if key not in exclude)
+        return row
+
+    # -- mapping protocol ---------------------------------------------------
+
+    def __getitem__(self, key: str):
+        if key in COLUMNS:
+            value = getattr(self, key)
+            if value is not _UNSET:
+                return value
+        elif self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        if key in COLUMNS:
+            if key in INTERNED_COLUMNS and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in COLUMNS and getattr(self, key) is not _UNSET:
+            setattr(self, key, _UNSET)
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for column in COLUMNS_ORDER:
+            if getattr(self, column) is not _UNSET:
+                yield column
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"HackathonRecord({self.to_row()!r})"
+
+
+COLUMNS = frozenset(field.name for field in fields(HackathonRecord) if field.name != 'extra')
+# fields() order, for stable serialization
+COLUMNS_ORDER = tuple(field.name for field in fields(HackathonRecord) if field.name != 'extra')
+
+
+def as_records(rows: Iterable[Optional[Dict]]) -> List[Optional[HackathonRecord]]:
+    """Convert parsed rows to records, keeping None placeholders"""
+    return [HackathonRecord.from_row(row) if row is not None else None for row in rows]
+
+
+def json_default(value):
+    """``default=`` for json.dump: records serialize as their rows, anything else as str"""
+    if isinstance(value, HackathonRecord):
+        return value.to_row()
+    return str(value)
@@ -0,0 +1,31 @@
+"""
+Source Registry - maps source names to adapter classes that are imported on first use
+
+Only the adapters a command actually needs are imported, so parse-only
+commands never pay for Playwright, the Supabase client or unrelated sources.
+"""
+
+import importlib
+from typing import List
+
+# name -> "module:Class"; names double as platform_source values
+ADAPTERS = {
+    'unstop': 'devcompass.sources.unstop:UnstopSource',
+    'devpost': 'devcompass.sources.devpost:DevpostSource',
+    'hackclub': 'devcompass.sources.hackclub:HackClubSource',
+    'devfolio': 'devcompass.sources.devfolio:DevfolioSource',
+    'hackerearth': 'devcompass.sources.hackerearth:HackerEarthSource',
+}
+
+
+def available_sources() -> List[str]:
+    return list(ADAPTERS)
+
+
+def load_source(name: str):
+    """Import and instantiate the adapter registered under ``name``"""
+    if name not in ADAPTERS:
+        raise ValueError(f"Unknown source: {name} (available: {', '.join(ADAPTERS)})")
+
+    module_name, class_name = ADAPTERS[name].split(':')
+    return getattr(importlib.import_module(module_name), class_name)()
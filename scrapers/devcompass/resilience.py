@@ -0,0 +1,198 @@
+"""
+Resilience Layer - jittered retries, a per-source circuit breaker and a
+per-run deadline for every fetcher's network calls
+
+A transient timeout is retried instead of silently emptying a source, a dead
+endpoint trips the breaker so the remaining calls fail fast, and the run
+deadline caps how long any source can keep trying. The state of all three
+is exposed through ``Resilience.metrics()`` for the run summary.
+"""
+
+import os
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+# Statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Wall-clock budget for a whole scrape run, shared by every source
+DEFAULT_RUN_DEADLINE = float(os.getenv('SCRAPE_DEADLINE', '900'))
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a source whose breaker is open"""
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the run's time budget is used up"""
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter"""
+
+    def __init__(self, attempts: int = 4, base_delay: float = 0.5, max_delay: float = 15.0,
+                 retry_statuses=RETRY_STATUSES):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = retry_statuses
+
+    def delay(self, attempt: int) -> float:
+        """Sleep before retry number ``attempt`` (0-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code in self.retry_statuses
+        return False
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures, lets one probe through after a cool-down"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        # Half-open admits a single call until it reports back
+        self.probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def check(self):
+        """Raise CircuitOpenError unless a call may go through"""
+        with self._lock:
+            if self.state == 'open':
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"circuit open after {self.failures} consecutive failures")
+                self.state = 'half_open'
+            if self.state == 'half_open':
+                if self.probe_in_flight:
+                    raise CircuitOpenError("circuit half-open, waiting on the probe request")
+                self.probe_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+            self.probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.probe_in_flight = False
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """End a call that proved nothing about the host; a half-open breaker lets the next one probe"""
+        with self._lock:
+            self.probe_in_flight = False
+
+
+class Deadline:
+    """Fixed point in time after which no new attempts are started"""
+
+    def __init__(self, seconds: float = DEFAULT_RUN_DEADLINE):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def check(self):
+        if self.remaining() <= 0:
+            raise DeadlineExceeded("run deadline exceeded")
+
+
+class Resilience:
+    """Retry policy, circuit breaker and deadline for one source"""
+
+    def __init__(self, name: str, policy: Optional[RetryPolicy] = None,
+                 breaker: Optional[CircuitBreaker] = None, deadline: Optional[Deadline] = None):
+        self.name = name
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.deadline = deadline or Deadline()
+        self.stats = {'calls': 0, 'attempts': 0, 'retries': 0, 'failures': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def call(self, fn, *args, **kwargs):
+        """Call ``fn`` with retries on transient errors, honouring breaker and deadline"""
+        self._count('calls')
+
+        for attempt in range(self.policy.attempts):
+            self.deadline.check()
+            self.breaker.check()
+            self._count('attempts')
+
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                if not isinstance(e, Exception) or not self.policy.is_retryable(e):
+                    self.breaker.release()
+                    raise
+                self._count('failures')
+                self.breaker.record_failure()
+
+                if attempt == self.policy.attempts - 1:
+                    raise
+                delay = self.policy.delay(attempt)
+                if delay >= self.deadline.remaining():
+                    raise DeadlineExceeded(f"no time left to retry: {e}") from e
+
+                print(f"[{self.name}] Retrying in {delay:.1f}s after: {e}")
+                self._count('retries')
+                time.sleep(delay)
+                continue
+
+            self.breaker.record_success()
+            return result
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            stats = dict(self.stats)
+        stats['breaker'] = self.breaker.state
+        stats['deadline_remaining'] = round(self.deadline.remaining(), 1)
+        return stats
+
+
+class ResilientPool:
+    """HttpPool wrapper that sends every request through a source's Resilience"""
+
+    def __init__(self, pool, resilience: Resilience):
+        self.pool = pool
+        self.resilience = resilience
+
+    def request(self, method: str, url: str, **kwargs):
+        timeout = kwargs.pop('timeout', None) or 30
+
+        def send():
+            # Never let a single request outlive the run deadline
+            remaining = max(1.0, self.resilience.deadline.remaining())
+            response = self.pool.request(method, url, timeout=min(timeout, remaining), **kwargs)
+            if response.status_code in self.resilience.policy.retry_statuses:
+                raise requests.HTTPError(f"{response.status_code} from {url}", response=response)
+            return response
+
+        return self.resilience.call(send)
+
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.pool, name)
@@ -0,0 +1,3 @@
+"""
+Source adapters - one module per hackathon platform, loaded through devcompass.registry
+"""
@@ -0,0 +1,41 @@
+"""
+Common fetch/parse interface implemented by every hackathon source
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class Source:
+    """Base class for source adapters"""
+
+    # platform_source value written for this source's rows
+    name = ''
+
+    # Whether fetch() returns the source's whole listing; only then are
+    # stored rows that were not seen reported as gone
+    complete = True
+
+    # FixtureStore that browser-rendered sources record their pages into, or
+    # replay them from when ``replay`` is set (see devcompass.fixtures)
+    fixtures = None
+    replay = False
+
+    # RawLake that browser-rendered sources store their pages in (see
+    # devcompass.lake); raw items are stored by the orchestrator
+    lake = None
+
+    def fetch(self, pool, known_urls: Set[str]) -> Iterable[Dict]:
+        """Yield raw items from the source"""
+        raise NotImplementedError
+
+    def parse(self, item: Dict) -> Optional[Dict]:
+        """Turn one raw item into a hackathons row, or None to skip it"""
+        raise NotImplementedError
+
+    def item_url(self, item: Dict) -> Optional[str]:
+        """original_url a raw item is stored under, read without parsing it; None if unknown"""
+        return None
+
+    def parse_many(self, items: List[Dict]) -> List[Optional[Dict]]:
+        """Parse a batch of raw items; element i is the row (or None) for items[i]"""
+        return [self.parse(item) for item in items]
@@ -0,0 +1,20 @@
+"""
+Devfolio adapter - hackathon listing rendered with Playwright
+"""
+
+from devcompass.sources.base import Source
+from devfolio_scraper import parse_devfolio_hackathon, scrape_devfolio, scrape_with_browser
+
+
+class DevfolioSource(Source):
+    name = 'devfolio'
+
+    def fetch(self, pool, known_urls):
+        return scrape_with_browser(scrape_devfolio, fixtures=self.fixtures, replay=self.replay,
+                                   lake=self.lake, source=self.name)
+
+    def item_url(self, item):
+        return item.get('link') or None
+
+    def parse(self, item):
+        return parse_devfolio_hackathon(item)
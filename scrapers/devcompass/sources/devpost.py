@@ -0,0 +1,38 @@
+"""
+Devpost adapter - recently added hackathons, crawled until the first known page
+"""
+
+from devcompass.pagination import crawl_until_known
+from devcompass.sources.base import Source
+from devpost_live import devpost_items, devpost_last_page, fetch_devpost_response, parse_devpost_hackathon
+
+
+class DevpostSource(Source):
+    name = 'devpost'
+    complete = False  # the crawl stops at the first fully known page
+
+    def fetch(self, pool, known_urls):
+        pages = crawl_until_known(
+            lambda page: fetch_devpost_response(pool, page).json(),
+            devpost_items,
+            lambda item: isinstance(item, dict) and item.get('url', '') in known_urls,
+            last_page_of=devpost_last_page,
+        )
+        # Held back until the crawl ends cleanly: rows written from before a
+        # failed page would make the next crawl stop short of that page.
+        # Pages that came back 304 are parsed from the cached copy like the
+        # rest, so their items also pass through the lake tap
+        found = []
+        try:
+            for _, items in pages:
+                found.extend(items)
+        except Exception:
+            # Nothing is written from a failed crawl, but the items that did
+            # arrive were seen: keep them and move their last_seen forward
+            if self.lake is not None and found:
+                self.lake.put_items(self.name, found)
+            raise
+        yield from found
+
+    def parse(self, item):
+        return parse_devpost_hackathon(item)
@@ -0,0 +1,24 @@
+"""
+Hack Club adapter - upcoming events from the public events API
+"""
+
+from devcompass.sources.base import Source
+from hackclub_scraper import parse_hackclub_hackathon
+
+HACKCLUB_UPCOMING_URL = "https://hackathons.hackclub.com/api/events/upcoming/"
+
+
+class HackClubSource(Source):
+    name = 'hackclub'
+    complete = False  # only upcoming events are listed
+
+    def fetch(self, pool, known_urls):
+        response = pool.get(HACKCLUB_UPCOMING_URL, use_cache=True)
+        response.raise_for_status()
+        # A 304 is answered from the cached copy, which is parsed as usual;
+        # rows already stored unchanged are dropped by the diff writer
+        data = response.json()
+        return data if isinstance(data, list) else data.get('events', [])
+
+    def parse(self, item):
+        return parse_hackclub_hackathon(item)
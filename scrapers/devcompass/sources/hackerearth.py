@@ -0,0 +1,20 @@
+"""
+HackerEarth adapter - hackathon challenge listing rendered with Playwright
+"""
+
+from devcompass.sources.base import Source
+from devfolio_scraper import parse_hackerearth_hackathon, scrape_hackerearth, scrape_with_browser
+
+
+class HackerEarthSource(Source):
+    name = 'hackerearth'
+
+    def fetch(self, pool, known_urls):
+        return scrape_with_browser(scrape_hackerearth, fixtures=self.fixtures, replay=self.replay,
+                                   lake=self.lake, source=self.name)
+
+    def item_url(self, item):
+        return item.get('link') or None
+
+    def parse(self, item):
+        return parse_hackerearth_hackathon(item)
@@ -0,0 +1,31 @@
+"""
+Unstop adapter - every page of the public search-result API
+"""
+
+from devcompass.normalize import normalize_unstop, unstop_listing_url
+from devcompass.pagination import fetch_all_pages
+from devcompass.sources.base import Source
+from unstop_api import fetch_unstop_page, parse_unstop_hackathon, unstop_last_page
+
+
+class UnstopSource(Source):
+    name = 'unstop'
+
+    def fetch(self, pool, known_urls):
+        # Pages are decoded once; the first one also gives the page count.
+        # A 304 page is served from the cached copy and parsed like any other:
+        # its validators were cached before its rows were written, so a run
+        # that died in between would otherwise skip those rows for good. The
+        # diff writer drops the rows that are already stored unchanged.
+        pages = fetch_all_pages(lambda page: fetch_unstop_page(pool, page), unstop_last_page)
+        for page, data in pages:
+            yield from data.get('data', {}).get('data', [])
+
+    def parse(self, item):
+        return parse_unstop_hackathon(item)
+
+    def item_url(self, item):
+        return unstop_listing_url(item)
+
+    def parse_many(self, items):
+        return normalize_unstop(items)
@@ -0,0 +1,339 @@
+"""
+Supabase Writer - chunked bulk upserts into the hackathons table keyed on original_url
+
+A chunk the server rejects for its data (a CHECK or NOT NULL violation, a
+bad timestamp) is split in half and retried until the offending rows are
+isolated. Those rows are quarantined with the server's error and every
+other row is still written, so one dirty row costs a few extra requests
+instead of the rest of the run.
+
+Rows are first checked against the table's schema (see devcompass.validate);
+rows that would be rejected are quarantined without being sent, so the
+chunks that go out are full of rows the database will take.
+
+With an outbox (see devcompass.outbox) every row is staged locally before
+it is sent (the streaming pipeline stages rows as they are parsed) and
+acknowledged once the server has taken, rejected or permanently refused
+it, so ``resume`` can finish the writes of a run that died halfway.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from devcompass.http_pool import HttpPool
+from devcompass.validate import load_validator
+
+load_dotenv()
+
+# Rows sent per upsert request
+DEFAULT_CHUNK_SIZE = int(os.getenv('SUPABASE_CHUNK_SIZE', '500'))
+
+# Columns the database fills in itself. Sending them would overwrite the
+# primary key of an existing row on conflict and break the inserted/updated
+# accounting below, which relies on created_at == updated_at for new rows.
+SERVER_MANAGED_COLUMNS = ('id', 'created_at', 'updated_at')
+
+# Statuses that blame the payload, so splitting it can isolate the bad rows
+BISECT_STATUSES = (400, 409, 422)
+
+# Errors that apply to the payload's shape rather than any one row (unknown
+# column, mismatched keys); bisecting would only quarantine every row
+SHAPE_ERROR_CODES = ('PGRST204', 'PGRST102')
+
+# Append quarantined rows here as JSON lines (kept in memory only when unset)
+DEFAULT_QUARANTINE_FILE = os.getenv('SCRAPE_QUARANTINE_FILE') or None
+
+
+class SupabaseWriter:
+    """Writes hackathons through PostgREST with one bulk upsert per chunk"""
+
+    def __init__(self, supabase_url: Optional[str] = None, service_key: Optional[str] = None,
+                 pool: Optional[HttpPool] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 table: str = 'hackathons', quarantine_file: Optional[str] = DEFAULT_QUARANTINE_FILE,
+                 validate: bool = True, outbox=None):
+        self.supabase_url = supabase_url or os.getenv('SUPABASE_URL')
+        self.service_key = service_key or os.getenv('SUPABASE_SERVICE_KEY')
+
+        if not self.supabase_url or not self.service_key:
+            raise ValueError("Missing Supabase credentials in environment variables")
+
+        self.pool = pool or HttpPool()
+        self.chunk_size = max(1, chunk_size)
+        self.table_url = f"{self.supabase_url.rstrip('/')}/rest/v1/{table}"
+        self.validator = load_validator(table) if validate else None
+        self.outbox = outbox
+
+        # Rows the server rejected on their own, with its error
+        self.quarantine: List[Dict] = []
+        self.quarantine_file = quarantine_file
+        self._quarantine_lock = threading.Lock()
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {
+            'apikey': self.service_key,
+            'Authorization': f'Bearer {self.service_key}',
+            'Content-Type': 'application/json',
+        }
+
+    def select_all(self, columns: str, filters: Optional[Dict[str, str]] = None,
+                   key: str = 'original_url', page_size: int = 1000) -> Iterator[Dict]:
+        """
+        Stream every matching row using keyset pagination on a unique column
+
+        Each request asks for the next ``page_size`` rows after the last key
+        seen, so the read never falls off PostgREST's row cap and stays on
+        the index however deep it goes.
+        """
+        last_key = None
+        while True:
+            params = {'select': columns, 'order': f'{key}.asc', 'limit': page_size, **(filters or {})}
+            if last_key is not None:
+                params[key] = f'gt.{last_key}'
+
+            response = self.pool.get(self.table_url, params=params, headers=self.headers)
+            response.raise_for_status()
+            rows = response.json()
+
+            yield from rows
+            if len(rows) < page_size:
+                return
+            last_key = rows[-1][key]
+
+    def count(self, filters: Optional[Dict[str, str]] = None) -> int:
+        """Number of rows matching PostgREST ``filters``, without reading them"""
+        response = self.pool.get(
+            self.table_url,
+            params={'select': 'id', 'limit': 1, **(filters or {})},
+            headers={**self.headers, 'Prefer': 'count=exact'},
+        )
+        response.raise_for_status()
+        # Content-Range: 0-0/123 (or */0 when nothing matches)
+        return int(response.headers.get('Content-Range', '*/0').rsplit('/', 1)[-1])
+
+    def rpc(self, function: str, params: Optional[Dict] = None):
+        """Call a Postgres function through PostgREST and return its JSON result"""
+        response = self.pool.post(
+            f"{self.supabase_url.rstrip('/')}/rest/v1/rpc/{function}",
+            headers=self.headers,
+            json=params or {},
+        )
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    def update(self, filters: Dict[str, str], values: Dict):
+        """PATCH every row matching PostgREST ``filters`` (e.g. {'id': 'in.(...)'}) with ``values``"""
+        response = self.pool.request(
+            'PATCH',
+            self.table_url,
+            params=filters,
+            headers={**self.headers, 'Prefer': 'return=minimal'},
+            json=values,
+        )
+        response.raise_for_status()
+
+    def prepare(self, hackathons: List[Dict]) -> List[Dict]:
+        """Drop server-managed columns and keep only the last row per original_url"""
+        rows = {}
+        for hackathon in hackathons:
+            if not hackathon.get('original_url'):
+                continue
+            if hasattr(hackathon, 'to_row'):
+                rows[hackathon['original_url']] = hackathon.to_row(exclude=SERVER_MANAGED_COLUMNS)
+            else:
+                rows[hackathon['original_url']] = {
+                    key: value for key, value in hackathon.items() if key not in SERVER_MANAGED_COLUMNS
+                }
+        return list(rows.values())
+
+    def upsert(self, hackathons: List[Dict], staged: Optional[Dict[str, int]] = None) -> Dict:
+        """
+        Upsert hackathons in chunks and report what happened to each chunk
+
+        Args:
+            hackathons: Rows to write
+            staged: {original_url: outbox seq} for rows the caller already
+                staged; any other row is staged here before it is sent
+
+        Returns:
+            Dictionary with total inserted/updated/failed counts, the rows
+            rejected before sending under 'invalid', the original_urls the
+            server took under 'saved' and a per-chunk breakdown under 'chunks'
+        """
+        rows = self.prepare(hackathons)
+        report = {'inserted': 0, 'updated': 0, 'failed': 0, 'quarantined': 0, 'invalid': 0, 'saved': [],
+                  'chunks': []}
+
+        if self.validator is not None:
+            rows, invalid = self.validator.split(rows)
+            for row, errors in invalid:
+                self._quarantine(row, None, {
+                    'code': errors[0]['code'],
+                    'message': '; '.join(error['message'] for error in errors),
+                    'details': errors,
+                })
+            report['invalid'] = len(invalid)
+            report['failed'] += len(invalid)
+            report['quarantined'] += len(invalid)
+            if invalid:
+                print(f"  {len(invalid)} invalid rows quarantined before sending")
+                if self.outbox is not None and staged:
+                    self.outbox.ack([(row['original_url'], staged[row['original_url']])
+                                     for row, _ in invalid if row['original_url'] in staged], 'quarantined')
+
+        seqs = None
+        if self.outbox is not None and rows:
+            staged = dict(staged or {})
+            unstaged = [row for row in rows if row['original_url'] not in staged]
+            if unstaged:
+                staged.update(zip((row['original_url'] for row in unstaged), self.outbox.stage(unstaged)))
+            seqs = [staged[row['original_url']] for row in rows]
+        self._write_chunks(rows, seqs, report)
+        return report
+
+    def resume(self, platform_source: Optional[str] = None) -> Dict:
+        """
+        Send the rows an earlier run staged in the outbox but never got an
+        answer for, oldest first
+
+        Returns:
+            The same report as upsert, plus 'pending' rows still left
+        """
+        if self.outbox is None:
+            raise ValueError("No outbox configured (set SCRAPE_OUTBOX)")
+
+        report = {'inserted': 0, 'updated': 0, 'failed': 0, 'quarantined': 0, 'invalid': 0, 'saved': [],
+                  'chunks': []}
+        after = 0
+        while True:
+            entries = self.outbox.pending(platform_source, after=after, limit=self.chunk_size)
+            if not entries:
+                break
+            after = entries[-1][0]
+            # The newest staged copy of a URL wins; acking it covers the older ones
+            latest: Dict[str, Tuple[int, Dict]] = {}
+            for seq, row in entries:
+                latest[row['original_url']] = (seq, row)
+            self._write_chunks([row for _, row in latest.values()], [seq for seq, _ in latest.values()], report)
+
+        report['pending'] = self.outbox.pending_count(platform_source)
+        return report
+
+    def _write_chunks(self, rows: List[Dict], seqs: Optional[List[int]], report: Dict):
+        """Send rows chunk by chunk, acknowledging staged rows as the server answers"""
+        total_chunks = (len(rows) + self.chunk_size - 1) // self.chunk_size
+
+        for index in range(total_chunks):
+            chunk = rows[index * self.chunk_size:(index + 1) * self.chunk_size]
+            result = self.upsert_chunk(chunk)
+            saved, rejected, dropped = result.pop('saved'), result.pop('rejected'), result.pop('dropped')
+            if seqs is not None:
+                staged = dict(zip((row['original_url'] for row in chunk),
+                                  seqs[index * self.chunk_size:(index + 1) * self.chunk_size]))
+                self.outbox.ack([(url, staged[url]) for url in saved if url in staged])
+                self.outbox.ack([(url, staged[url]) for url in rejected if url in staged], 'quarantined')
+                # Resending these would fail the same way; network errors
+                # and 5xx answers stay pending for resume
+                self.outbox.ack([(url, staged[url]) for url in dropped if url in staged], 'failed')
+            report['saved'].extend(saved)
+            result['chunk'] = index + 1
+            report['chunks'].append(result)
+
+            for key in ('inserted', 'updated', 'failed', 'quarantined'):
+                report[key] += result[key]
+
+            status = f"{result['inserted']} inserted, {result['updated']} updated"
+            if result['quarantined']:
+                status += f", {result['quarantined']} quarantined"
+            if result['failed'] > result['quarantined']:
+                status += f", {result['failed'] - result['quarantined']} failed ({result['error']})"
+            print(f"  Chunk {index + 1}/{total_chunks}: {status}")
+
+    def upsert_chunk(self, rows: List[Dict]) -> Dict:
+        """
+        Send one chunk as bulk upserts and count inserted vs updated rows
+
+        Rows the server rejects are isolated by bisection and quarantined;
+        they count as failed and as quarantined. 'saved' and 'rejected'
+        list the original_urls the server took and refused, 'dropped' those
+        it refused for the payload's shape (SHAPE_ERROR_CODES).
+        """
+        result = {'inserted': 0, 'updated': 0, 'failed': 0, 'quarantined': 0, 'error': None,
+                  'saved': [], 'rejected': [], 'dropped': []}
+
+        # PostgREST requires every object in a bulk payload to share the same
+        # keys, so rows with a different shape go out as their own request
+        groups: Dict[tuple, List[Dict]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        for group in groups.values():
+            self._send(group, result)
+
+        return result
+
+    def _send(self, rows: List[Dict], result: Dict):
+        try:
+            response = self.pool.post(
+                self.table_url,
+                params={'on_conflict': 'original_url', 'select': 'original_url,created_at,updated_at'},
+                headers={**self.headers, 'Prefer': 'resolution=merge-duplicates,return=representation'},
+                json=rows,
+            )
+        except Exception as e:
+            result['failed'] += len(rows)
+            result['error'] = str(e)
+            return
+
+        if response.status_code in (200, 201):
+            # A fresh row has both timestamps set from the same NOW();
+            # the updated_at trigger moves updated_at forward on conflict
+            for saved in response.json():
+                result['saved'].append(saved.get('original_url'))
+                if saved.get('created_at') == saved.get('updated_at'):
+                    result['inserted'] += 1
+                else:
+                    result['updated'] += 1
+            return
+
+        error = self._error(response)
+        if response.status_code not in BISECT_STATUSES or error.get('code') in SHAPE_ERROR_CODES:
+            result['failed'] += len(rows)
+            result['error'] = f"{response.status_code} - {response.text[:200]}"
+            if error.get('code') in SHAPE_ERROR_CODES:
+                result['dropped'].extend(row.get('original_url') for row in rows)
+            return
+
+        if len(rows) == 1:
+            self._quarantine(rows[0], response.status_code, error)
+            result['rejected'].append(rows[0].get('original_url'))
+            result['failed'] += 1
+            result['quarantined'] += 1
+            result['error'] = f"{response.status_code} - {error.get('message') or response.text[:200]}"
+            return
+
+        middle = len(rows) // 2
+        self._send(rows[:middle], result)
+        self._send(rows[middle:], result)
+
+    @staticmethod
+    def _error(response) -> Dict:
+        try:
+            body = response.json()
+        except ValueError:
+            return {'message': response.text[:200]}
+        return body if isinstance(body, dict) else {'message': str(body)}
+
+    def _quarantine(self, row: Dict, status: int, error: Dict):
+        entry = {'original_url': row.get('original_url'), 'status': status, 'code': error.get('code'),
+                 'error': error.get('message'), 'details': error.get('details'), 'row': row}
+        with self._quarantine_lock:
+            self.quarantine.append(entry)
+            if self.quarantine_file:
+                with open(self.quarantine_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, default=str) + '\n')
+        print(f"  Quarantined {entry['original_url']}: {status or 'invalid'} {entry['code']} {entry['error']}")
@@ -0,0 +1,95 @@
+"""
+Diff-based Sync - compares freshly parsed hackathons with stored fingerprints
+and writes only the rows that actually changed
+"""
+
+import hashlib
+import json
+from typing import Dict, List, Optional
+
+from devcompass.supabase_writer import SERVER_MANAGED_COLUMNS, SupabaseWriter
+
+# Columns excluded from the fingerprint: the ones the database owns plus the
+# fingerprint itself
+UNHASHED_COLUMNS = set(SERVER_MANAGED_COLUMNS) | {'content_hash'}
+
+
+def content_hash(hackathon: Dict) -> str:
+    """Stable fingerprint of a hackathon's content columns"""
+    content = {key: value for key, value in hackathon.items() if key not in UNHASHED_COLUMNS}
+    encoded = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+def load_fingerprints(writer: SupabaseWriter, platform_source: str) -> Dict[str, Optional[str]]:
+    """Load {original_url: content_hash} for one platform in a single paginated read"""
+    rows = writer.select_all(
+        'original_url,content_hash',
+        filters={'platform_source': f'eq.{platform_source}'},
+    )
+    return {row['original_url']: row.get('content_hash') for row in rows}
+
+
+def plan_sync(hackathons: List[Dict], fingerprints: Dict[str, Optional[str]]) -> Dict[str, List]:
+    """
+    Split parsed hackathons into insert, update and unchanged sets
+
+    Every row that is sent gets its fingerprint stamped into 'content_hash'.
+
+    Returns:
+        Dictionary with 'insert' and 'update' rows, plus 'unchanged' and
+        'missing' original_urls (stored rows the source no longer lists)
+    """
+    plan = {'insert': [], 'update': [], 'unchanged': [], 'missing': []}
+    seen = set()
+
+    for hackathon in hackathons:
+        url = hackathon.get('original_url')
+        if not url or url in seen:
+            continue
+        seen.add(url)
+
+        fingerprint = content_hash(hackathon)
+        if url not in fingerprints:
+            plan['insert'].append({**hackathon, 'content_hash': fingerprint})
+        elif fingerprints[url] != fingerprint:
+            plan['update'].append({**hackathon, 'content_hash': fingerprint})
+        else:
+            plan['unchanged'].append(url)
+
+    plan['missing'] = [url for url in fingerprints if url not in seen]
+    return plan
+
+
+def sync_source(writer: SupabaseWriter, platform_source: str, hackathons: List[Dict],
+                fingerprints: Optional[Dict[str, Optional[str]]] = None,
+                complete: bool = True) -> Dict:
+    """
+    Write only new and changed hackathons for one platform
+
+    Args:
+        writer: Shared Supabase writer
+        platform_source: Platform whose stored fingerprints are compared
+        hackathons: Freshly parsed hackathons from that platform
+        fingerprints: Already loaded fingerprints, to avoid a second read
+        complete: Whether the fetch covered the whole source; rows missing
+            from a partial fetch (e.g. an early-stopped crawl) are not
+            reported as disappeared
+
+    Returns:
+        Writer report extended with 'unchanged' and 'missing' counts and
+        the list of missing original_urls
+    """
+    if fingerprints is None:
+        fingerprints = load_fingerprints(writer, platform_source)
+
+    plan = plan_sync(hackathons, fingerprints)
+    missing = plan['missing'] if complete else []
+    print(f"Sync {platform_source}: {len(plan['insert'])} new, {len(plan['update'])} changed, "
+          f"{len(plan['unchanged'])} unchanged, {len(missing)} gone from source")
+
+    report = writer.upsert(plan['insert'] + plan['update'])
+    report['unchanged'] = len(plan['unchanged'])
+    report['missing'] = len(missing)
+    report['missing_urls'] = missing
+    return report
@@ -0,0 +1,119 @@
+"""
+Theme Taxonomy - maps raw tags, titles and descriptions to canonical theme IDs
+
+Every source labels themes its own way (Unstop tags and categories, Devpost
+themes, nothing at all for Hack Club and Devfolio), so the raw ``themes``
+column fragments into near-duplicates. ``theme_ids`` matches all aliases of
+the taxonomy in one pass over a record's tags and title with a matcher
+compiled once per process, and returns canonical IDs for the ``theme_ids``
+column. Descriptions are free prose, where words like "security", "health"
+or "game" turn up without naming a theme, so they are matched against the
+multi-word aliases only.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# id -> (label, aliases). IDs are stored in hackathons.theme_ids; aliases
+# are matched case-insensitively on word boundaries, and only the ones with
+# more than one word count in descriptions.
+TAXONOMY: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    'ai': ('AI', ('ai', 'a.i.', 'artificial intelligence', 'machine learning', 'ml', 'ai/ml', 'deep learning',
+                  'genai', 'gen ai', 'generative ai', 'llm', 'llms', 'nlp', 'computer vision', 'chatgpt', 'openai')),
+    'blockchain': ('Blockchain', ('blockchain', 'web3', 'web 3', 'crypto', 'cryptocurrency', 'ethereum', 'solana',
+                                  'defi', 'nft', 'nfts', 'smart contract', 'smart contracts', 'dapp', 'dapps')),
+    'web': ('Web', ('web', 'web development', 'web dev', 'webdev', 'frontend', 'front-end', 'backend', 'back-end',
+                    'full stack', 'full-stack', 'fullstack')),
+    'mobile': ('Mobile', ('mobile', 'mobile app', 'mobile apps', 'android', 'ios', 'flutter', 'react native')),
+    'data-science': ('Data Science', ('data science', 'data analytics', 'data analysis', 'big data', 'analytics',
+                                      'data visualization', 'datathon')),
+    'cybersecurity': ('Cybersecurity', ('cybersecurity', 'cyber security', 'security', 'infosec', 'ctf',
+                                        'capture the flag', 'ethical hacking', 'privacy')),
+    'iot': ('IoT', ('iot', 'internet of things', 'embedded', 'hardware', 'arduino', 'raspberry pi', 'robotics')),
+    'cloud': ('Cloud', ('cloud', 'cloud computing', 'devops', 'aws', 'azure', 'gcp', 'serverless', 'kubernetes')),
+    'fintech': ('Fintech', ('fintech', 'finance', 'financial', 'banking', 'payments', 'insurtech')),
+    'healthtech': ('Healthtech', ('healthtech', 'health', 'healthcare', 'medtech', 'medical', 'mental health', 'biotech')),
+    'edtech': ('Edtech', ('edtech', 'education', 'e-learning', 'edutech')),
+    'sustainability': ('Sustainability', ('sustainability', 'climate', 'climate tech', 'cleantech', 'green tech',
+                                          'environment', 'renewable energy', 'clean energy')),
+    'gaming': ('Gaming', ('gaming', 'game', 'games', 'game development', 'game dev', 'gamedev', 'game jam')),
+    'ar-vr': ('AR/VR', ('ar/vr', 'augmented reality', 'virtual reality', 'mixed reality', 'xr', 'metaverse')),
+    'social-good': ('Social Good', ('social good', 'social impact', 'civic tech', 'nonprofit', 'accessibility')),
+    'open-source': ('Open Source', ('open source', 'open-source', 'oss')),
+}
+
+
+class ThemeMatcher:
+    """
+    Every alias of a taxonomy folded into a trie and compiled to one regular
+    expression, so a record is matched in a single scan by the regex engine
+    """
+
+    def __init__(self, taxonomy: Dict[str, Tuple[str, Tuple[str, ...]]] = TAXONOMY, multi_word_only: bool = False):
+        self.order = {theme_id: position for position, theme_id in enumerate(taxonomy)}
+        self.aliases: Dict[str, str] = {}
+        for theme_id, (label, aliases) in taxonomy.items():
+            for alias in (label, *aliases):
+                if multi_word_only and len(alias.split()) < 2:
+                    continue
+                self.aliases.setdefault(alias.lower(), theme_id)
+
+        trie: Dict = {}
+        for alias in self.aliases:
+            node = trie
+            for char in alias:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        # Aliases only count as whole words
+        self.pattern = re.compile(rf'(?<![a-z0-9])({self._compile(trie)})(?![a-z0-9])')
+
+    @classmethod
+    def _compile(cls, node: Dict) -> str:
+        """Regex for a trie node; shared prefixes are matched once"""
+        branches = [re.escape(char) + cls._compile(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if '' in node:
+            # An alias ends here; longer aliases are tried first
+            body = f"(?:{body})?"
+        return body
+
+    def match(self, text: str) -> Set[str]:
+        """IDs of every theme with an alias in ``text`` as a whole word"""
+        return {self.aliases[alias] for alias in self.pattern.findall(text.lower())}
+
+    def theme_ids(self, text: str) -> List[str]:
+        """Matched IDs in taxonomy order"""
+        return sorted(self.match(text), key=self.order.__getitem__)
+
+
+@lru_cache(maxsize=1)
+def default_matcher() -> ThemeMatcher:
+    return ThemeMatcher()
+
+
+@lru_cache(maxsize=1)
+def description_matcher() -> ThemeMatcher:
+    return ThemeMatcher(multi_word_only=True)
+
+
+def theme_ids(themes: Optional[Iterable[str]] = None, title: Optional[str] = None,
+              description: Optional[str] = None) -> List[str]:
+    """
+    Canonical theme IDs for a record, from its raw themes and title (every
+    alias) plus its description (multi-word aliases only)
+    """
+    parts = [theme for theme in themes or () if isinstance(theme, str)]
+    if title:
+        parts.append(title)
+    # A newline between parts keeps aliases from matching across them
+    found = default_matcher().match('\n'.join(parts)) if parts else set()
+    if description:
+        found |= description_matcher().match(description)
+    return sorted(found, key=default_matcher().order.__getitem__)
+
+
+def theme_label(theme_id: str) -> str:
+    return TAXONOMY[theme_id][0] if theme_id in TAXONOMY else theme_id
@@ -0,0 +1,201 @@
+"""
+Schema Validator - checks rows against the hackathons schema before they are sent
+
+The column types, NOT NULL columns and ``col IN (...)`` CHECK constraints of
+a table are read from docs/schema.sql once and compiled into one check per
+column. A batch is validated column by column: each column's distinct
+values are checked once and only rows holding a bad value are flagged, so
+a batch of thousands of rows with a handful of distinct platforms, modes and
+dates costs little more than gathering the values.
+
+Errors use the codes Postgres would answer with (23502 NOT NULL, 23514
+CHECK, 22007 bad timestamp, 22P02 bad value, PGRST204 unknown column), so a
+row rejected here reads the same as one rejected by the server.
+"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from devcompass.fake_supabase import DEFAULT_SCHEMA, parse_schema
+
+IN_CHECK_RE = re.compile(r"^(\w+) IN \((.*)\)$", re.S)
+LITERAL_RE = re.compile(r"'((?:[^']|'')*)'")
+UUID_RE = re.compile(r'^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$')
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _valid_timestamp(value: str) -> bool:
+    try:
+        datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return False
+    return True
+
+
+def _is_text(value) -> bool:
+    return isinstance(value, (str, int, float)) and not isinstance(value, bool)
+
+
+def _is_number(value) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _is_text_array(value) -> bool:
+    # PostgREST also takes a Postgres array literal such as '{a,b}'
+    if isinstance(value, str):
+        return value.startswith('{') and value.endswith('}')
+    return isinstance(value, list) and all(item is None or isinstance(item, str) for item in value)
+
+
+def _is_timestamp(value) -> bool:
+    return isinstance(value, str) and _valid_timestamp(value)
+
+
+def _is_uuid(value) -> bool:
+    return isinstance(value, str) and UUID_RE.match(value) is not None
+
+
+TYPE_CHECKS: Dict[str, Tuple[Callable, str, str]] = {
+    # type -> (check, error code, message)
+    'TEXT': (_is_text, '22P02', 'expected text'),
+    'NUMERIC': (_is_number, '22P02', 'invalid input syntax for type numeric'),
+    'INTEGER': (lambda value: _is_number(value) and float(value).is_integer(), '22P02',
+                'invalid input syntax for type integer'),
+    'BOOLEAN': (lambda value: value in (True, False, 'true', 'false'), '22P02',
+                'invalid input syntax for type boolean'),
+    'TIMESTAMPTZ': (_is_timestamp, '22007', 'invalid input syntax for type timestamp with time zone'),
+    'UUID': (_is_uuid, '22P02', 'invalid input syntax for type uuid'),
+    'TEXT[]': (_is_text_array, '22P02', 'malformed array literal'),
+}
+
+
+class SchemaValidator:
+    """Compiled NOT NULL, type and CHECK constraints for one table"""
+
+    def __init__(self, table: Dict, name: str = 'hackathons'):
+        self.name = name
+        self.columns: Dict[str, Dict] = table['columns']
+        # Columns every inserted row must carry, since the database has no default
+        self.required = [column for column, spec in self.columns.items()
+                         if spec['not_null'] and spec['default'] is None]
+
+        self.allowed: Dict[str, frozenset] = {}
+        for check in table['checks']:
+            match = IN_CHECK_RE.match(check.strip())
+            if match and match.group(1) in self.columns:
+                self.allowed[match.group(1)] = frozenset(
+                    literal.replace("''", "'") for literal in LITERAL_RE.findall(match.group(2)))
+
+    def _column_errors(self, column: str, values: List) -> Dict[int, Dict]:
+        """{row index: error} for one column's values across a batch"""
+        spec = self.columns.get(column)
+        if spec is None:
+            return {index: {'column': column, 'code': 'PGRST204',
+                            'message': f"Could not find the '{column}' column of '{self.name}' in the schema cache"}
+                    for index, value in enumerate(values) if value is not _MISSING}
+
+        errors: Dict[int, Dict] = {}
+        if spec['not_null'] and (spec['default'] is None or None in values):
+            for index, value in enumerate(values):
+                if value is None or (value is _MISSING and spec['default'] is None):
+                    errors[index] = {'column': column, 'code': '23502',
+                                     'message': f'null value in column "{column}" violates not-null constraint'}
+
+        # Everything after this looks at each distinct value once
+        try:
+            distinct = set(values)
+        except TypeError:
+            distinct = None
+
+        check, code, message = TYPE_CHECKS.get(spec['type'], (None, None, None))
+        allowed = self.allowed.get(column)
+        if check is None and allowed is None:
+            return errors
+
+        def problem(value) -> Optional[Dict]:
+            if value is None or value is _MISSING:
+                return None
+            if check is not None and not check(value):
+                return {'column': column, 'code': code, 'message': f'{message}: "{value}"'}
+            if allowed is not None and value not in allowed:
+                return {'column': column, 'code': '23514',
+                        'message': f'"{column}" must be one of {", ".join(sorted(allowed))}, got "{value}"'}
+            return None
+
+        if distinct is not None:
+            bad = {value: error for value in distinct if (error := problem(value))}
+            if bad:
+                for index, value in enumerate(values):
+                    if value in bad and index not in errors:
+                        errors[index] = bad[value]
+        else:
+            # Unhashable values (lists, dicts) are checked one by one
+            for index, value in enumerate(values):
+                if index not in errors and (error := problem(value)):
+                    errors[index] = error
+        return errors
+
+    def validate(self, rows: List[Dict]) -> List[List[Dict]]:
+        """
+        One error list per row, in order; an empty list means the row is valid
+
+        Each error is {'column', 'code', 'message'}.
+        """
+        vectors: List[List[Dict]] = [[] for _ in rows]
+        if not rows:
+            return vectors
+
+        present = set(self.required)
+        for row in rows:
+            present.update(row)
+
+        for column in present:
+            values = [row.get(column, _MISSING) for row in rows]
+            for index, error in self._column_errors(column, values).items():
+                vectors[index].append(error)
+        return vectors
+
+    def split(self, rows: List[Dict]) -> Tuple[List[Dict], List[Tuple[Dict, List[Dict]]]]:
+        """(valid rows, [(invalid row, errors)]), each in input order"""
+        valid, invalid = [], []
+        for row, errors in zip(rows, self.validate(rows)):
+            if errors:
+                invalid.append((row, errors))
+            else:
+                valid.append(row)
+        return valid, invalid
+
+
+@lru_cache(maxsize=None)
+def load_validator(table: str = 'hackathons', schema: Path = DEFAULT_SCHEMA) -> Optional[SchemaValidator]:
+    """Validator for ``table`` from the schema file; None when either is not available"""
+    try:
+        tables = parse_schema(Path(schema).read_text(encoding='utf-8'))
+    except OSError:
+        return None
+    return SchemaValidator(tables[table], table) if table in tables else None
+
+
+def drop_invalid(rows: List[Dict], table: str = 'hackathons') -> List[Dict]:
+    """Valid rows only, printing why each invalid one was dropped"""
+    validator = load_validator(table)
+    if validator is None:
+        return rows
+    valid, invalid = validator.split(rows)
+    for row, errors in invalid:
+        print(f"Skipping invalid {row.get('title') or row.get('original_url')}: "
+              + '; '.join(f"{error['code']} {error['message']}" for error in errors))
+    return valid
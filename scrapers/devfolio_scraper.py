@@ -1,106 +1,192 @@
 import json
 import time
-from playwright.sync_api import sync_playwright
+
+from devcompass.dates import parse_date_range
+from devcompass.themes import theme_ids
+
+BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+def new_page(browser):
+    """Open a desktop-sized page with a regular browser user agent"""
+    context = browser.new_context(
+        user_agent=BROWSER_USER_AGENT,
+        viewport={'width': 1920, 'height': 1080}
+    )
+    return context.new_page()
+
+def scrape_hackerearth(page):
+    """Scrape hackathon cards from HackerEarth's challenge listing"""
+    print("🌍 Navigating to HackerEarth...")
+    try:
+        page.goto("https://www.hackerearth.com/challenges/hackathon/", timeout=60000)
+        
+        print("   Waiting for content...")
+        # Wait for the cards to load
+        page.wait_for_selector(".challenge-card-wrapper", timeout=20000)
+        
+        # Scroll down to ensure lazy-loaded elements appear
+        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        time.sleep(3) 
+
+        # Extract data via JavaScript
+        he_data = page.evaluate("""() => {
+            const hacks = [];
+            document.querySelectorAll('.challenge-card-wrapper').forEach(card => {
+                const titleEl = card.querySelector('.challenge-list-title');
+                const linkEl = card.querySelector('a.challenge-card-link');
+                
+                // Try to find the date text (it varies in class name)
+                const dateEl = card.querySelector('.date') || card.querySelector('.event-details');
+
+                if (titleEl && linkEl) {
+                    hacks.push({
+                        platform: 'HackerEarth',
+                        title: titleEl.innerText.trim(),
+                        link: linkEl.href,
+                        date: dateEl ? dateEl.innerText.trim().replace(/\\n/g, ' ') : 'See Website'
+                    });
+                }
+            });
+            return hacks;
+        }""")
+        
+        print(f"   ✅ Found {len(he_data)} hackathons on HackerEarth.")
+        return he_data
+
+    except Exception as e:
+        print(f"   ❌ HackerEarth Error: {e}")
+        return []
+
+def scrape_devfolio(page):
+    """Scrape hackathon links from Devfolio's listing"""
+    print("\n🦄 Navigating to Devfolio...")
+    try:
+        page.goto("https://devfolio.co/hackathons", timeout=60000)
+        
+        # Wait for React to render the cards
+        try:
+            page.wait_for_selector('a[href*=".devfolio.co"]', timeout=15000)
+        except:
+            print("   Devfolio load timed out or no hackathons found.")
+
+        # Scroll to load more
+        page.mouse.wheel(0, 3000)
+        time.sleep(3)
+
+        dev_data = page.evaluate("""() => {
+            const hacks = [];
+            const links = Array.from(document.querySelectorAll('a[href*=".devfolio.co"]'));
+            
+            links.forEach(link => {
+                const titleEl = link.querySelector('h2') || link.querySelector('h3') || link.querySelector('span');
+                
+                // Filter out non-event links (like just 'devfolio.co')
+                if (titleEl && link.href.includes('devfolio.co') && !link.href.includes('discover')) {
+                    hacks.push({
+                        platform: 'Devfolio',
+                        title: titleEl.innerText.trim(),
+                        link: link.href,
+                        date: 'See Website'
+                    });
+                }
+            });
+            return hacks;
+        }""")
+
+        # Remove duplicates
+        unique_dev = {v['link']: v for v in dev_data}.values()
+        
+        print(f"   ✅ Found {len(unique_dev)} hackathons on Devfolio.")
+        return list(unique_dev)
+
+    except Exception as e:
+        print(f"   ❌ Devfolio Error: {e}")
+        return []
 
 def scrape_hackathons():
+    from playwright.sync_api import sync_playwright
+
     results = []
 
     with sync_playwright() as p:
         # Launch browser (headless=False lets you see the process and solve CAPTCHAs)
         browser = p.chromium.launch(headless=False)
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={'width': 1920, 'height': 1080}
-        )
-        page = context.new_page()
-
-        # --- 1. HACKEREARTH ---
-        print("🌍 Navigating to HackerEarth...")
-        try:
-            page.goto("https://www.hackerearth.com/challenges/hackathon/", timeout=60000)
-            
-            print("   Waiting for content...")
-            # Wait for the cards to load
-            page.wait_for_selector(".challenge-card-wrapper", timeout=20000)
-            
-            # Scroll down to ensure lazy-loaded elements appear
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            time.sleep(3) 
-
-            # Extract data via JavaScript
-            he_data = page.evaluate("""() => {
-                const hacks = [];
-                document.querySelectorAll('.challenge-card-wrapper').forEach(card => {
-                    const titleEl = card.querySelector('.challenge-list-title');
-                    const linkEl = card.querySelector('a.challenge-card-link');
-                    
-                    // Try to find the date text (it varies in class name)
-                    const dateEl = card.querySelector('.date') || card.querySelector('.event-details');
-
-                    if (titleEl && linkEl) {
-                        hacks.push({
-                            platform: 'HackerEarth',
-                            title: titleEl.innerText.trim(),
-                            link: linkEl.href,
-                            date: dateEl ? dateEl.innerText.trim().replace(/\\n/g, ' ') : 'See Website'
-                        });
-                    }
-                });
-                return hacks;
-            }""")
-            
-            print(f"   ✅ Found {len(he_data)} hackathons on HackerEarth.")
-            results.extend(he_data)
+        page = new_page(browser)
+
+        results.extend(scrape_hackerearth(page))
+        results.extend(scrape_devfolio(page))
+
+        browser.close()
+        return results
+
+def replay_route(route, fixtures):
+    """Serve a recorded page for document requests and block everything else"""
+    html = fixtures.load_html(route.request.url) if route.request.resource_type == 'document' else None
+    if html is None:
+        route.abort()
+    else:
+        route.fulfill(status=200, content_type='text/html', body=html)
+
+def scrape_with_browser(scrape, headless=True, fixtures=None, replay=False, lake=None, source=None):
+    """
+    Run one listing scraper in its own browser (Playwright sync API is per-thread)
 
-        except Exception as e:
-            print(f"   ❌ HackerEarth Error: {e}")
+    With a FixtureStore, the rendered page is recorded after scraping, or
+    with replay=True the page is served from the store instead of the network.
+    With a RawLake, the rendered page is also kept there under ``source``.
+    """
+    from playwright.sync_api import sync_playwright
 
-        # --- 2. DEVFOLIO ---
-        print("\n🦄 Navigating to Devfolio...")
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless)
         try:
-            page.goto("https://devfolio.co/hackathons", timeout=60000)
-            
-            # Wait for React to render the cards
-            try:
-                page.wait_for_selector('a[href*=".devfolio.co"]', timeout=15000)
-            except:
-                print("   Devfolio load timed out or no hackathons found.")
-
-            # Scroll to load more
-            page.mouse.wheel(0, 3000)
-            time.sleep(3)
-
-            dev_data = page.evaluate("""() => {
-                const hacks = [];
-                const links = Array.from(document.querySelectorAll('a[href*=".devfolio.co"]'));
-                
-                links.forEach(link => {
-                    const titleEl = link.querySelector('h2') || link.querySelector('h3') || link.querySelector('span');
-                    
-                    // Filter out non-event links (like just 'devfolio.co')
-                    if (titleEl && link.href.includes('devfolio.co') && !link.href.includes('discover')) {
-                        hacks.push({
-                            platform: 'Devfolio',
-                            title: titleEl.innerText.trim(),
-                            link: link.href,
-                            date: 'See Website'
-                        });
-                    }
-                });
-                return hacks;
-            }""")
-
-            # Remove duplicates
-            unique_dev = {v['link']: v for v in dev_data}.values()
-            
-            print(f"   ✅ Found {len(unique_dev)} hackathons on Devfolio.")
-            results.extend(unique_dev)
+            page = new_page(browser)
+            if fixtures is not None and replay:
+                page.route("**/*", lambda route: replay_route(route, fixtures))
 
-        except Exception as e:
-            print(f"   ❌ Devfolio Error: {e}")
+            results = scrape(page)
 
-        browser.close()
-        return results
+            # The DOM after scrolling holds the lazy-loaded cards the scrape saw
+            if fixtures is not None and not replay:
+                fixtures.save_html(page.url, page.content())
+            if lake is not None and not replay:
+                lake.put_page(source, page.url, page.content())
+            return results
+        finally:
+            browser.close()
+
+def parse_listing_hackathon(item, platform_source):
+    """Turn a scraped listing card into a hackathons row"""
+    title = (item.get('title') or '').strip()
+    link = item.get('link') or ''
+    if not title or not link:
+        return None
+
+    # Card dates read like "Mar 01 - 05, 2026"; placeholders such as "See Website" give None
+    start_date, end_date = parse_date_range(item.get('date'))
+
+    return {
+        "title": title,
+        "description": f"Hackathon: {title}",
+        "short_summary": title,
+        "original_url": link,
+        "platform_source": platform_source,
+        "banner_url": "https://images.unsplash.com/photo-1504384308090-c894fdcc538d?w=800",
+        "prize_money": "Prize details available on website",
+        "start_date": start_date,
+        "end_date": end_date,
+        "registration_deadline": end_date,
+        "themes": ["Hackathon"],
+        "theme_ids": theme_ids(None, title),
+        "eligibility": "Check website for eligibility",
+        "location_mode": "online"
+    }
+
+def parse_devfolio_hackathon(item):
+    return parse_listing_hackathon(item, 'devfolio')
+
+def parse_hackerearth_hackathon(item):
+    return parse_listing_hackathon(item, 'hackerearth')
 
 if __name__ == "__main__":
     print("--- STARTING SCRAPER ---")
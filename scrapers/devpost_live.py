@@ -8,171 +8,194 @@ import requests
 import json
 import os
 from dotenv import load_dotenv
+from devcompass.clients import get_writer
+from devcompass.dates import parse_date_range
+from devcompass.http_pool import HttpPool
+from devcompass.prizes import devpost_prize_amount, prize_columns
+from devcompass.resilience import Resilience, ResilientPool
+from devcompass.themes import theme_ids
+from devcompass.sync import load_fingerprints, sync_source
+from devcompass.pagination import DEFAULT_MAX_WORKERS, crawl_until_known
 
 load_dotenv()
 
-def fetch_devpost_hackathons():
-    """Fetch live hackathons from Devpost API"""
-    print("Fetching live Devpost hackathons...")
-    
-    url = "https://devpost.com/api/hackathons"
+DEVPOST_API_URL = "https://devpost.com/api/hackathons"
+
+DEVPOST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json',
+    'Referer': 'https://devpost.com/hackathons'
+}
+
+def load_known_fingerprints():
+    """Load {original_url: content_hash} for every Devpost hackathon in Supabase"""
+    if not os.getenv('SUPABASE_URL') or not os.getenv('SUPABASE_SERVICE_KEY'):
+        return {}
+    try:
+        return load_fingerprints(get_writer(), 'devpost')
+    except Exception as e:
+        print(f"Error loading known hackathons: {str(e)}")
+        return {}
+
+def fetch_devpost_response(pool, page):
+    """Fetch one page of recently added hackathons, revalidating against the pool's cache"""
     params = {
         'order_by': 'recently-added',
-        'per_page': 20
+        'per_page': 20,
+        'page': page
     }
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'application/json',
-        'Referer': 'https://devpost.com/hackathons'
+    response = pool.get(DEVPOST_API_URL, params=params, headers=DEVPOST_HEADERS, use_cache=True)
+    print(f"Page {page} API Response Status: {response.status_code}")
+    response.raise_for_status()
+    return response
+
+def fetch_devpost_page(pool, page):
+    """Fetch one page of recently added hackathons"""
+    return fetch_devpost_response(pool, page).json()
+
+def devpost_items(data):
+    """Handle the different possible response structures"""
+    if isinstance(data, dict):
+        return data.get('hackathons', data.get('data', []))
+    if isinstance(data, list):
+        return data
+    return []
+
+def devpost_last_page(data):
+    """Work out the page count from the response meta block, if present"""
+    meta = data.get('meta', {}) if isinstance(data, dict) else {}
+    if meta.get('total_count') and meta.get('per_page'):
+        return -(-int(meta['total_count']) // int(meta['per_page']))
+    return None
+
+def parse_devpost_hackathon(item):
+    """Parse a single hackathon from the Devpost API response"""
+    # Extract basic info
+    title = item.get('title', '')
+    if not title:
+        return None
+
+    # Extract description (not available in this API, use title)
+    description = f"Join {title} and showcase your skills in this exciting hackathon!"
+
+    # Extract URL
+    original_url = item.get('url', '')
+
+    # Extract themes
+    themes = []
+    if 'themes' in item and isinstance(item['themes'], list):
+        themes = [theme.get('name', '') for theme in item['themes'][:5] if isinstance(theme, dict)]
+
+    # Extract dates from the submission_period_dates string ("Mar 01 - 05, 2026");
+    # submissions close at the end of the period
+    date_info = item.get('submission_period_dates') or ""
+    start_date, end_date = parse_date_range(date_info)
+    deadline = end_date
+
+    # Update description to include date info
+    if date_info:
+        description = f"Join {title} and showcase your skills! Dates: {date_info}"
+
+    # Extract prize
+    prize_money = ""
+    if 'prize_amount' in item and item['prize_amount']:
+        prize_money = str(item['prize_amount'])
+
+    # Extract image
+    banner_url = item.get('thumbnail_url', '')
+    if banner_url and not banner_url.startswith('http'):
+        banner_url = f"https:{banner_url}"
+
+    # Extract location info
+    location_mode = 'online'
+    if 'displayed_location' in item and item['displayed_location']:
+        location_info = item['displayed_location']
+        if isinstance(location_info, dict) and location_info.get('location'):
+            location_mode = 'offline'
+
+    hackathon = {
+        'title': title,
+        'description': description,
+        'short_summary': description[:147] + '...' if len(description) > 150 else description,
+        'banner_url': banner_url,
+        'prize_money': prize_money,
+        **prize_columns(devpost_prize_amount(item)),
+        'start_date': start_date,
+        'end_date': end_date,
+        'registration_deadline': deadline,
+        'themes': themes,
+        'theme_ids': theme_ids(themes, title),
+        'platform_source': 'devpost',
+        'original_url': original_url,
+        'eligibility': 'Open to all developers',
+        'location_mode': location_mode,
     }
+
+    return hackathon
+
+def fetch_devpost_hackathons(known_urls=None, max_workers=DEFAULT_MAX_WORKERS):
+    """Fetch live hackathons from Devpost, stopping at the first fully known page"""
+    print("Fetching live Devpost hackathons...")
     
+    pool = ResilientPool(HttpPool(), Resilience('devpost'))
     try:
-        response = requests.get(url, params=params, headers=headers)
-        print(f"API Response Status: {response.status_code}")
+        if known_urls is None:
+            known_urls = set(load_known_fingerprints())
+        print(f"Already tracking {len(known_urls)} Devpost hackathons")
         
-        if response.status_code == 200:
-            data = response.json()
-            print(f"Raw API response keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-            
-            hackathons = []
-            
-            # Handle different possible response structures
-            hackathon_list = []
-            if isinstance(data, dict):
-                hackathon_list = data.get('hackathons', data.get('data', []))
-            elif isinstance(data, list):
-                hackathon_list = data
-            
-            print(f"Found {len(hackathon_list)} hackathons in response")
+        hackathons = []
+        pages = crawl_until_known(
+            lambda page: fetch_devpost_page(pool, page),
+            devpost_items,
+            lambda item: isinstance(item, dict) and item.get('url', '') in known_urls,
+            last_page_of=devpost_last_page,
+            max_workers=max_workers,
+        )
+        
+        for page, items in pages:
+            print(f"Found {len(items)} hackathons on page {page}")
             
-            for item in hackathon_list:
+            for item in items:
                 try:
-                    # Extract basic info
-                    title = item.get('title', '')
-                    if not title:
-                        continue
-                    
-                    # Extract description (not available in this API, use title)
-                    description = f"Join {title} and showcase your skills in this exciting hackathon!"
-                    
-                    # Extract URL
-                    original_url = item.get('url', '')
-                    
-                    # Extract themes
-                    themes = []
-                    if 'themes' in item and isinstance(item['themes'], list):
-                        themes = [theme.get('name', '') for theme in item['themes'][:5] if isinstance(theme, dict)]
-                    
-                    # Extract dates from submission_period_dates string
-                    start_date = None
-                    end_date = None
-                    deadline = None
-                    
-                    # Don't store the raw date string in timestamp fields
-                    # Just store it as text in description for now
-                    date_info = ""
-                    if 'submission_period_dates' in item:
-                        date_info = item['submission_period_dates']
-                    
-                    # Update description to include date info
-                    if date_info:
-                        description = f"Join {title} and showcase your skills! Dates: {date_info}"
-                    
-                    # Extract prize
-                    prize_money = ""
-                    if 'prize_amount' in item and item['prize_amount']:
-                        prize_money = str(item['prize_amount'])
-                    
-                    # Extract image
-                    banner_url = item.get('thumbnail_url', '')
-                    if banner_url and not banner_url.startswith('http'):
-                        banner_url = f"https:{banner_url}"
-                    
-                    # Extract location info
-                    location_mode = 'online'
-                    if 'displayed_location' in item and item['displayed_location']:
-                        location_info = item['displayed_location']
-                        if isinstance(location_info, dict) and location_info.get('location'):
-                            location_mode = 'offline'
-                    
-                    hackathon = {
-                        'title': title,
-                        'description': description,
-                        'short_summary': description[:147] + '...' if len(description) > 150 else description,
-                        'banner_url': banner_url,
-                        'prize_money': prize_money,
-                        'start_date': start_date,
-                        'end_date': end_date,
-                        'registration_deadline': None,  # Set to None to avoid format issues
-                        'themes': themes,
-                        'platform_source': 'devpost',
-                        'original_url': original_url,
-                        'eligibility': 'Open to all developers',
-                        'location_mode': location_mode,
-                    }
-                    
-                    hackathons.append(hackathon)
-                    print(f"Processed: {title}")
-                    
+                    hackathon = parse_devpost_hackathon(item)
+                    if hackathon:
+                        hackathons.append(hackathon)
+                        print(f"Processed: {hackathon['title']}")
                 except Exception as e:
                     print(f"Error processing hackathon: {str(e)}")
                     continue
-            
-            print(f"Successfully processed {len(hackathons)} hackathons from Devpost")
-            return hackathons
-        else:
-            print(f"API request failed with status {response.status_code}")
-            print(f"Response: {response.text[:500]}")
-            return []
+        
+        print(f"Successfully processed {len(hackathons)} hackathons from Devpost")
+        return hackathons
             
     except Exception as e:
+        # Nothing from a crawl that hit a failed page is kept; see crawl_until_known
         print(f"Error fetching from Devpost API: {str(e)}")
         return []
+    finally:
+        pool.close()
 
-def save_to_supabase(hackathons):
-    """Save hackathons to Supabase"""
+def save_to_supabase(hackathons, fingerprints=None):
+    """Save new and changed hackathons to Supabase"""
     if not hackathons:
         return 0
     
-    supabase_url = os.getenv('SUPABASE_URL')
-    supabase_key = os.getenv('SUPABASE_SERVICE_KEY')
-    
-    headers = {
-        'apikey': supabase_key,
-        'Authorization': f'Bearer {supabase_key}',
-        'Content-Type': 'application/json'
-    }
-    
-    saved_count = 0
-    
-    for hackathon in hackathons:
-        try:
-            response = requests.post(
-                f'{supabase_url}/rest/v1/hackathons',
-                headers=headers,
-                json=hackathon
-            )
-            
-            if response.status_code == 201:
-                print(f"Added: {hackathon['title']}")
-                saved_count += 1
-            elif response.status_code == 409:
-                print(f"Already exists: {hackathon['title']}")
-            else:
-                print(f"Error saving {hackathon['title']}: {response.status_code} - {response.text}")
-                
-        except Exception as e:
-            print(f"Error saving {hackathon.get('title', 'Unknown')}: {str(e)}")
+    try:
+        report = sync_source(get_writer(), 'devpost', hackathons, fingerprints=fingerprints, complete=False)
+    except Exception as e:
+        print(f"Error saving hackathons: {str(e)}")
+        return 0
     
-    return saved_count
+    print(f"Added {report['inserted']}, refreshed {report['updated']} existing hackathons")
+    return report['inserted']
 
 def main():
     print("Starting live Devpost API scraper...")
-    hackathons = fetch_devpost_hackathons()
+    fingerprints = load_known_fingerprints()
+    hackathons = fetch_devpost_hackathons(known_urls=set(fingerprints))
     
     if hackathons:
-        saved_count = save_to_supabase(hackathons)
+        saved_count = save_to_supabase(hackathons, fingerprints)
         print(f"Successfully processed {saved_count} new hackathons from Devpost!")
         print("Check your DevCompare app for new hackathons!")
     else:
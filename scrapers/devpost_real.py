@@ -9,6 +9,8 @@ import json
 from datetime import datetime
 import os
 from dotenv import load_dotenv
+from devcompass.dates import parse_date_range
+from devcompass.validate import drop_invalid
 
 load_dotenv()
 
@@ -41,7 +43,7 @@ def fetch_devpost_hackathons():
                 themes = [theme.get('name', '') for theme in item['themes'][:5]]
             
             # Extract dates
-            dates = item.get('submission_period_dates', {})
+            start_date, end_date = parse_date_range(item.get('submission_period_dates'))
             
             # Extract prize
             prize_money = ""
@@ -56,9 +58,9 @@ def fetch_devpost_hackathons():
                 'short_summary': item.get('tagline', '') or f"Join {item.get('title', '')} and build something amazing!",
                 'banner_url': item.get('thumbnail_url'),
                 'prize_money': prize_money,
-                'start_date': dates.get('start'),
-                'end_date': dates.get('end'),
-                'registration_deadline': dates.get('end'),
+                'start_date': start_date,
+                'end_date': end_date,
+                'registration_deadline': end_date,
                 'themes': themes,
                 'platform_source': 'devpost',
                 'original_url': item.get('url', ''),
@@ -90,7 +92,7 @@ def save_to_supabase(hackathons):
     
     saved_count = 0
     
-    for hackathon in hackathons:
+    for hackathon in drop_invalid(hackathons):
         try:
             # Insert hackathon (will skip if URL already exists due to unique constraint)
             response = requests.post(
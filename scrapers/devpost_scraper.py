@@ -7,18 +7,24 @@ Fetches hackathon data from devpost.com API and stores in Supabase
 import requests
 import json
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 import os
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from devcompass.clients import get_outbox
+from devcompass.dates import parse_date_range
+from devcompass.http_pool import HttpPool
+from devcompass.prizes import devpost_prize_amount, prize_columns
+from devcompass.supabase_writer import SupabaseWriter
+from devcompass.themes import theme_ids
+from devcompass.sync import load_fingerprints, sync_source
+from devcompass.pagination import DEFAULT_MAX_WORKERS, crawl_until_known
 
 load_dotenv()
 
 class DevpostScraper:
     def __init__(self):
         self.api_url = "https://devpost.com/api/hackathons"
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.pool = HttpPool(headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
@@ -29,33 +35,62 @@ class DevpostScraper:
         if not supabase_url or not supabase_key:
             raise ValueError("Missing Supabase credentials in environment variables")
             
-        self.supabase: Client = create_client(supabase_url, supabase_key)
+        self.writer = SupabaseWriter(supabase_url, supabase_key, pool=self.pool, outbox=get_outbox())
 
-    def fetch_hackathons(self) -> List[Dict]:
-        """Fetch hackathons from Devpost API"""
+    def load_known_urls(self) -> Set[str]:
+        """Load every Devpost original_url already stored in the database"""
+        return set(load_fingerprints(self.writer, 'devpost'))
+
+    def fetch_page(self, page: int) -> Dict:
+        """Fetch one page of recently added hackathons from the Devpost API"""
+        params = {
+            'order_by': 'recently-added',
+            'per_page': 50,
+            'page': page
+        }
+        
+        response = self.pool.get(self.api_url, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    def last_page(self, data: Dict) -> Optional[int]:
+        """Work out the page count from the response meta block, if present"""
+        meta = data.get('meta', {})
+        total, per_page = meta.get('total_count'), meta.get('per_page')
+        if total and per_page:
+            return -(-int(total) // int(per_page))
+        return None
+
+    def fetch_hackathons(self, known_urls: Optional[Set[str]] = None,
+                         max_workers: int = DEFAULT_MAX_WORKERS) -> List[Dict]:
+        """Fetch new hackathons from Devpost, stopping at the first fully known page"""
         print("Fetching Devpost hackathons from API...")
         
         try:
-            params = {
-                'order_by': 'recently-added',
-                'per_page': 50
-            }
-            
-            response = self.session.get(self.api_url, params=params)
-            response.raise_for_status()
+            if known_urls is None:
+                known_urls = self.load_known_urls()
+            print(f"Already tracking {len(known_urls)} Devpost hackathons")
             
-            data = response.json()
             hackathons = []
+            pages = crawl_until_known(
+                self.fetch_page,
+                lambda data: data.get('hackathons', []),
+                lambda item: item.get('url', '') in known_urls,
+                last_page_of=self.last_page,
+                max_workers=max_workers,
+            )
             
-            for item in data.get('hackathons', []):
-                hackathon = self.process_hackathon_data(item)
-                if hackathon:
-                    hackathons.append(hackathon)
+            for page, items in pages:
+                for item in items:
+                    hackathon = self.process_hackathon_data(item)
+                    if hackathon:
+                        hackathons.append(hackathon)
             
-            print(f"Found {len(hackathons)} hackathons from Devpost API")
+            print(f"Found {len(hackathons)} hackathons from Devpost API (crawled {page} pages)")
             return hackathons
             
         except Exception as e:
+            # Nothing from a crawl that hit a failed page is kept; see crawl_until_known
             print(f"Error fetching from Devpost API: {str(e)}")
             return []
 
@@ -67,10 +102,9 @@ class DevpostScraper:
             if 'themes' in item:
                 themes = [theme.get('name', '') for theme in item['themes'][:5]]
             
-            # Process dates
-            start_date = item.get('submission_period_dates', {}).get('start')
-            end_date = item.get('submission_period_dates', {}).get('end')
-            deadline = item.get('submission_period_dates', {}).get('end')
+            # Process dates (a "Mar 01 - 05, 2026" string, or a start/end dict)
+            start_date, end_date = parse_date_range(item.get('submission_period_dates'))
+            deadline = end_date
             
             hackathon_data = {
                 'title': item.get('title', ''),
@@ -78,10 +112,12 @@ class DevpostScraper:
                 'short_summary': self.generate_short_summary(item.get('description', ''), item.get('title', '')),
                 'banner_url': item.get('thumbnail_url'),
                 'prize_money': self.extract_prize_info(item),
+                **prize_columns(devpost_prize_amount(item)),
                 'start_date': start_date,
                 'end_date': end_date,
                 'registration_deadline': deadline,
                 'themes': themes,
+                'theme_ids': theme_ids(themes, item.get('title', ''), item.get('description', '')),
                 'platform_source': 'devpost',
                 'original_url': item.get('url', ''),
                 'eligibility': item.get('eligibility', ''),
@@ -114,42 +150,28 @@ class DevpostScraper:
         
         return clean_desc[:147].strip() + '...'
 
-    def save_to_supabase(self, hackathons: List[Dict]) -> int:
-        """Save hackathons to Supabase database"""
+    def save_to_supabase(self, hackathons: List[Dict],
+                         fingerprints: Optional[Dict[str, Optional[str]]] = None) -> int:
+        """Save new and changed hackathons to Supabase"""
         if not hackathons:
             return 0
         
-        print(f"Saving {len(hackathons)} hackathons to database...")
-        saved_count = 0
-        
-        for hackathon in hackathons:
-            try:
-                # Check if hackathon already exists
-                existing = self.supabase.table('hackathons').select('id').eq('original_url', hackathon['original_url']).execute()
-                
-                if existing.data:
-                    # Update existing hackathon
-                    self.supabase.table('hackathons').update(hackathon).eq('original_url', hackathon['original_url']).execute()
-                    print(f"Updated: {hackathon['title']}")
-                else:
-                    # Insert new hackathon
-                    self.supabase.table('hackathons').insert(hackathon).execute()
-                    print(f"Added: {hackathon['title']}")
-                
-                saved_count += 1
-                
-            except Exception as e:
-                print(f"Error saving {hackathon.get('title', 'Unknown')}: {str(e)}")
+        print(f"Syncing {len(hackathons)} hackathons with database...")
+        # The crawl stops at the first known page, so older rows are not "gone"
+        report = sync_source(self.writer, 'devpost', hackathons, fingerprints=fingerprints, complete=False)
+        print(f"Added {report['inserted']}, updated {report['updated']}, "
+              f"skipped {report['unchanged']} unchanged, failed {report['failed']}")
         
-        return saved_count
+        return report['inserted'] + report['updated']
 
     def run(self):
         """Main function"""
         print("Starting Devpost API client...")
         
-        hackathons = self.fetch_hackathons()
+        fingerprints = load_fingerprints(self.writer, 'devpost')
+        hackathons = self.fetch_hackathons(known_urls=set(fingerprints))
         if hackathons:
-            saved_count = self.save_to_supabase(hackathons)
+            saved_count = self.save_to_supabase(hackathons, fingerprints)
             print(f"Successfully processed {saved_count} hackathons from Devpost")
         else:
             print("No hackathons found to save")
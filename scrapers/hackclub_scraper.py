@@ -9,6 +9,10 @@ import os
 import uuid
 from datetime import datetime
 from dotenv import load_dotenv
+from devcompass.clients import get_writer
+from devcompass.dates import to_utc_iso
+from devcompass.resilience import Resilience
+from devcompass.sync import sync_source
 
 # Load environment variables
 load_dotenv()
@@ -17,8 +21,10 @@ load_dotenv()
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_KEY')
 
-if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
-    raise ValueError("Missing Supabase configuration in .env file")
+def get_json_response(url, headers):
+    response = requests.get(url, headers=headers, timeout=30)
+    response.raise_for_status()
+    return response
 
 def fetch_hackclub_hackathons():
     """Fetch hackathons from Hack Club API"""
@@ -31,8 +37,8 @@ def fetch_hackclub_hackathons():
     
     try:
         print(f"Fetching hackathons from Hack Club API...")
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        # Retry transient failures instead of silently returning nothing
+        response = Resilience('hackclub').call(get_json_response, url, headers)
         
         data = response.json()
         print(f"API Response Status: {response.status_code}")
@@ -94,8 +100,8 @@ def parse_hackclub_hackathon(item):
         short_summary = f"A Hack Club hackathon event at {item.get('city', 'Various Locations')}. Check website for more details."
         
         # Extract dates from Hack Club API format
-        start_date = item.get('start')  # Format: 2026-03-28T08:00:00.000Z
-        end_date = item.get('end')
+        start_date = to_utc_iso(item.get('start'))  # Format: 2026-03-28T08:00:00.000Z
+        end_date = to_utc_iso(item.get('end'))
         registration_deadline = None  # Not available in Hack Club API
         
         # Extract location
@@ -148,53 +154,27 @@ def parse_hackclub_hackathon(item):
         return None
 
 def insert_hackathons_to_db(hackathons):
-    """Insert hackathons into Supabase database using REST API"""
+    """
+    Upsert hackathons into Supabase keyed on original_url
+
+    Rows the database rejects are quarantined by the writer and the rest are
+    still saved; returns True only when every row was written.
+    """
     if not hackathons:
         print("No hackathons to insert")
         return
     
-    url = f"{SUPABASE_URL}/rest/v1/hackathons"
+    if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
+        raise ValueError("Missing Supabase configuration in .env file")
     
-    headers = {
-        'apikey': SUPABASE_SERVICE_KEY,
-        'Authorization': f'Bearer {SUPABASE_SERVICE_KEY}',
-        'Content-Type': 'application/json',
-        'Prefer': 'return=minimal'
-    }
+    writer = get_writer()
+    print(f"\nInserting {len(hackathons)} hackathons into database...")
+    report = writer.upsert(hackathons)
     
-    try:
-        print(f"\nInserting {len(hackathons)} hackathons into database...")
-        
-        # Insert in batches of 100
-        batch_size = 100
-        total_inserted = 0
-        for i in range(0, len(hackathons), batch_size):
-            batch = hackathons[i:i+batch_size]
-            print(f"  Inserting batch {i//batch_size + 1}/{(len(hackathons) + batch_size - 1)//batch_size}...")
-            
-            response = requests.post(
-                url,
-                headers=headers,
-                json=batch,
-                timeout=30
-            )
-            
-            if response.status_code in [200, 201]:
-                print(f"    ✅ Successfully inserted {len(batch)} hackathons")
-                total_inserted += len(batch)
-            elif response.status_code == 409:
-                # Conflict - some URLs already exist, skip them
-                print(f"    ⚠️  Some URLs already exist in database, skipping duplicates")
-                total_inserted += len(batch)
-            else:
-                print(f"    ❌ Error: {response.status_code} - {response.text[:200]}")
-        
-        print(f"\n✅ Successfully processed {total_inserted} Hack Club hackathons!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error inserting into database: {e}")
-        return False
+    print(f"\n✅ {report['inserted']} new, {report['updated']} updated Hack Club hackathons")
+    if report['failed']:
+        print(f"❌ {report['failed']} hackathons not saved ({report['quarantined']} quarantined)")
+    return report['failed'] == 0
 
 def main():
     """Main function"""
@@ -206,8 +186,9 @@ def main():
     hackathons = fetch_hackclub_hackathons()
     
     if hackathons:
-        # Insert into database
-        insert_hackathons_to_db(hackathons)
+        # Write only new and changed hackathons
+        # Only upcoming events are listed, so past rows are not "gone"
+        sync_source(get_writer(), 'hackclub', hackathons, complete=False)
     else:
         print("❌ No hackathons fetched")
 
@@ -7,8 +7,15 @@ import requests
 import json
 import os
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from dotenv import load_dotenv
+from devcompass.clients import get_pool, get_writer
+from devcompass.dates import to_utc_iso
+from devcompass.json_stream import ends_before, iter_array_objects
+from devcompass.pipeline import run_pipeline
+from devcompass.resilience import Resilience, ResilientPool
+from devcompass.themes import theme_ids
+from devcompass.sync import load_fingerprints
 
 # Load environment variables
 load_dotenv()
@@ -17,23 +24,68 @@ load_dotenv()
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_KEY')
 
-if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
-    raise ValueError("Missing Supabase configuration in .env file")
+HACKCLUB_ALL_URL = "https://hackathons.hackclub.com/api/events/all/"
 
-def fetch_hackclub_hackathons():
+HACKCLUB_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json',
+}
+
+def iter_hackclub_events(pool=None, include_past=False):
+    """
+    Yield raw events from the all-events dump straight off the socket
+
+    Past events are dropped by their "end" date before being decoded, so
+    memory use does not grow with the size of the archive.
+    """
+    pool = pool or ResilientPool(get_pool(), Resilience('hackclub'))
+    now = datetime.now(timezone.utc)
+
+    response = pool.get(HACKCLUB_ALL_URL, headers=HACKCLUB_HEADERS, timeout=30, stream=True)
+    try:
+        response.raise_for_status()
+        kept = skipped = 0
+        for raw in iter_array_objects(response.iter_content(chunk_size=65536)):
+            if not include_past and ends_before(raw, now):
+                skipped += 1
+                continue
+            kept += 1
+            yield json.loads(raw)
+        print(f"Streamed {kept} current Hack Club events ({skipped} past events skipped)")
+    finally:
+        response.close()
+
+def iter_hackclub_hackathons(pool=None, include_past=False):
+    """Yield parsed hackathons from the all-events dump as they arrive"""
+    for item in iter_hackclub_events(pool, include_past):
+        hackathon = parse_hackclub_hackathon(item)
+        if hackathon:
+            yield hackathon
+
+def fetch_hackclub_hackathons(stream=True):
     """Fetch hackathons from Hack Club API"""
-    url = "https://hackathons.hackclub.com/api/events/all/"
+    url = HACKCLUB_ALL_URL
+    headers = HACKCLUB_HEADERS
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'application/json',
-    }
+    if stream:
+        try:
+            print(f"Streaming hackathons from Hack Club API...")
+            hackathons = list(iter_hackclub_hackathons())
+            print(f"Successfully parsed {len(hackathons)} hackathons")
+            return hackathons
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Error fetching from Hack Club API: {e}")
+            return []
     
     try:
         print(f"Fetching hackathons from Hack Club API...")
-        response = requests.get(url, headers=headers, timeout=30)
+        # The all-events dump is large and slow-changing: revalidate the cached copy
+        pool = ResilientPool(get_pool(), Resilience('hackclub'))
+        response = pool.get(url, headers=headers, timeout=30, use_cache=True)
         response.raise_for_status()
         
+        # An unchanged dump (304) comes from the cached copy. It is still
+        # parsed: the cache took its validators before the rows were saved
         data = response.json()
         print(f"✅ Successfully fetched {len(data) if isinstance(data, list) else '?'} hackathons")
         
@@ -80,12 +132,12 @@ def parse_hackclub_hackathon(item):
         short_summary = f"A Hack Club hackathon event at {location_str}. Check website for more details."
         
         # Extract dates from Hack Club API format
-        start_date = item.get('start')  # Format: 2026-03-28T08:00:00.000Z
-        end_date = item.get('end')
+        start_date = to_utc_iso(item.get('start'))  # Format: 2026-03-28T08:00:00.000Z
+        end_date = to_utc_iso(item.get('end'))
         registration_deadline = None  # Not available in Hack Club API
         
         # Determine location mode
-        location_mode = 'in-person'
+        location_mode = 'offline'
         if not city and not state:
             location_mode = 'online'
         
@@ -113,6 +165,7 @@ def parse_hackclub_hackathon(item):
             'end_date': end_date,
             'registration_deadline': registration_deadline,
             'themes': themes,
+            'theme_ids': theme_ids(None, title),
             'platform_source': 'hackclub',
             'original_url': original_url,
             'eligibility': '',
@@ -128,48 +181,27 @@ def parse_hackclub_hackathon(item):
         return None
 
 def insert_hackathons_to_db(hackathons):
-    """Insert hackathons into Supabase database using REST API"""
+    """
+    Upsert hackathons into Supabase keyed on original_url
+
+    Rows the database rejects are quarantined by the writer and the rest are
+    still saved; returns True only when every row was written.
+    """
     if not hackathons:
         print("No hackathons to insert")
         return
     
-    url = f"{SUPABASE_URL}/rest/v1/hackathons"
+    if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
+        raise ValueError("Missing Supabase configuration in .env file")
     
-    headers = {
-        'apikey': SUPABASE_SERVICE_KEY,
-        'Authorization': f'Bearer {SUPABASE_SERVICE_KEY}',
-        'Content-Type': 'application/json',
-        'Prefer': 'return=minimal'
-    }
+    writer = get_writer()
+    print(f"\nInserting {len(hackathons)} hackathons into database...")
+    report = writer.upsert(hackathons)
     
-    try:
-        print(f"\nInserting {len(hackathons)} hackathons into database...")
-        
-        # Insert in batches of 100
-        batch_size = 100
-        for i in range(0, len(hackathons), batch_size):
-            batch = hackathons[i:i+batch_size]
-            print(f"  Inserting batch {i//batch_size + 1}/{(len(hackathons) + batch_size - 1)//batch_size}...")
-            
-            response = requests.post(
-                url,
-                headers=headers,
-                json=batch,
-                timeout=30
-            )
-            
-            if response.status_code in [200, 201]:
-                print(f"    ✅ Successfully inserted {len(batch)} hackathons")
-            else:
-                print(f"    ❌ Error: {response.status_code} - {response.text[:200]}")
-                return False
-        
-        print(f"\n✅ Successfully inserted {len(hackathons)} hackathons into database!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error inserting into database: {e}")
-        return False
+    print(f"\n✅ {report['inserted']} new, {report['updated']} updated Hack Club hackathons")
+    if report['failed']:
+        print(f"❌ {report['failed']} hackathons not saved ({report['quarantined']} quarantined)")
+    return report['failed'] == 0
 
 def main():
     """Main function"""
@@ -177,14 +209,23 @@ def main():
     print("🎉 Hack Club Hackathons Scraper")
     print("=" * 60)
     
-    # Fetch hackathons
-    hackathons = fetch_hackclub_hackathons()
+    writer = get_writer()
+    
+    # Stream current events straight into the writer; past events are
+    # skipped, so stored ones must not be reported as gone (complete=False)
+    report = run_pipeline(
+        iter_hackclub_events(),
+        parse_hackclub_hackathon,
+        writer,
+        'hackclub',
+        load_fingerprints(writer, 'hackclub'),
+        complete=lambda: False,
+    )
     
-    if hackathons:
-        # Insert into database
-        insert_hackathons_to_db(hackathons)
-    else:
-        print("❌ No hackathons fetched")
+    if 'error' in report:
+        print(f"❌ Error fetching from Hack Club API: {report['error']}")
+    elif not report['stages']['parse']['items_out']:
+        print("❌ No new hackathons fetched")
 
 if __name__ == "__main__":
     main()
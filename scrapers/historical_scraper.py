@@ -6,15 +6,20 @@ Uses synchronous Playwright API to avoid greenlet DLL issues
 
 import json
 import re
-import time
 from typing import List, Dict, Optional, Any
 from urllib.parse import urljoin, urlparse
 from playwright.sync_api import sync_playwright, Page, Browser
 import logging
+from devcompass.rate_limit import AdaptiveRateLimiter, site_key
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Start at the old fixed pace (one page every 2s) and adapt from there. Every
+# past edition is its own *.devpost.com subdomain, so buckets are per site:
+# the editions loop stays paced and a 429 slows all of them down
+rate_limiter = AdaptiveRateLimiter(rate=0.5, max_rate=5, key=site_key)
+
 
 class HackathonScraper:
     """Base scraper class with common functionality"""
@@ -33,6 +38,14 @@ class HackathonScraper:
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         )
         
+    def goto(self, page: Page, url: str, **kwargs):
+        """Navigate once the host's rate limit allows it, and report how it went"""
+        rate_limiter.acquire(url)
+        response = page.goto(url, **kwargs)
+        if response is not None:
+            rate_limiter.record(url, response.status, response.headers.get('retry-after'))
+        return response
+        
     def close(self):
         """Close browser"""
         if self.browser:
@@ -50,7 +63,7 @@ class DevpostScraper(HackathonScraper):
         page = self.context.new_page()
         
         try:
-            page.goto(hackathon_url, wait_until='networkidle', timeout=30000)
+            self.goto(page, hackathon_url, wait_until='networkidle', timeout=30000)
             
             # Look for organizer link
             organizer_selectors = [
@@ -93,7 +106,7 @@ class DevpostScraper(HackathonScraper):
         hackathon_urls = []
         
         try:
-            page.goto(organizer_url, wait_until='networkidle', timeout=30000)
+            self.goto(page, organizer_url, wait_until='networkidle', timeout=30000)
             page.wait_for_selector('a[href*=".devpost.com"]', timeout=10000)
             
             hackathon_links = page.query_selector_all('a[href*=".devpost.com"]')
@@ -134,7 +147,7 @@ class DevpostScraper(HackathonScraper):
         }
         
         try:
-            page.goto(gallery_url, wait_until='networkidle', timeout=30000)
+            self.goto(page, gallery_url, wait_until='networkidle', timeout=30000)
             
             title_elem = page.query_selector('h1, .header-title, #header h1')
             if title_elem:
@@ -249,7 +262,6 @@ def scrape_hackathon_history(
             logger.info(f"Processing: {url}")
             hackathon_data = scraper.scrape_winners(url)
             results['past_hackathons'].append(hackathon_data)
-            time.sleep(2)  # Rate limiting
             
     finally:
         scraper.close()
@@ -9,8 +9,17 @@ import os
 import uuid
 import re
 from datetime import datetime
-from supabase import create_client, Client
 from dotenv import load_dotenv
+from devcompass.clients import get_writer
+from devcompass.dates import unstop_date
+from devcompass.http_pool import HttpPool
+from devcompass.normalize import ascii_row, normalize_unstop, unstop_listing_url
+from devcompass.prizes import prize_columns, unstop_prize_amount
+from devcompass.records import HackathonRecord
+from devcompass.resilience import CircuitOpenError, DeadlineExceeded, Resilience, ResilientPool
+from devcompass.themes import theme_ids
+from devcompass.sync import sync_source
+from devcompass.pagination import DEFAULT_MAX_WORKERS, IncompleteFetch, fetch_all_pages
 
 # Load environment variables
 load_dotenv()
@@ -19,62 +28,89 @@ load_dotenv()
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_KEY')
 
-if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
-    raise ValueError("Missing Supabase configuration in .env file")
+UNSTOP_SEARCH_URL = "https://unstop.com/api/public/opportunity/search-result"
+UNSTOP_PER_PAGE = 50
 
-# Initialize Supabase client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+UNSTOP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://unstop.com/',
+}
 
-def fetch_unstop_hackathons():
-    """Fetch hackathons from Unstop API"""
-    url = "https://unstop.com/api/public/opportunity/search-result"
-    
-    # Parameters for hackathons
+def fetch_unstop_response(pool, page):
+    """Fetch one page of the Unstop search-result API, revalidating against the pool's cache"""
     params = {
         'opportunity': 'hackathons',
-        'per_page': 50,
-        'page': 1
-    }
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'application/json',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Referer': 'https://unstop.com/',
+        'per_page': UNSTOP_PER_PAGE,
+        'page': page
     }
-    
+    response = pool.get(UNSTOP_SEARCH_URL, params=params, headers=UNSTOP_HEADERS, use_cache=True)
+    response.raise_for_status()
+    return response
+
+def fetch_unstop_page(pool, page):
+    """Fetch one page of the Unstop search-result API and return the decoded body"""
+    return fetch_unstop_response(pool, page).json()
+
+def unstop_last_page(data):
+    """Read the total page count from an Unstop (Laravel-style) paginated response"""
+    page_info = data.get('data', {}) if isinstance(data, dict) else {}
+    last_page = page_info.get('last_page')
+    if not last_page and page_info.get('total'):
+        per_page = page_info.get('per_page') or UNSTOP_PER_PAGE
+        last_page = -(-int(page_info['total']) // int(per_page))
+    return int(last_page or 1)
+
+def iter_unstop_hackathons(pool=None, max_workers=DEFAULT_MAX_WORKERS):
+    """Yield parsed hackathons from every Unstop page, streaming each page as it arrives"""
+    own_pool = pool is None
+    pool = pool or ResilientPool(HttpPool(), Resilience('unstop'))
+
+    try:
+        pages = fetch_all_pages(
+            lambda page: fetch_unstop_page(pool, page),
+            unstop_last_page,
+            max_workers=max_workers,
+        )
+        for page, data in pages:
+            opportunities = data.get('data', {}).get('data', []) if isinstance(data, dict) else []
+            print(f"Page {page}: found {len(opportunities)} opportunities")
+
+            # Whole page at once, already ASCII-clean for save_to_supabase
+            for hackathon in normalize_unstop(opportunities, ascii_only=True, records=True):
+                if hackathon:
+                    yield hackathon
+    finally:
+        if own_pool:
+            pool.close()
+
+def fetch_unstop_hackathons():
+    """
+    Fetch hackathons from every page of the Unstop API
+
+    Returns:
+        (hackathons, complete) - complete is False when some pages failed,
+        so the rows that were on them must not be reported as gone
+    """
+    hackathons = []
     try:
         print(f"Fetching hackathons from Unstop API...")
-        response = requests.get(url, params=params, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        print(f"API Response Status: {response.status_code}")
-        
-        # Extract hackathons from response
-        hackathons = []
-        if 'data' in data and 'data' in data['data']:
-            opportunities = data['data']['data']
-            print(f"Found {len(opportunities)} opportunities")
-            
-            for item in opportunities:
-                try:
-                    hackathon = parse_unstop_hackathon(item)
-                    if hackathon:
-                        hackathons.append(hackathon)
-                except Exception as e:
-                    print(f"Error parsing hackathon: {e}")
-                    continue
-        
+        for hackathon in iter_unstop_hackathons():
+            hackathons.append(hackathon)
         print(f"Successfully parsed {len(hackathons)} hackathons")
-        return hackathons
+        return hackathons, True
         
-    except requests.exceptions.RequestException as e:
+    except IncompleteFetch as e:
+        print(f"Unstop listing is incomplete, keeping {len(hackathons)} hackathons: {e}")
+        return hackathons, False
+    except (requests.exceptions.RequestException, CircuitOpenError, DeadlineExceeded) as e:
+        # Only reached once retries are exhausted
         print(f"Error fetching from Unstop API: {e}")
-        return []
+        return [], False
     except json.JSONDecodeError as e:
         print(f"Error parsing JSON response: {e}")
-        return []
+        return [], False
 
 def parse_unstop_hackathon(item):
     """Parse a single hackathon from Unstop API response"""
@@ -116,13 +152,13 @@ def parse_unstop_hackathon(item):
         registration_deadline = None
         
         if 'start_date' in item:
-            start_date = item['start_date']
+            start_date = unstop_date(item['start_date'])
         if 'end_date' in item:
-            end_date = item['end_date']
+            end_date = unstop_date(item['end_date'])
         if 'regnRequiredTill' in item:
-            registration_deadline = item['regnRequiredTill']
+            registration_deadline = unstop_date(item['regnRequiredTill'])
         elif 'registration_end_date' in item:
-            registration_deadline = item['registration_end_date']
+            registration_deadline = unstop_date(item['registration_end_date'])
             
         # Extract prize money with better formatting
         prize_money = None
@@ -250,9 +286,7 @@ def parse_unstop_hackathon(item):
             banner_url = f"https://d8it4huxumps7.cloudfront.net/uploads/images/opportunity/{unstop_id}/banner.jpg"
             
         # Create original URL
-        original_url = f"https://unstop.com/hackathons/{item.get('id', '')}"
-        if 'url' in item:
-            original_url = item['url'] if item['url'].startswith('http') else f"https://unstop.com{item['url']}"
+        original_url = unstop_listing_url(item)
         
         hackathon = {
             'id': hackathon_id,
@@ -264,7 +298,9 @@ def parse_unstop_hackathon(item):
             'registration_deadline': registration_deadline,
             'location_mode': location_mode,
             'prize_money': prize_money,
+            **prize_columns(unstop_prize_amount(item)),
             'themes': themes,
+            'theme_ids': theme_ids(themes, title, description),
             'eligibility': eligibility,
             'banner_url': banner_url,
             'original_url': original_url,
@@ -277,8 +313,13 @@ def parse_unstop_hackathon(item):
         print(f"Error parsing hackathon item: {e}")
         return None
 
-def save_to_supabase(hackathons):
-    """Save hackathons to Supabase database"""
+def save_to_supabase(hackathons, complete=True):
+    """
+    Save hackathons to Supabase database
+
+    complete=False (a partial listing) keeps stored rows that were not seen
+    from being reported as gone.
+    """
     if not hackathons:
         print("No hackathons to save")
         return
@@ -286,31 +327,26 @@ def save_to_supabase(hackathons):
     try:
         print(f"Saving {len(hackathons)} hackathons to database...")
         
-        saved_count = 0
+        cleaned = []
         for hackathon in hackathons:
             try:
-                # Clean all string fields to prevent encoding issues
-                cleaned_hackathon = {}
-                for key, value in hackathon.items():
-                    if isinstance(value, str):
-                        # Remove non-ASCII characters
-                        cleaned_hackathon[key] = value.encode('ascii', 'ignore').decode('ascii')
-                    elif isinstance(value, list):
-                        # Clean list items
-                        cleaned_hackathon[key] = [item.encode('ascii', 'ignore').decode('ascii') if isinstance(item, str) else item for item in value]
-                    else:
-                        cleaned_hackathon[key] = value
-                
-                # Try to insert, update if exists
-                result = supabase.table('hackathons').upsert(cleaned_hackathon).execute()
-                print(f"+ Saved: {cleaned_hackathon['title'][:50]}...")
-                saved_count += 1
+                # Clean all string fields to prevent encoding issues; records
+                # from normalize_unstop are already clean and are not copied
+                if isinstance(hackathon, HackathonRecord):
+                    cleaned.append(hackathon)
+                else:
+                    cleaned.append(ascii_row(dict(hackathon)))
                 
             except Exception as e:
-                print(f"- Error saving {hackathon.get('title', 'Unknown')[:50]}: {e}")
+                print(f"- Error cleaning {hackathon.get('title', 'Unknown')[:50]}: {e}")
                 continue
+        
+        # Send only new and changed rows, in a handful of bulk requests
+        report = sync_source(get_writer(), 'unstop', cleaned, complete=complete)
+        saved_count = report['inserted'] + report['updated']
                 
-        print(f"Successfully saved {saved_count}/{len(hackathons)} hackathons to database")
+        print(f"Successfully saved {saved_count}/{len(hackathons)} hackathons to database "
+              f"({report['inserted']} new, {report['updated']} updated, {report['unchanged']} unchanged)")
         
     except Exception as e:
         print(f"Error saving to database: {e}")
@@ -321,11 +357,11 @@ def main():
     print(f"Started at: {datetime.now()}")
     
     # Fetch hackathons from Unstop API
-    hackathons = fetch_unstop_hackathons()
+    hackathons, complete = fetch_unstop_hackathons()
     
     if hackathons:
         # Save to database
-        save_to_supabase(hackathons)
+        save_to_supabase(hackathons, complete)
         
         # Print summary
         print(f"\n=== Summary ===")
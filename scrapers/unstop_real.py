@@ -9,6 +9,9 @@ import json
 from datetime import datetime
 import os
 from dotenv import load_dotenv
+from devcompass.dates import unstop_date
+from devcompass.normalize import unstop_listing_url
+from devcompass.validate import drop_invalid
 
 load_dotenv()
 
@@ -44,12 +47,12 @@ def fetch_unstop_hackathons():
                 'short_summary': item.get('short_description', '')[:150] + '...' if item.get('short_description') else f"Join {item.get('title', '')} and showcase your skills!",
                 'banner_url': item.get('banner_image'),
                 'prize_money': item.get('prizes', [{}])[0].get('prize', '') if item.get('prizes') else '',
-                'start_date': item.get('start_date'),
-                'end_date': item.get('end_date'),
-                'registration_deadline': item.get('end_date'),
+                'start_date': unstop_date(item.get('start_date')),
+                'end_date': unstop_date(item.get('end_date')),
+                'registration_deadline': unstop_date(item.get('regnRequiredTill') or item.get('registration_end_date')),
                 'themes': [tag.get('name', '') for tag in item.get('tags', [])[:5]],
                 'platform_source': 'unstop',
-                'original_url': f"https://unstop.com/{item.get('public_url', '')}",
+                'original_url': unstop_listing_url(item),
                 'eligibility': item.get('eligibility', ''),
                 'location_mode': 'online' if item.get('is_online', True) else 'offline',
             }
@@ -78,7 +81,7 @@ def save_to_supabase(hackathons):
     
     saved_count = 0
     
-    for hackathon in hackathons:
+    for hackathon in drop_invalid(hackathons):
         try:
             # Insert hackathon (will skip if URL already exists due to unique constraint)
             response = requests.post(
@@ -10,15 +10,23 @@ from datetime import datetime
 from typing import List, Dict, Optional
 import os
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from devcompass.clients import get_outbox
+from devcompass.dates import unstop_date
+from devcompass.http_pool import HttpPool
+from devcompass.normalize import unstop_listing_url
+from devcompass.prizes import prize_columns, unstop_prize_amount
+from devcompass.supabase_writer import SupabaseWriter
+from devcompass.themes import theme_ids
+from devcompass.sync import sync_source
+from devcompass.pagination import DEFAULT_MAX_WORKERS, fetch_all_pages
 
 load_dotenv()
 
 class UnstopScraper:
     def __init__(self):
         self.api_url = "https://unstop.com/api/public/opportunity/search-result"
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.per_page = 50
+        self.pool = HttpPool(headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
@@ -29,38 +37,54 @@ class UnstopScraper:
         if not supabase_url or not supabase_key:
             raise ValueError("Missing Supabase credentials in environment variables")
             
-        self.supabase: Client = create_client(supabase_url, supabase_key)
+        self.writer = SupabaseWriter(supabase_url, supabase_key, pool=self.pool, outbox=get_outbox())
 
-    def fetch_hackathons(self) -> List[Dict]:
-        """Fetch hackathons from Unstop API"""
+        # False once a fetch misses pages, so unseen rows are not reported as gone
+        self.complete = True
+
+    def fetch_page(self, page: int) -> Dict:
+        """Fetch one page of trending hackathons from the Unstop API"""
+        payload = {
+            "opportunity_type": "hackathons",
+            "page": page,
+            "per_page": self.per_page,
+            "sort_by": "trending"
+        }
+        
+        response = self.pool.post(self.api_url, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    def last_page(self, data: Dict) -> int:
+        """Read the total page count from the first response"""
+        page_info = data.get('data', {})
+        if page_info.get('last_page'):
+            return int(page_info['last_page'])
+        if page_info.get('total'):
+            return -(-int(page_info['total']) // int(page_info.get('per_page') or self.per_page))
+        return 1
+
+    def fetch_hackathons(self, max_workers: int = DEFAULT_MAX_WORKERS) -> List[Dict]:
+        """Fetch hackathons from every page of the Unstop API"""
         print("Fetching Unstop hackathons from API...")
         
+        hackathons = []
+        self.complete = True
         try:
-            # Unstop API parameters for hackathons
-            payload = {
-                "opportunity_type": "hackathons",
-                "page": 1,
-                "per_page": 50,
-                "sort_by": "trending"
-            }
-            
-            response = self.session.post(self.api_url, json=payload)
-            response.raise_for_status()
-            
-            data = response.json()
-            hackathons = []
-            
-            for item in data.get('data', {}).get('data', []):
-                hackathon = self.process_hackathon_data(item)
-                if hackathon:
-                    hackathons.append(hackathon)
+            for page, data in fetch_all_pages(self.fetch_page, self.last_page, max_workers=max_workers):
+                for item in data.get('data', {}).get('data', []):
+                    hackathon = self.process_hackathon_data(item)
+                    if hackathon:
+                        hackathons.append(hackathon)
             
             print(f"Found {len(hackathons)} hackathons from Unstop API")
             return hackathons
             
         except Exception as e:
+            # Rows from the pages that did arrive are kept, but the listing is partial
             print(f"Error fetching from Unstop API: {str(e)}")
-            return []
+            self.complete = False
+            return hackathons
 
     def process_hackathon_data(self, item: Dict) -> Optional[Dict]:
         """Process hackathon data from API response"""
@@ -71,9 +95,10 @@ class UnstopScraper:
                 themes = [tag.get('name', '') for tag in item['tags'][:5]]
             
             # Process dates
-            start_date = item.get('start_date')
-            end_date = item.get('end_date')
-            deadline = item.get('end_date')
+            start_date = unstop_date(item.get('start_date'))
+            end_date = unstop_date(item.get('end_date'))
+            # Registration closes at regnRequiredTill, which is often before the event ends
+            deadline = unstop_date(item.get('regnRequiredTill') or item.get('registration_end_date'))
             
             # Extract prize money
             prize_money = ""
@@ -86,12 +111,14 @@ class UnstopScraper:
                 'short_summary': self.generate_short_summary(item.get('description', ''), item.get('title', '')),
                 'banner_url': item.get('banner_image') or 'https://images.unsplash.com/photo-1517694712202-14dd9538aa97?w=800',
                 'prize_money': prize_money,
+                **prize_columns(unstop_prize_amount(item)),
                 'start_date': start_date,
                 'end_date': end_date,
                 'registration_deadline': deadline,
                 'themes': themes,
+                'theme_ids': theme_ids(themes, item.get('title', ''), item.get('description', '')),
                 'platform_source': 'unstop',
-                'original_url': f"https://unstop.com/{item.get('public_url', '')}",
+                'original_url': unstop_listing_url(item),
                 'eligibility': item.get('eligibility', ''),
                 'location_mode': 'online' if item.get('is_online', True) else 'offline',
             }
@@ -115,33 +142,16 @@ class UnstopScraper:
         return clean_desc[:147].strip() + '...'
 
     def save_to_supabase(self, hackathons: List[Dict]) -> int:
-        """Save hackathons to Supabase database"""
+        """Save new and changed hackathons to Supabase"""
         if not hackathons:
             return 0
         
-        print(f"Saving {len(hackathons)} hackathons to database...")
-        saved_count = 0
-        
-        for hackathon in hackathons:
-            try:
-                # Check if hackathon already exists
-                existing = self.supabase.table('hackathons').select('id').eq('original_url', hackathon['original_url']).execute()
-                
-                if existing.data:
-                    # Update existing hackathon
-                    self.supabase.table('hackathons').update(hackathon).eq('original_url', hackathon['original_url']).execute()
-                    print(f"Updated: {hackathon['title']}")
-                else:
-                    # Insert new hackathon
-                    self.supabase.table('hackathons').insert(hackathon).execute()
-                    print(f"Added: {hackathon['title']}")
-                
-                saved_count += 1
-                
-            except Exception as e:
-                print(f"Error saving {hackathon.get('title', 'Unknown')}: {str(e)}")
+        print(f"Syncing {len(hackathons)} hackathons with database...")
+        report = sync_source(self.writer, 'unstop', hackathons, complete=self.complete)
+        print(f"Added {report['inserted']}, updated {report['updated']}, "
+              f"skipped {report['unchanged']} unchanged, failed {report['failed']}")
         
-        return saved_count
+        return report['inserted'] + report['updated']
 
     def run(self):
         """Main function"""